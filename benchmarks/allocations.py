@@ -0,0 +1,80 @@
+"""Memory allocated by the navigation hot path, measured with tracemalloc.
+
+For every navigation, the peak of memory traced above the level before it is taken as the bytes allocated
+by that navigation (the page definitions don't allocate anything, so it's the navigator's own overhead).
+Static routes, typed path parameters and URL query parameters are measured on both navigators.
+
+Run from the repository root: `python benchmarks/allocations.py`."""
+
+from sys import path
+
+from pathlib import Path
+
+from tracemalloc import get_traced_memory, reset_peak, start, stop
+
+path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from flet_navigator import HeadlessPage, PublicFletNavigator, VirtualFletNavigator
+
+
+NAVIGATIONS: int = 2_000
+
+
+def _page(_) -> None: ...
+
+
+ROUTES: dict[str, object] = {'/': _page, 'feed': _page, 'settings': _page, 'user/<id:int>': _page}
+
+
+def _targets(kind: str) -> list[tuple[str, dict[str, object]]]:
+    if kind == 'static':
+        return [('feed' if index % 2 else 'settings', {}) for index in range(NAVIGATIONS)]
+
+    if kind == 'path parameters':
+        return [(f'user/{index % 8}', {}) for index in range(NAVIGATIONS)]
+
+    return [('feed', {'tab': index % 8}) for index in range(NAVIGATIONS)]
+
+
+def bench_allocations(virtual: bool, kind: str) -> float:
+    page = HeadlessPage()
+
+    navigator = VirtualFletNavigator(ROUTES) if virtual else PublicFletNavigator(page, ROUTES)
+
+    navigator.history_limit = 16
+
+    navigator.process(page)
+
+    targets = _targets(kind)
+
+    # Warm the module-level caches (URL parsing, interned routes) and fill the bounded history.
+    for route, parameters in targets[:64]:
+        navigator.navigate(route, page) if virtual else navigator.navigate(route, page, parameters=parameters)
+
+    allocated = 0
+
+    start()
+
+    for route, parameters in targets:
+        reset_peak()
+
+        before = get_traced_memory()[0]
+
+        navigator.navigate(route, page) if virtual else navigator.navigate(route, page, parameters=parameters)
+
+        allocated += get_traced_memory()[1] - before
+
+    stop()
+
+    return allocated / len(targets)
+
+
+if __name__ == '__main__':
+    print(f'{"navigator":>10} {"routes":>16} {"bytes per navigation":>21}')
+
+    for virtual in (True, False):
+        for kind in ('static', 'path parameters', 'query parameters'):
+            if virtual and kind == 'query parameters':
+                continue
+
+            print(f'{"virtual" if virtual else "public":>10} {kind:>16} {bench_allocations(virtual, kind):>21.0f}')
@@ -0,0 +1,96 @@
+"""Cold start of a 500-page app, with and without a route manifest.
+
+Generates a temporary pages package, then measures (in fresh interpreters) the time from importing
+the application to the first rendered page, registering routes either by importing every page module
+or from a route manifest. Run from the repository root: `python benchmarks/cold_start.py`."""
+
+from sys import executable, path
+
+from os import environ
+
+from pathlib import Path
+
+from subprocess import run
+
+from tempfile import TemporaryDirectory
+
+from textwrap import dedent
+
+path.insert(0, str(REPOSITORY := Path(__file__).resolve().parent.parent))
+
+from flet_navigator import write_route_manifest
+
+
+PAGE_COUNT: int = 500
+
+RUNS: int = 5
+
+PAGE_MODULE: str = dedent("""
+    from flet import Column, Text, FilledButton
+
+    from flet_navigator import RouteContext, route
+
+
+    @route('{route}')
+    def page_{index}(ctx: RouteContext) -> None:
+        ctx.spec_cpage_props(title='Page {index}')
+
+        ctx.add(Column([Text('Page {index}'), FilledButton('Home', on_click=lambda _: ctx.navigate_homepage())]))
+""")
+
+EAGER_APP: str = dedent("""
+    from time import perf_counter
+
+    from importlib import import_module
+
+    from flet_navigator import HeadlessPage, fn_process
+
+    started = perf_counter()
+
+    for index in range({page_count}):
+        import_module(f'pages.page_{{index}}')
+
+    fn_process()(HeadlessPage())
+
+    print(perf_counter() - started)
+""")
+
+MANIFEST_APP: str = dedent("""
+    from time import perf_counter
+
+    from flet_navigator import HeadlessPage, fn_process
+
+    started = perf_counter()
+
+    fn_process(manifest='routes.json')(HeadlessPage())
+
+    print(perf_counter() - started)
+""")
+
+
+def _measure(app: str, directory: Path) -> float:
+    environment = {**environ, 'PYTHONPATH': f'{directory}:{REPOSITORY}', 'PYTHONDONTWRITEBYTECODE': '1'}
+
+    timings = [float(run([executable, '-c', app], cwd=directory, env=environment, capture_output=True, text=True, check=True).stdout) for _ in range(RUNS)]
+
+    return min(timings)
+
+
+if __name__ == '__main__':
+    with TemporaryDirectory() as directory:
+        directory = Path(directory)
+
+        (pages := directory / 'pages').mkdir()
+
+        (pages / '__init__.py').write_text('')
+
+        for index in range(PAGE_COUNT):
+            (pages / f'page_{index}.py').write_text(PAGE_MODULE.format(route='/' if index == 0 else f'page_{index}', index=index))
+
+        write_route_manifest(str(pages), str(directory / 'routes.json'), str(directory))
+
+        eager = _measure(EAGER_APP.format(page_count=PAGE_COUNT), directory)
+
+        manifest = _measure(MANIFEST_APP, directory)
+
+        print(f'{PAGE_COUNT} pages, time to first page: {eager * 1000:.1f} ms without manifest, {manifest * 1000:.1f} ms with manifest')
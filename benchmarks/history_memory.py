@@ -0,0 +1,56 @@
+"""Per-session navigation history memory after 100k navigations.
+
+Run from the repository root: `python benchmarks/history_memory.py`."""
+
+from sys import path
+
+from pathlib import Path
+
+from tracemalloc import get_traced_memory, start, stop
+
+path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from flet_navigator import HeadlessPage, PublicFletNavigator
+
+
+NAVIGATIONS: int = 100_000
+
+HISTORY_LIMITS: tuple[int, ...] = (64, 256, 1_024, None)
+
+
+def _page(_) -> None: ...
+
+
+def _navigate(navigator: PublicFletNavigator, page: HeadlessPage, navigations: int) -> None:
+    for index in range(navigations):
+        navigator.navigate(f'page{index % 50}', page, parameters={'item': index % 7} if index % 3 else {})
+
+
+def bench_history_memory(history_limit: int, navigations: int=NAVIGATIONS) -> int:
+    page = HeadlessPage()
+
+    routes = {'/': _page, **{f'page{index}': _page for index in range(50)}}
+
+    # Warm the module-level caches (URL parsing, interned routes) so only the session itself is traced.
+    _navigate(PublicFletNavigator(page, routes), page, 1_000)
+
+    start()
+
+    navigator = PublicFletNavigator(page, routes)
+
+    navigator.history_limit = history_limit
+
+    _navigate(navigator, page, navigations)
+
+    session_size = get_traced_memory()[0]
+
+    stop()
+
+    return session_size
+
+
+if __name__ == '__main__':
+    print(f'{"history limit":>14} {"history bytes per session":>26}')
+
+    for history_limit in HISTORY_LIMITS:
+        print(f'{str(history_limit):>14} {bench_history_memory(history_limit) - bench_history_memory(history_limit, 0):>26}')
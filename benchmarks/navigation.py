@@ -0,0 +1,114 @@
+"""Navigation throughput benchmark suite, runnable without a Flet client.
+
+Measures navigations per second (against route count and history depth), URL parsing cost
+for parameterized routes and memory per navigator. Results are printed as JSON lines tagged
+with the Flet Navigator version, so runs of different releases can be diffed.
+
+Run from the repository root: `python benchmarks/navigation.py [--quick]`."""
+
+from sys import argv, path
+
+from json import dumps
+
+from pathlib import Path
+
+from time import perf_counter
+
+from tracemalloc import get_traced_memory, start, stop
+
+path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from flet_navigator import FLET_NAVIGATOR_VERSION, HeadlessPage, PublicFletNavigator, VirtualFletNavigator, _fn_parse_route
+
+
+QUICK: bool = '--quick' in argv
+
+ROUTE_COUNTS: tuple[int, ...] = (10, 1_000) if QUICK else (10, 100, 1_000, 10_000)
+
+HISTORY_DEPTHS: tuple[int, ...] = (16, 256) if QUICK else (16, 256, 4_096)
+
+NAVIGATIONS: int = 2_000 if QUICK else 20_000
+
+
+def _page(_) -> None: ...
+
+
+def _routes(route_count: int) -> dict[str, object]:
+    return {'/': _page, **{f'page{index}': _page for index in range(route_count - 1)}}
+
+
+def _report(benchmark: str, **result: object) -> None:
+    print(dumps({'version': FLET_NAVIGATOR_VERSION, 'benchmark': benchmark, **result}))
+
+
+def bench_navigation_throughput(virtual: bool, route_count: int, history_depth: int) -> None:
+    page = HeadlessPage()
+
+    navigator = VirtualFletNavigator(_routes(route_count)) if virtual else PublicFletNavigator(page, _routes(route_count))
+
+    navigator.history_limit = history_depth
+
+    navigator.process(page)
+
+    targets = [f'page{index % (route_count - 1)}' for index in range(NAVIGATIONS)]
+
+    navigation_start = perf_counter()
+
+    for target in targets:
+        navigator.navigate(target, page)
+
+    elapsed = perf_counter() - navigation_start
+
+    _report('navigation_throughput', navigator='virtual' if virtual else 'public', routes=route_count, history_depth=history_depth, navigations_per_second=round(NAVIGATIONS / elapsed))
+
+
+def bench_parameter_parsing() -> None:
+    raw_routes = [f'/page{index}?id={index}&name=user%20{index}&ratio={index}.5&active=True' for index in range(NAVIGATIONS)]
+
+    for cached in (False, True):
+        parse = _fn_parse_route if cached else _fn_parse_route.__wrapped__
+
+        _fn_parse_route.cache_clear()
+
+        # The cached run revisits a small set of routes, as back/forward navigation and repeated deep links do.
+        inputs = [raw_routes[index % 64] for index in range(NAVIGATIONS)] if cached else raw_routes
+
+        parse_start = perf_counter()
+
+        for raw_route in inputs:
+            parse(raw_route)
+
+        _report('parameter_parsing', cached=cached, parse_us=round((perf_counter() - parse_start) / len(inputs) * 1e6, 3))
+
+
+def bench_navigator_memory(route_count: int) -> None:
+    routes = _routes(route_count)
+
+    PublicFletNavigator(HeadlessPage(), routes)
+
+    pages = [HeadlessPage() for _ in range(100)]
+
+    start()
+
+    navigators = [PublicFletNavigator(page, routes) for page in pages]
+
+    for navigator, page in zip(navigators, pages):
+        navigator.process(page)
+
+    navigators_size = get_traced_memory()[0]
+
+    stop()
+
+    _report('navigator_memory', routes=route_count, bytes_per_navigator=round(navigators_size / len(navigators)))
+
+
+if __name__ == '__main__':
+    for route_count in ROUTE_COUNTS:
+        for history_depth in HISTORY_DEPTHS:
+            for virtual in (True, False):
+                bench_navigation_throughput(virtual, route_count, history_depth)
+
+    bench_parameter_parsing()
+
+    for route_count in ROUTE_COUNTS:
+        bench_navigator_memory(route_count)
@@ -0,0 +1,49 @@
+"""Route lookup time against the number of registered routes.
+
+Run from the repository root: `python benchmarks/route_lookup.py`."""
+
+from sys import path
+
+from pathlib import Path
+
+from timeit import repeat
+
+path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from flet_navigator import VirtualFletNavigator
+
+
+ROUTE_COUNTS: tuple[int, ...] = (10, 100, 1_000, 10_000)
+
+LOOKUPS: int = 100_000
+
+
+def _page(_) -> None: ...
+
+
+def bench_route_lookup(route_count: int) -> dict[str, float]:
+    routes = {'/': _page}
+
+    for index in range(route_count // 2):
+        routes[f'page{index}'] = _page
+
+        routes[f'section{index}/item/<item_id:int>'] = _page
+
+    navigator = VirtualFletNavigator(routes)
+
+    last = route_count // 2 - 1
+
+    static_time = min(repeat(lambda: navigator.resolve_route(f'page{last}'), number=LOOKUPS, repeat=5))
+
+    typed_time = min(repeat(lambda: navigator.resolve_route(f'section{last}/item/42'), number=LOOKUPS, repeat=5))
+
+    return {'routes': route_count, 'static_ns': static_time / LOOKUPS * 1e9, 'typed_ns': typed_time / LOOKUPS * 1e9}
+
+
+if __name__ == '__main__':
+    print(f'{"routes":>8} {"static (ns)":>12} {"typed (ns)":>12}')
+
+    for route_count in ROUTE_COUNTS:
+        result = bench_route_lookup(route_count)
+
+        print(f'{result["routes"]:>8} {result["static_ns"]:>12.1f} {result["typed_ns"]:>12.1f}')
@@ -0,0 +1,59 @@
+"""Bytes per session and navigator construction time for many concurrent sessions.
+
+Run from the repository root: `python benchmarks/session_memory.py`."""
+
+from sys import path
+
+from pathlib import Path
+
+from time import perf_counter
+
+from tracemalloc import get_traced_memory, start, stop
+
+path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from flet_navigator import HeadlessPage, PublicFletNavigator
+
+
+SESSION_COUNTS: tuple[int, ...] = (1_000, 10_000)
+
+ROUTE_COUNT: int = 200
+
+
+def _page(_) -> None: ...
+
+
+def bench_sessions(session_count: int) -> dict[str, float]:
+    routes = {'/': _page, **{f'page{index}': _page for index in range(ROUTE_COUNT)}}
+
+    pages = [HeadlessPage() for _ in range(session_count)]
+
+    # The first navigator compiles the shared registry; sessions after it only allocate their own state.
+    PublicFletNavigator(HeadlessPage(), routes)
+
+    start()
+
+    construction_start = perf_counter()
+
+    navigators = [PublicFletNavigator(page, routes) for page in pages]
+
+    construction_time = perf_counter() - construction_start
+
+    sessions_size = get_traced_memory()[0]
+
+    stop()
+
+    return {
+        'sessions': session_count,
+        'bytes_per_session': sessions_size / len(navigators),
+        'construction_us': construction_time / len(navigators) * 1e6
+    }
+
+
+if __name__ == '__main__':
+    print(f'{"sessions":>9} {"bytes per session":>18} {"construction (us)":>18}')
+
+    for session_count in SESSION_COUNTS:
+        result = bench_sessions(session_count)
+
+        print(f'{result["sessions"]:>9} {result["bytes_per_session"]:>18.0f} {result["construction_us"]:>18.1f}')
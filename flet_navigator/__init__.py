@@ -1,25 +1,115 @@
 """A minimalist module for navigation in Flet that combines speed and simplicity."""
 
+from collections import Counter, OrderedDict, deque
+
+from collections.abc import Iterator, Mapping
+
+from concurrent.futures import Future, ThreadPoolExecutor
+
+import ast
+
 from importlib import import_module
 
+from json import dumps, loads
+
+from inspect import CORO_CREATED, getcoroutinestate, isawaitable, iscoroutine, iscoroutinefunction
+
 from logging import ERROR, basicConfig, getLogger
 
 from re import compile as re_compile
 
-from urllib.parse import parse_qs, unquote, urlsplit
+from os import walk
+
+from queue import Empty, Full, Queue
+
+from os.path import abspath, join, relpath, splitext
+
+from sys import getsizeof, intern
+
+from threading import Lock, RLock, Thread
+
+from time import monotonic, perf_counter, time_ns
+
+from asyncio import AbstractEventLoop, get_running_loop, new_event_loop, run_coroutine_threadsafe, sleep, wrap_future
+
+from functools import lru_cache
+
+from gc import collect
+
+from enum import Enum
+
+from weakref import ref
 
-from typing import Any, Callable, Optional, Union
+from urllib.parse import unquote
 
-from flet import Control, Page, Text, IconButton
+from types import MappingProxyType, SimpleNamespace
+
+from typing import Any, Awaitable, Callable, Coroutine, NamedTuple, Optional, Union
+
+from flet import Column, Control, Page, Text, IconButton
 
 
 _pre_def_routes: 'Routes' = {}
 
 
+_pre_def_routes_version: int = 0
+
+
+_manifest_routes: dict[str, tuple[str, str]] = {}
+
+
+_shared_route_registries: OrderedDict[tuple, 'RouteRegistry'] = OrderedDict()
+
+
+_recent_route_registries: OrderedDict[int, tuple['Routes', int, 'Routes', 'RouteRegistry']] = OrderedDict()
+
+
+_shared_route_registries_lock = Lock()
+
+
 _global_templates: dict[str, 'TemplateDefinition'] = {}
 
 
-_url_fn_space_chr: str = '<FN31011S>'
+_global_layouts: dict[str, 'LayoutDefinition'] = {}
+
+
+_layout_chains: dict[str, tuple[str, ...]] = {}
+
+
+_route_loaders: dict[str, tuple['LoaderDefinition', float, float]] = {}
+
+
+_loader_executor: Optional[ThreadPoolExecutor] = None
+
+
+_loader_executor_lock = Lock()
+
+
+_global_guards: dict[str, list[tuple['RouteGuard', float]]] = {}
+
+
+_guard_chains: dict[str, tuple[tuple['RouteGuard', float], ...]] = {}
+
+
+_memoized_templates: dict[str, int] = {}
+
+
+_template_versions: dict[str, int] = {}
+
+
+_template_cache_stats: dict[str, list[int]] = {}
+
+
+_path_converters: dict[str, Callable[[str], Any]] = {'str': str, 'int': int, 'float': float}
+
+
+_fn_url_parameter = re_compile(r'(\w+)=([\w +~`!@"#№$;%^:*-,.<>\'{}\[\]()-]+)')
+
+
+_fn_floatstr = re_compile(r'^-?\d+\.\d+$')
+
+
+_fn_route_segment = re_compile(r'^(?:[a-zA-Z_]\w*|<([a-zA-Z_]\w*)(?::([a-zA-Z_]\w*))?>)$')
 
 
 FLET_NAVIGATOR_VERSION: str = '3.10.11'
@@ -65,15 +155,27 @@ This can be customized for routing or error handling purposes."""
 Arguments = Union[Any, tuple[Any, ...]]
 """An alias for a page-transferring arguments."""
 
-PageDefinition = Callable[['RouteContext'], None]
-"""An alias for a page definition."""
+PageDefinition = Callable[['RouteContext'], Optional[Awaitable[None]]]
+"""An alias for a page definition. Page definitions can be `async`."""
 
 TemplateDefinition = Callable[['RouteContext', Arguments], Any]
-"""An alias for a template definition."""
+"""An alias for a template definition. Template definitions can be `async`."""
+
+LayoutDefinition = Callable[['RouteContext', Column], None]
+"""An alias for a layout definition. The layout adds its controls and places the given outlet where the route content goes. Layouts can't be `async`."""
+
+LoaderDefinition = Callable[['RouteParameters'], Any]
+"""An alias for a route data loader. Loaders receive the route parameters and can be `async`."""
+
+RouteGuard = Callable[['RouteContext'], Union[bool, str, None]]
+"""An alias for a route guard. Guards return `None` (or `True`) to let the navigation through, a route to redirect to, or `False` to redirect to the homepage."""
 
 RouteChangeCallback = Callable[['RouteContext'], None]
 """An alias for a route change callback."""
 
+RouteEventCallback = Callable[['RouteChangeEvent'], None]
+"""An alias for a route change event subscriber."""
+
 Routes = dict[str, PageDefinition]
 """An alias for a routes map."""
 
@@ -84,464 +186,2864 @@ RouteProperties = dict[int, dict[str, Any]]
 """An alias for a route properties map."""
 
 
-class RouteContext:
-    """Route context class used for transferring data between routes and providing Navigator shortcuts."""
+class _RoutePropertiesMap(dict):
+    """A route properties map that keeps the union of all specified property names up to date."""
 
-    page: Page = None
-    """The current page instance."""
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__()
 
-    navigator: Union['PublicFletNavigator', 'VirtualFletNavigator'] = None
-    """The navigator that created this RouteContext instance."""
+        self.known_props: Counter[str] = Counter()
 
-    arguments: Arguments = None
-    """Arguments passed from the previous page for context."""
+        self.update(*args, **kwargs)
 
-    parameters: 'RouteParameters' = None
-    """URL parameters associated with the current route."""
+    def __setitem__(self, route_id: Any, props: dict[str, Any]) -> None:
+        if route_id in self:
+            self.known_props.subtract(self[route_id].keys())
 
-    route_id: tuple[int, str] = None
-    """The unique identifier for this page."""
+        super().__setitem__(route_id, props)
 
-    def __init__(self, page: Page, navigator: Union['PublicFletNavigator', 'VirtualFletNavigator'], arguments: Arguments, parameters: 'RouteParameters', route_id: tuple[int, str]) -> None:
-        """Initialize a RouteContext instance."""
-        self.page = page
+        self.known_props.update(props.keys())
 
-        self.navigator = navigator
+        self.known_props += Counter()
 
-        self.arguments = arguments
+    def __delitem__(self, route_id: Any) -> None:
+        self.known_props.subtract(self[route_id].keys())
 
-        self.parameters = parameters
+        self.known_props += Counter()
 
-        self.route_id = route_id
+        super().__delitem__(route_id)
 
-    def add(self, *controls: Control) -> None:
-        """Add one or more controls to the current page."""
-        self.page.add(*controls)
+    def pop(self, route_id: Any, *default: Any) -> Any:
+        if route_id in self:
+            props = self[route_id]
 
-    def navigate(self, route: str, args: Arguments=(), **parameters: RouteParameters) -> None:
-        """Navigate to a specific route. If the navigator is virtual, parameters are not used."""
-        if self.navigator.is_virtual():
-            self.navigator.navigate(route, self.page, args)
+            del self[route_id]
 
-        else:
-            self.navigator.navigate(route, self.page, args, parameters)
+            return props
 
-    def navigate_homepage(self, args: Arguments=(), **parameters: RouteParameters) -> None:
-        """Navigate to the homepage. If the navigator is virtual, parameters are not used."""
-        if self.navigator.is_virtual():
-            self.navigator.navigate_homepage(self.page, args)
+        return super().pop(route_id, *default)
 
-        else:
-            self.navigator.navigate_homepage(self.page, args, parameters)
+    def popitem(self) -> tuple[Any, dict[str, Any]]:
+        route_id, props = super().popitem()
 
-    def navigate_back(self, args: Arguments=(), **parameters: RouteParameters) -> None:
-        """Navigate back to the previous route. If the navigator is virtual, parameters are not used."""
-        if self.navigator.is_virtual():
-            self.navigator.navigate_back(self.page, args)
+        self.known_props.subtract(props.keys())
 
-        else:
-            self.navigator.navigate_back(self.page, args, parameters)
+        self.known_props += Counter()
 
-    def set_homepage(self, homepage: str) -> None:
-        """Update navigator's homepage address."""
-        self.navigator.set_homepage(homepage)
+        return route_id, props
 
-    def spec_cpage_props(self, **props: dict[str, Any]) -> None:
-        """Specify current page properties."""
-        self.navigator.props_map[self.route_id] = props
+    def setdefault(self, route_id: Any, default: dict[str, Any]=None) -> dict[str, Any]:
+        if route_id not in self:
+            self[route_id] = {} if default is None else default
 
-        AbstractFletNavigator.proc_page_props(self.page, props, ())
+        return self[route_id]
 
-        self.page.update()
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        for route_id, props in dict(*args, **kwargs).items():
+            self[route_id] = props
 
-    def current_route(self) -> str:
-        """Get the navigator's current route state."""
-        return self.navigator.route
+    def clear(self) -> None:
+        super().clear()
 
-    def __repr__(self) -> str:
-        """Represent the RouteContext instance as a string for debugging purposes."""
-        return f'{self.previous_page} -> {self.navigator.route} [{"NO-ARGUMENTS" if not self.arguments else self.arguments}, {"NO-PARAMETERS" if len(self.parameters) <= 0 else self.parameters}] ({self.route_id}) (NAVIGATOR-OBJECT {self.navigator})'
+        self.known_props.clear()
 
 
-class AbstractFletNavigator:
-    @staticmethod
-    def init_nav(nav: Union['VirtualFletNavigator', 'PublicFletNavigator'], page: Page=None, routes: Routes={}, route_change_callback: RouteChangeCallback=None) -> None:
-        basicConfig(format=f'%(name)s %(levelname)s: %(message)s')
+def _fn_iter_tree(controls: list[Control]) -> Iterator[Control]:
+    """Iterate over every control of the given control trees, once each."""
+    seen, stack = set(), list(controls)
 
-        nav._logger = getLogger(f'FN')
+    while stack:
+        control = stack.pop()
 
-        nav._logger.setLevel(ERROR)
+        if id(control) in seen:
+            continue
 
-        nav._afn_vroute = re_compile(r'^[a-zA-Z_]\w*$')
+        seen.add(id(control))
 
-        if page:
-            nav._afn_proute = re_compile(r'^[a-zA-Z_]\w*\?\w+=([\w+~`!@"#№$;%^:*-,.<>\'{}\[\]()-]+)(?:&\w+=([\w+~`!@"#№$;%^:*-,.<>\'{}\[\]()-]+))*$')
-            nav._afn_floatstr = re_compile(r'^-?\d+\.\d+$')
+        yield control
 
-            nav.page = page
+        if not hasattr(control, '__dict__'):
+            continue
 
-            nav.virtual = False
+        if hasattr(control, '_get_children'):
+            stack.extend(control._get_children())
 
-        else:
-            nav.virtual = True
+            continue
 
-        nav.routes = routes
+        for name, value in control.__dict__.items():
+            if name.startswith('_'):
+                continue
 
-        nav.route_change_callback = route_change_callback
+            if isinstance(value, Control):
+                stack.append(value)
 
-        if not nav.is_virtual():
-            page.on_route_change = nav.fn_route_change_handler_
+            elif isinstance(value, (list, tuple)):
+                stack.extend(item for item in value if isinstance(item, Control))
 
-        routes_to_delete = []
 
-        for route in _pre_def_routes:
-            nav.routes[route] = _pre_def_routes[route]
+def _fn_no_arguments(args: 'Arguments') -> bool:
+    """Check if no page arguments are passed, without evaluating the truth value of the arguments (data frames and arrays don't have one)."""
+    return args is None or (isinstance(args, tuple) and not args)
 
-        for route in nav.routes:
-            if route != '/' and route != ROUTE_404:
-                if not nav._afn_vroute.match(route):
-                    routes_to_delete.append(route)
 
-                    nav._logger.error(f'Invalid route name: "{route}". Route names must start with a letter or underscore and contain only alphanumeric characters or underscores.')
+def _fn_sizeof_tree(controls: list[Control]) -> int:
+    """Approximate the memory footprint (in bytes) of the given control trees."""
+    return sum(getsizeof(control) + (getsizeof(control.__dict__) if hasattr(control, '__dict__') else 0) for control in _fn_iter_tree(controls))
 
-        for route_to_delete in routes_to_delete:
-            nav.routes.pop(route_to_delete)
 
-        nav._returning = False
+@lru_cache(maxsize=1024)
+def _fn_parse_route(raw_route: str) -> tuple[str, tuple[tuple[str, Union[str, int, float, bool, None]], ...]]:
+    """Split a raw page route into its base route and typed URL parameters.
 
-    @staticmethod
-    def navigate(nav: Union['VirtualFletNavigator', 'PublicFletNavigator'], route: str, page: Page, args: Arguments=(), parameters: RouteParameters={}) -> None:
-        if nav.is_virtual() and '?' in route:
-            route = route.split('?')[0]
+    The query is validated and converted in a single loop over its `key=value` pairs; if any pair is invalid, no parameters are returned.
+    The base route is returned as is: spaces in it are not decoded (such routes never match a registered route anyway).
+    Results are memoized by the raw route, so repeated deep links and back/forward navigation skip parsing entirely."""
+    route = raw_route[1:] if raw_route.startswith('/') and len(raw_route) >= 2 else raw_route
 
-            nav._logger.error('VirtualFletNavigator does not support URL parameters. Use page arguments instead, or switch to PublicFletNavigator for full URL parameters support.')
+    query_start, fragment_start = route.find('?'), route.find('#')
 
-        if not nav._returning:
-            nav.previous_routes.append(nav.route)
+    # A fragment is not a part of the route or the query, even though `#` is allowed in parameter values.
+    if query_start < 0 or 0 <= fragment_start < query_start:
+        return route if fragment_start < 0 else route[:fragment_start], ()
 
-        nav.route = route
+    if query_start == 0:
+        return '', ()
 
-        if not nav.is_virtual():
-            nav._nav_temp_args = args
+    parameters, invalid_keys, in_fragment = {}, [], False
 
-            if route == '/' and parameters:
-                page.go(route)
+    for pair in route[query_start + 1:].split('&'):
+        if not _fn_url_parameter.fullmatch(pair):
+            return route[:query_start], ()
 
-                nav._logger.error('Index/Main route does not support parameters; parameters transferring skipped.')
+        if in_fragment:
+            continue
 
-            else:
-                page.go(AbstractFletNavigator.fparams(route, **parameters))
+        key, _, value = pair.partition('=')
 
-        else:
-            nav.process(page, args)
+        if '#' in value:
+            value, in_fragment = value[:value.index('#')], True
 
-    @staticmethod
-    def navigate_homepage(nav: Union['VirtualFletNavigator', 'PublicFletNavigator'], page: Page, args: Arguments=(), parameters: RouteParameters={}) -> None:
-        AbstractFletNavigator.navigate(nav, nav.homepage, page, args, parameters)
+        if key in parameters or key in invalid_keys:
+            continue
 
-    @staticmethod
-    def set_homepage(nav: Union['VirtualFletNavigator', 'PublicFletNavigator'], homepage: str) -> None:
-        if homepage not in nav.routes:
-            nav._logger.error('Can\'t update homepage address: invalid route.')
+        if not key.isalpha():
+            invalid_keys.append(key)
 
-            return
+            continue
 
-        nav.homepage = homepage
+        value = unquote(unquote(value.replace('+', ' ')))
 
-    @staticmethod
-    def navigate_back(nav: Union['VirtualFletNavigator', 'PublicFletNavigator'], page: Page, args: Arguments=(), parameters: RouteParameters={}) -> None:
-        if len(nav.previous_routes) > 0:
-            nav._returning = True
+        if value.isdigit(): parameters[key] = int(value)
+        elif _fn_floatstr.match(value): parameters[key] = float(value)
+        elif value in ['True', 'False']: parameters[key] = value == 'True'
+        elif value == 'None': parameters[key] = None
+        else: parameters[key] = value
 
-            AbstractFletNavigator.navigate(nav, nav.previous_routes[-1], page, args, parameters)
+    for key in invalid_keys:
+        getLogger('FN').error(f'Invalid key name: "{key}". The key is expected to be a string.')
 
-            nav._returning = False
+    return route[:query_start], tuple(parameters.items())
 
-            nav.previous_routes.pop()
 
-    @staticmethod
-    def process(nav: Union['VirtualFletNavigator', 'PublicFletNavigator'], page: Page, args: Arguments=(), route_parameters: RouteParameters={}) -> None:
-        total_props = AbstractFletNavigator.find_all_specified_props(nav.routes, nav.props_map)
+class _RouteNode:
+    """A single segment node of the compiled route trie."""
 
-        if nav.route not in nav.routes:
-            page.clean()
+    __slots__ = ('children', 'parameters', 'route')
 
-            r404_rctx_inst = RouteContext(page, nav, args, route_parameters, ROUTE_404)
+    def __init__(self) -> None:
+        self.children: dict[str, '_RouteNode'] = {}
 
-            if ROUTE_404 in nav.routes:
-                AbstractFletNavigator.proc_page_props(page, nav.props_map.get(ROUTE_404), total_props)
+        self.parameters: list[tuple[str, Callable[[str], Any], '_RouteNode']] = []
 
-                nav.routes[ROUTE_404](r404_rctx_inst)
+        self.route: Optional[tuple[str, int, PageDefinition, None]] = None
 
-            else:
-                _DEFAULT_PAGE_404(r404_rctx_inst)
 
-            if nav.route_change_callback:
-                nav.route_change_callback(r404_rctx_inst)
+class _RouteTable:
+    """A route table compiled once per navigator.
 
-            nav._logger.error(f'Route "{nav.route}" does not exist in the defined routes. Unable to process the page.')
+    Static routes are resolved with a single dictionary lookup, routes with typed segments (`user/<id:int>`) through a segment trie,
+    so the lookup cost depends on the route depth rather than the number of registered routes.
+    Every route is stored as a `(route, route ID, page definition, path parameters)` dispatch entry built once at registration,
+    so a static route is dispatched without hashing the route again or allocating anything."""
 
-        else:
-            page.clean()
+    def __init__(self, routes: Routes) -> None:
+        self.static: dict[str, tuple[str, int, PageDefinition, None]] = {}
 
-            route_id = hash(nav.route)
+        self.root = _RouteNode()
 
-            AbstractFletNavigator.proc_page_props(page, nav.props_map.get(route_id), total_props)
+        for route, page_definition in routes.items():
+            dispatch_entry = (route, hash(route), page_definition, None)
 
-            nav.routes[nav.route](nxrctx := RouteContext(page, nav, args, route_parameters, route_id))
+            if '<' not in route:
+                self.static[route] = dispatch_entry
 
-            page.update()
+                continue
 
-            if nav.route_change_callback:
-                nav.route_change_callback(nxrctx)
+            node = self.root
 
-    @staticmethod
-    def find_all_specified_props(routes: Routes, props_map: RouteProperties) -> tuple[str]:
-        total_props_specified = []
+            for segment in route.split('/'):
+                parameter = _fn_route_segment.match(segment)
 
-        for route in routes:
-            route_id = hash(route)
+                if not parameter.group(1):
+                    node = node.children.setdefault(segment, _RouteNode())
 
-            if route_id in props_map:
-                total_props_specified += list(props_map[route_id].keys())
+                    continue
 
-        return tuple(total_props_specified)
+                converter = _path_converters[parameter.group(2) or 'str']
 
-    @staticmethod
-    def proc_page_props(page: Page, props: RouteProperties, total_props: tuple[str]) -> None:
-        for prop in total_props:
-            setattr(page, prop, None)
+                for name, node_converter, child in node.parameters:
+                    if name == parameter.group(1) and node_converter is converter:
+                        node = child
 
-        if props:
-            for prop, prop_value in props.items():
-                setattr(page, prop, prop_value)
+                        break
 
-    @staticmethod
-    def fparams(route: str, **_parameters: dict) -> str:
-        return f'{route}?{"&".join(f"{key}={value}" for key, value in _parameters.items())}' if len(_parameters) > 0 else route
+                else:
+                    node.parameters.append((parameter.group(1), converter, child := _RouteNode()))
 
-    @staticmethod
-    def is_virtual(nav: Union['VirtualFletNavigator', 'PublicFletNavigator']) -> bool:
-        return getattr(nav, 'virtual', None)
+                    node = child
 
+            node.route = dispatch_entry
 
-class PublicFletNavigator:
-    """The Public Flet Navigator. It's just like the virtual one, but with URL parameters and visible routes."""
+    def dispatch(self, path: str) -> Optional[tuple[str, int, PageDefinition, Optional[RouteParameters]]]:
+        dispatch_entry = self.static.get(path)
 
-    page: Page = None
-    """Page object representing the current page."""
+        if dispatch_entry is not None:
+            return dispatch_entry
 
-    route: str = '/'
-    """The current active route."""
+        parameters = {}
 
-    routes: Routes = {}
-    """A map of all registered routes in the application."""
+        dispatch_entry = _RouteTable._resolve(self.root, path.split('/'), 0, parameters)
 
-    previous_routes: list[str] = []
-    """A list of all previously visited routes."""
+        return dispatch_entry[:3] + (parameters,) if dispatch_entry else None
 
-    homepage: str = '/'
-    """The homepage route."""
+    def resolve(self, path: str) -> Optional[tuple[str, RouteParameters]]:
+        dispatch_entry = self.dispatch(path)
 
-    props_map: RouteProperties = {}
-    """A page properties map for each page ID."""
+        return (dispatch_entry[0], dispatch_entry[3] or {}) if dispatch_entry else None
 
-    route_change_callback: RouteChangeCallback = None
-    """A callback function that is triggered when the route changes."""
+    @staticmethod
+    def _resolve(node: _RouteNode, segments: list[str], index: int, parameters: RouteParameters) -> Optional[tuple[str, int, PageDefinition, None]]:
+        if index == len(segments):
+            return node.route
 
-    _nav_temp_args: Arguments = None
+        segment = segments[index]
 
-    def __init__(self, page: Page, routes: Routes={}, route_change_callback: RouteChangeCallback=None) -> None:
-        """Initialize the public navigator."""
-        AbstractFletNavigator.init_nav(self, page, routes, route_change_callback)
+        if segment in node.children:
+            route = _RouteTable._resolve(node.children[segment], segments, index + 1, parameters)
 
-    def navigate(self, route: str, page: Page, args: Arguments=(), parameters: RouteParameters={}) -> None:
-        """Navigate to a specific route in the application."""
-        AbstractFletNavigator.navigate(self, route, page, args, parameters)
+            if route:
+                return route
 
-    def navigate_homepage(self, page: Page, args: Arguments=(), parameters: RouteParameters={}) -> None:
-        """Navigate to the homepage route."""
-        AbstractFletNavigator.navigate_homepage(self, page, args, parameters)
+        for name, converter, child in node.parameters:
+            try:
+                parameters[name] = converter(segment)
+            except (ValueError, TypeError, KeyError):
+                continue
 
-    def set_homepage(self, homepage: str) -> None:
-        """Update navigator's homepage address."""
-        AbstractFletNavigator.set_homepage(self, homepage)
+            route = _RouteTable._resolve(child, segments, index + 1, parameters)
 
-    def navigate_back(self, page: Page, args: Arguments=(), parameters: RouteParameters={}) -> None:
-        """Navigate back to the previous route."""
-        AbstractFletNavigator.navigate_back(self, page, args, parameters)
+            if route:
+                return route
 
-    def process(self, page: Page, args: Arguments=(), route_parameters: RouteParameters={}) -> None:
-        """Process the current route on the provided page."""
-        AbstractFletNavigator.process(self, page, args, route_parameters)
+            parameters.pop(name)
 
-    def is_virtual(self) -> bool:
-        """Check if the navigator is virtual or public."""
-        return AbstractFletNavigator.is_virtual(self)
+        return None
 
-    def fn_route_change_handler_(self, _) -> None:
-        route: str = self.page.route.replace(' ', _url_fn_space_chr).replace('%20', _url_fn_space_chr).replace('+', _url_fn_space_chr)
 
-        route = route[1:] if route.startswith('/') and len(route) >= 2 else route
+class RouteRegistry(Mapping):
+    """An immutable, validated and compiled route registry.
 
-        split_url = urlsplit(route)
+    Navigators built from the same routes share a single registry (see `AbstractFletNavigator.init_nav`),
+    so a web deployment with many sessions keeps one copy of the routes and of the compiled route table.
+    Modifications are copy-on-write: `with_routes` returns a new registry and leaves the shared one untouched."""
 
-        base_route, qstr = split_url.path, split_url.query
+    __slots__ = ('_routes', 'table')
 
-        parameters = {}
+    def __init__(self, routes: Routes) -> None:
+        """Validate and compile the given routes. Invalid routes are reported and skipped."""
+        self._routes: Routes = {}
 
-        if self._afn_proute.match(route):
-            _parsed_params = parse_qs(qstr, True)
+        for route, page_definition in routes.items():
+            if route != '/' and route != ROUTE_404:
+                for segment in route.split('/'):
+                    segment_match = _fn_route_segment.match(segment)
 
-            for key, values in _parsed_params.items():
-                if not key.isalpha():
-                    self._logger.error(f'Invalid key name: "{key}". The key is expected to be a string.')
+                    if not segment_match:
+                        getLogger('FN').error(f'Invalid route name: "{route}". Route segments must start with a letter or underscore and contain only alphanumeric characters or underscores, or be typed parameters like "<id:int>".')
 
-                    continue
+                    elif segment_match.group(2) and segment_match.group(2) not in _path_converters:
+                        getLogger('FN').error(f'Invalid route name: "{route}". Unknown path converter: "{segment_match.group(2)}".')
 
-                value = unquote(values[0]) if values else ''
+                    else:
+                        continue
 
-                if value.isdigit(): parameters[key] = int(value)
-                elif self._afn_floatstr.match(value): parameters[key] = float(value)
-                elif value in ['True', 'False']: parameters[key] = value == 'True'
-                elif value == 'None': parameters[key] = None
-                else: parameters[key] = value.replace(_url_fn_space_chr, ' ')
+                    break
 
-        self.route = base_route
+                else:
+                    self._routes[intern(route)] = page_definition
 
-        if not globals().get('_FNDP404_CLOSED'):
-            setattr(self.page, 'horizontal_alignment', globals().get('_FNDP404_PRE_H_A')),
-            setattr(self.page, 'vertical_alignment', globals().get('_FNDP404_PRE_V_A')),
+            else:
+                self._routes[route] = page_definition
 
-        self.process(self.page, self._nav_temp_args, parameters)
+        self.table = _RouteTable(self._routes)
 
-        self._nav_temp_args = None
+    def with_routes(self, routes: Routes) -> 'RouteRegistry':
+        """Get a new registry with the given routes added or replaced."""
+        return RouteRegistry({**self._routes, **routes})
 
+    def __getitem__(self, route: str) -> PageDefinition:
+        return self._routes[route]
 
-class VirtualFletNavigator:
-    """The Virtual Flet Navigator. It's just like the public one, but without URL parameters and visible routes."""
+    def __contains__(self, route: Any) -> bool:
+        return route in self._routes
 
-    route: str = '/'
-    """The current active route."""
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._routes)
 
-    routes: Routes = {}
-    """A map of all registered routes in the application."""
+    def __len__(self) -> int:
+        return len(self._routes)
 
-    previous_routes: list[str] = []
-    """A list of all previously visited routes."""
+    def __repr__(self) -> str:
+        """Represent the registry as a string for debugging purposes."""
+        return f'RouteRegistry({list(self._routes)})'
 
-    homepage: str = '/'
-    """The homepage route."""
 
-    props_map: RouteProperties = {}
-    """A page properties map for each page ID."""
+def _fn_shared_route_registry(routes: Routes) -> RouteRegistry:
+    """Get the shared registry for the given routes combined with the `@route`-defined ones, compiling it only once.
 
-    route_change_callback: RouteChangeCallback = None
-    """A callback function that is triggered when the route changes."""
+    Registries are cached by the routes content; the routes map most recently seen with a given identity is also remembered,
+    so the map passed for every session (e.g. the one captured by `fn_process`) is only compared, not hashed."""
+    with _shared_route_registries_lock:
+        recent_registry = _recent_route_registries.get(id(routes))
 
-    def __init__(self, routes: Routes={}, route_change_callback: RouteChangeCallback=None) -> None:
-        """Initialize the virtual navigator."""
-        AbstractFletNavigator.init_nav(self, None, routes, route_change_callback)
+        # The remembered map keeps `routes` alive, so its `id` can't be reused; the snapshot catches in-place changes.
+        if recent_registry and recent_registry[0] is routes and recent_registry[1] == _pre_def_routes_version and recent_registry[2] == routes:
+            return recent_registry[3]
 
-    def navigate(self, route: str, page: Page, args: Arguments=()) -> None:
-        """Navigate to a specific route in the application."""
-        AbstractFletNavigator.navigate(self, route, page, args)
+        registry_key = (_pre_def_routes_version, tuple(routes.items()))
 
-    def navigate_homepage(self, page: Page, args: Arguments=()) -> None:
-        """Navigate to the homepage route."""
-        AbstractFletNavigator.navigate_homepage(self, page, args)
+        registry = _shared_route_registries.get(registry_key)
 
-    def set_homepage(self, homepage: str) -> None:
-        """Update navigator's homepage address."""
-        AbstractFletNavigator.set_homepage(self, homepage)
+        if registry is None:
+            registry = _shared_route_registries[registry_key] = RouteRegistry({**routes, **_pre_def_routes})
 
-    def navigate_back(self, page: Page, args: Arguments=()) -> None:
-        """Navigate back to the previous route."""
-        AbstractFletNavigator.navigate_back(self, page, args)
+            if len(_shared_route_registries) > 32:
+                _shared_route_registries.popitem(last=False)
 
-    def process(self, page: Page, args: Arguments=()) -> None:
-        """Process the current route on the provided page."""
-        AbstractFletNavigator.process(self, page, args)
+        _recent_route_registries[id(routes)] = (routes, _pre_def_routes_version, dict(routes), registry)
 
-    def is_virtual(self) -> bool:
-        """Check if the navigator is virtual or public."""
-        return AbstractFletNavigator.is_virtual(self)
+        _recent_route_registries.move_to_end(id(routes))
 
+        if len(_recent_route_registries) > 32:
+            _recent_route_registries.popitem(last=False)
 
-def route(route: Union[str, PageDefinition]) -> Any:
-    """Link a route to the last initialized navigator.
+        return registry
 
-    This function registers the route and associates it with a given page definition.
-    The only difference is the name. You can specify the name in the first argument.
-    or this function will fetch the given function name automatically."""
-    if isinstance(route, Callable):
-        _pre_def_routes[route.__name__] = route
 
-    else:
-        def _route_decorator(page_definition: PageDefinition) -> None:
-            _pre_def_routes[route] = page_definition
+class NavigationHistory:
+    """A bounded navigation history with a forward stack.
 
-        return _route_decorator
+    Entries are compact `(route, parameters[, arguments token])` tuples with interned routes; parameter-less entries don't allocate a parameters tuple.
+    Pushing, going back and going forward are O(1). When `max_depth` is reached, the oldest entries are dropped.
+    For compatibility, the history also behaves like the former `previous_routes` list of routes."""
 
+    __slots__ = ('back_entries', 'forward_entries')
 
-def load_page(path: str, name: Optional[str]=None) -> PageDefinition:
-    """Load a page definition from a specified module.
+    def __init__(self, max_depth: Optional[int]=256) -> None:
+        """Initialize an empty navigation history. `None` means unbounded."""
+        self.back_entries: deque[tuple[str, Optional[tuple]]] = deque(maxlen=max_depth)
 
-    Let me explain this technically: it replaces all the system path separators with a dot.
-    After loading the module by its path, it loads the page definition function.
-    The function name is determined by the path. If a name is specified, then it loads the specified name.
-    Otherwise, it uses the last name in the path.
-    
-    Can throw `ModuleNotFoundError` and `AttributeError`."""
-    path = path.replace('\\', '.').replace('/', '.')
+        # Most sessions never go back, so the forward stack is allocated on the first step back.
+        self.forward_entries: Optional[deque[tuple[str, Optional[tuple]]]] = None
 
-    page = None
+    @property
+    def max_depth(self) -> Optional[int]:
+        """The maximum number of entries kept in each direction."""
+        return self.back_entries.maxlen
 
-    try:
-        page = getattr(import_module(path), _pd := path.split('.')[-1] if not name else name)
-    except ModuleNotFoundError as module_exc:
-        raise TypeError(f'Failed to load page definition module: "{path}".') from module_exc
-    except AttributeError as attr_error:
-        raise ImportError(f'Failed to load page definition: "{_pd}".') from attr_error
+    @max_depth.setter
+    def max_depth(self, max_depth: Optional[int]) -> None:
+        self.back_entries = deque(self.back_entries, maxlen=max_depth)
 
-    return page
+        if self.forward_entries is not None:
+            self.forward_entries = deque(self.forward_entries, maxlen=max_depth)
 
+    @staticmethod
+    def entry(route: str, parameters: Optional[RouteParameters]=None, token: Optional[int]=None) -> tuple[str, Optional[tuple]]:
+        """Build a compact history entry. The arguments token (see `ArgumentStore`) is only stored if there is one."""
+        return (intern(route), tuple(parameters.items()) if parameters else None) + (() if token is None else (token,))
 
-def template(template_definition: Union[str, TemplateDefinition], route_data: RouteContext, arguments: Arguments=()) -> Optional[Any]:
-    """Render a template for the given page data and arguments.
-    
-    If `template_definition` is a string, then it's a global template.
+    def push(self, route: str, parameters: Optional[RouteParameters]=None, token: Optional[int]=None) -> None:
+        """Record a visited route. A new visit invalidates the forward stack."""
+        self.back_entries.append(NavigationHistory.entry(route, parameters, token))
+
+        if self.forward_entries:
+            self.forward_entries.clear()
+
+    def push_many(self, entries: list[tuple[str, Optional[RouteParameters]]]) -> None:
+        """Record several visited routes (`(route, parameters[, arguments token])`) at once, oldest first. A new visit invalidates the forward stack."""
+        self.back_entries.extend(NavigationHistory.entry(*entry) for entry in entries)
+
+        if self.forward_entries:
+            self.forward_entries.clear()
+
+    def back(self, route: str, parameters: Optional[RouteParameters]=None, token: Optional[int]=None) -> Optional[tuple[str, RouteParameters, Optional[int]]]:
+        """Step back from the given current route. Returns the previous route, its parameters and its arguments token, or `None`."""
+        if not self.back_entries:
+            return None
+
+        if self.forward_entries is None:
+            self.forward_entries = deque(maxlen=self.back_entries.maxlen)
+
+        self.forward_entries.append(NavigationHistory.entry(route, parameters, token))
+
+        previous_entry = self.back_entries.pop()
+
+        return previous_entry[0], dict(previous_entry[1] or ()), previous_entry[2] if len(previous_entry) > 2 else None
+
+    def forward(self, route: str, parameters: Optional[RouteParameters]=None, token: Optional[int]=None) -> Optional[tuple[str, RouteParameters, Optional[int]]]:
+        """Step forward from the given current route. Returns the next route, its parameters and its arguments token, or `None`."""
+        if not self.forward_entries:
+            return None
+
+        self.back_entries.append(NavigationHistory.entry(route, parameters, token))
+
+        next_entry = self.forward_entries.pop()
+
+        return next_entry[0], dict(next_entry[1] or ()), next_entry[2] if len(next_entry) > 2 else None
+
+    def clear(self) -> None:
+        """Forget all the entries."""
+        self.back_entries.clear()
+
+        if self.forward_entries:
+            self.forward_entries.clear()
+
+    def append(self, route: str) -> None:
+        """Record a visited route (list compatibility)."""
+        self.push(route)
+
+    def pop(self) -> str:
+        """Remove and return the most recent route (list compatibility)."""
+        return self.back_entries.pop()[0]
+
+    def __getitem__(self, index: int) -> str:
+        """Get the route at the given back history position."""
+        return self.back_entries[index][0]
+
+    def __len__(self) -> int:
+        """Get the back history length."""
+        return len(self.back_entries)
+
+    def __iter__(self) -> Any:
+        """Iterate over the back history routes, oldest first."""
+        return (entry[0] for entry in self.back_entries)
+
+    def __repr__(self) -> str:
+        """Represent the history as a string for debugging purposes."""
+        return f'NavigationHistory({list(self)}, forward={[entry[0] for entry in reversed(self.forward_entries or ())]}, max_depth={self.max_depth})'
+
+
+class ArgumentStore:
+    """A per-session store of the page arguments, keyed by navigation token.
+
+    Arguments are handed over by reference: large objects (data frames, byte buffers) are never copied or serialized into the URL.
+    On the public navigator, the arguments of every pending navigation wait for their own route change event,
+    so overlapping navigations can't receive each other's arguments. The most recently passed arguments are also retained
+    (up to `max_entries` and approximately `max_size` bytes, least recently used evicted first),
+    so going back or forward reuses them instead of recomputing them. Navigations without arguments store nothing."""
+
+    __slots__ = ('max_entries', 'max_size', 'size', '_entries', '_tokens', '_pending', '_next_token', '_lock')
+
+    def __init__(self, max_entries: int=16, max_size: int=64 * 1024 * 1024) -> None:
+        """Initialize an empty argument store."""
+        self.max_entries = max_entries
+
+        self.max_size = max_size
+
+        self.size = 0
+
+        self._entries: Optional[OrderedDict[int, tuple[Arguments, int]]] = None
+
+        self._tokens: Optional[dict[int, int]] = None
+
+        self._pending: Optional[dict[Any, deque[tuple[int, Arguments]]]] = None
+
+        self._next_token = 0
+
+        self._lock = Lock()
+
+    @staticmethod
+    def sizeof(args: Arguments) -> int:
+        """Approximate the memory footprint (in bytes) of the given arguments; objects like data frames report their own size."""
+        return getsizeof(args) + (sum(getsizeof(arg) for arg in args) if isinstance(args, tuple) else 0)
+
+    def put(self, args: Arguments) -> Optional[int]:
+        """Retain the given arguments and return their token. Passing the same object again returns its existing token."""
+        if _fn_no_arguments(args):
+            return None
+
+        with self._lock:
+            if self._entries is None:
+                self._entries, self._tokens = OrderedDict(), {}
+
+            # The retained arguments are alive, so their `id` can't be reused by another object.
+            token = self._tokens.get(id(args))
+
+            if token is not None:
+                self._entries.move_to_end(token)
+
+                return token
+
+            self._next_token += 1
+
+            token, size = self._next_token, ArgumentStore.sizeof(args)
+
+            if size > self.max_size:
+                return token
+
+            self._entries[token] = (args, size)
+
+            self._tokens[id(args)] = token
+
+            self.size += size
+
+            while len(self._entries) > max(self.max_entries, 0) or self.size > self.max_size:
+                evicted_args, evicted_size = self._entries.popitem(last=False)[1]
+
+                del self._tokens[id(evicted_args)]
+
+                self.size -= evicted_size
+
+            return token
+
+    def get(self, token: Optional[int]) -> Arguments:
+        """Get the retained arguments of a token, or `()` if there are none (anymore)."""
+        if token is None or not self._entries:
+            return ()
+
+        with self._lock:
+            entry = self._entries.get(token)
+
+            if entry is None:
+                return ()
+
+            self._entries.move_to_end(token)
+
+            return entry[0]
+
+    def hand_off(self, navigation_key: Any, token: Optional[int], args: Arguments) -> None:
+        """Hold the arguments of a navigation until `take` is called with the same key."""
+        with self._lock:
+            if self._pending is None:
+                self._pending = {}
+
+            self._pending.setdefault(navigation_key, deque(maxlen=8)).append((token, args))
+
+    def take(self, navigation_key: Any) -> tuple[Optional[int], Arguments]:
+        """Take the token and arguments of the oldest pending navigation with the given key, or `(None, None)`."""
+        if not self._pending:
+            return None, None
+
+        with self._lock:
+            pending_arguments = self._pending.get(navigation_key)
+
+            if not pending_arguments:
+                return None, None
+
+            token, args = pending_arguments.popleft()
+
+            if not pending_arguments:
+                del self._pending[navigation_key]
+
+            return token, args
+
+    def clear(self) -> None:
+        """Forget all the retained arguments."""
+        with self._lock:
+            self._entries = self._tokens = None
+
+            self.size = 0
+
+    def __len__(self) -> int:
+        """Get the number of retained arguments."""
+        return len(self._entries or ())
+
+    def __repr__(self) -> str:
+        """Represent the store as a string for debugging purposes."""
+        return f'ArgumentStore({len(self)} entries, {self.size} bytes, max_entries={self.max_entries}, max_size={self.max_size})'
+
+
+NavigationPhaseHook = Callable[[str, str, float], None]
+"""An alias for a navigation phase hook: `(route, phase, seconds)`."""
+
+
+class NavigationStats:
+    """An in-process aggregator of navigation phase timings, with per-route percentiles.
+
+    The most recent `max_samples` timings of each route and phase are kept."""
+
+    PHASES: tuple[str, ...] = ('parse', 'guard', 'props', 'clean', 'render', 'update', 'callback')
+    """The navigation phases, in the order they happen."""
+
+    def __init__(self, max_samples: int=1024) -> None:
+        """Initialize an empty aggregator."""
+        self.max_samples = max_samples
+
+        self.samples: dict[str, dict[str, deque[float]]] = {}
+
+        self._lock = Lock()
+
+    def record(self, route: str, phase: str, seconds: float) -> None:
+        """Record a single phase timing of a route."""
+        with self._lock:
+            route_samples = self.samples.get(route)
+
+            if route_samples is None:
+                route_samples = self.samples[route] = {}
+
+            if phase not in route_samples:
+                route_samples[phase] = deque(maxlen=self.max_samples)
+
+            route_samples[phase].append(seconds)
+
+    def reset(self) -> None:
+        """Forget all the recorded timings."""
+        with self._lock:
+            self.samples.clear()
+
+    @staticmethod
+    def summarize(samples: list[float]) -> dict[str, float]:
+        """Summarize timings (in seconds) as a count and p50/p95/p99 in milliseconds (nearest-rank)."""
+        samples = sorted(samples)
+
+        def percentile(rank: float) -> float:
+            return samples[min(len(samples) - 1, max(0, int(rank * len(samples) + 0.5) - 1))] * 1000
+
+        return {'count': len(samples), 'p50_ms': percentile(0.50), 'p95_ms': percentile(0.95), 'p99_ms': percentile(0.99)}
+
+    def as_dict(self) -> dict[str, dict[str, dict[str, float]]]:
+        """Export the statistics as `{route: {phase: {'count', 'p50_ms', 'p95_ms', 'p99_ms'}}}`."""
+        with self._lock:
+            samples = {route: {phase: list(timings) for phase, timings in phases.items()} for route, phases in self.samples.items()}
+
+        return {route: {phase: NavigationStats.summarize(timings) for phase, timings in phases.items() if timings} for route, phases in samples.items()}
+
+    def to_jsonl(self) -> str:
+        """Export the statistics as JSON lines, one line per route and phase."""
+        return '\n'.join(dumps({'route': route, 'phase': phase, **summary}) for route, phases in self.as_dict().items() for phase, summary in phases.items())
+
+
+class NavigationProfiler:
+    """Times every phase of a navigation and feeds the timings to `stats` and to the registered hooks.
+
+    Assign a profiler to a navigator's `profiler` to enable it; without a profiler, the navigator does no timing at all."""
+
+    stats: NavigationStats = None
+    """The timings aggregator."""
+
+    hooks: list[NavigationPhaseHook] = None
+    """Functions called with `(route, phase, seconds)` after every phase."""
+
+    def __init__(self, stats: Optional[NavigationStats]=None, hooks: tuple[NavigationPhaseHook, ...]=()) -> None:
+        """Initialize a navigation profiler."""
+        self.stats = stats if stats is not None else NavigationStats()
+
+        self.hooks = list(hooks)
+
+    def add_hook(self, hook: NavigationPhaseHook) -> None:
+        """Register a phase hook."""
+        self.hooks.append(hook)
+
+    def record(self, route: str, phase: str, started: float) -> float:
+        """Record a phase of the given route that started at `started` (a `perf_counter` value). Returns the current `perf_counter` value."""
+        now = perf_counter()
+
+        self.stats.record(route, phase, now - started)
+
+        for hook in self.hooks:
+            hook(route, phase, now - started)
+
+        return now
+
+
+class ControlLeakDetector:
+    """A debug aid finding pages whose control trees outlive the navigation away from them.
+
+    The controls built for every navigation are tracked with weak references. A tree that is still alive
+    `after_navigations` navigations later is reported as retained: usually an event handler, a closure or a global
+    keeps a `RouteContext` or a control of the page. Kept-alive and prerendered pages are retained on purpose,
+    so disable them while looking for leaks.
+
+    Assign a detector to a navigator's `leak_detector` to enable it; without a detector, nothing is tracked."""
+
+    after_navigations: int = 10
+    """The number of navigations after which a still alive tree is reported."""
+
+    max_tracked: int = 1024
+    """The maximum number of tracked trees. The oldest ones are forgotten first."""
+
+    navigations: int = 0
+    """The number of tracked navigations."""
+
+    def __init__(self, after_navigations: int=10, max_tracked: int=1024) -> None:
+        """Initialize a leak detector."""
+        self.after_navigations = after_navigations
+
+        self.max_tracked = max_tracked
+
+        self._trees: deque[tuple[int, str, list[ref]]] = deque(maxlen=max_tracked)
+
+        self._lock = Lock()
+
+    def track(self, route: str, controls: list[Control]) -> None:
+        """Track the control trees built for a navigation to the given route."""
+        control_refs = [ref(control) for control in _fn_iter_tree(controls)]
+
+        with self._lock:
+            self.navigations += 1
+
+            self._trees.append((self.navigations, route, control_refs))
+
+    def report(self, collect_garbage: bool=True) -> dict[str, dict[str, int]]:
+        """Get the routes with retained trees: `{route: {'live_trees', 'live_controls', 'retained_size'}}`, largest first.
+
+        The size is approximate (see `keep_alive_max_size`). Reference cycles are collected first, unless `collect_garbage` is disabled."""
+        if collect_garbage:
+            collect()
+
+        with self._lock:
+            trees = [tree for tree in self._trees if self.navigations - tree[0] >= self.after_navigations]
+
+        retained = {}
+
+        for _, route, control_refs in trees:
+            live_controls = [control for control_ref in control_refs if (control := control_ref()) is not None]
+
+            if not live_controls:
+                continue
+
+            route_report = retained.setdefault(route, {'live_trees': 0, 'live_controls': 0, 'retained_size': 0})
+
+            route_report['live_trees'] += 1
+
+            route_report['live_controls'] += len(live_controls)
+
+            route_report['retained_size'] += _fn_sizeof_tree(live_controls)
+
+        return dict(sorted(retained.items(), key=lambda item: item[1]['retained_size'], reverse=True))
+
+    def prune(self) -> None:
+        """Forget the tracked trees that were already released."""
+        with self._lock:
+            self._trees = deque((tree for tree in self._trees if any(control_ref() is not None for control_ref in tree[2])), maxlen=self.max_tracked)
+
+    def reset(self) -> None:
+        """Forget all the tracked trees."""
+        with self._lock:
+            self._trees.clear()
+
+            self.navigations = 0
+
+
+class RouteChangeEvent(NamedTuple):
+    """An immutable snapshot of a completed navigation, published by a `RouteEventBus`."""
+
+    route: str
+    """The navigated route."""
+
+    route_pattern: str
+    """The route pattern the route was matched to."""
+
+    parameters: Mapping[str, Union[str, int, bool, None]]
+    """A read-only copy of the route parameters."""
+
+    route_id: int
+    """The unique identifier of the page."""
+
+    timestamp: float
+    """When the navigation completed, in seconds since the epoch."""
+
+
+class RouteEventSubscriber:
+    """A route change subscriber of a `RouteEventBus`, with its delivery statistics. See `RouteEventBus.subscribe`."""
+
+    callback: RouteEventCallback = None
+    """The subscribed function, called with the `RouteChangeEvent` of every completed navigation."""
+
+    mode: str = 'inline'
+    """The delivery mode: `inline` (called during the navigation) or `queued` (called from a worker thread)."""
+
+    overflow: str = 'drop_oldest'
+    """What a full queue does with a new event: `drop_oldest`, `drop_newest` or `block` (backpressure for up to `block_timeout` seconds, then drop)."""
+
+    block_timeout: float = 0.1
+    """How long (in seconds) the `block` policy waits for room in the queue."""
+
+    max_queue_depth: int = 0
+    """The highest queue depth seen so far."""
+
+    delivered: int = 0
+    """The number of events the callback handled without raising."""
+
+    dropped: int = 0
+    """The number of events dropped because the queue was full."""
+
+    failed: int = 0
+    """The number of callback calls that raised an exception."""
+
+    def __init__(self, callback: RouteEventCallback, mode: str='inline', max_queue_size: int=1024, overflow: str='drop_oldest', block_timeout: float=0.1) -> None:
+        """Initialize a subscriber. Queued subscribers start their worker thread on the first event."""
+        if mode not in ('inline', 'queued'):
+            raise ValueError(f'Invalid delivery mode: "{mode}". Expected "inline" or "queued".')
+
+        if overflow not in ('drop_oldest', 'drop_newest', 'block'):
+            raise ValueError(f'Invalid overflow policy: "{overflow}". Expected "drop_oldest", "drop_newest" or "block".')
+
+        self.callback = callback
+
+        self.mode = mode
+
+        self.overflow = overflow
+
+        self.block_timeout = block_timeout
+
+        self.max_queue_depth = 0
+
+        self._queue: Optional[Queue] = Queue(max(max_queue_size, 1)) if mode == 'queued' else None
+
+        self._worker: Optional[Thread] = None
+
+        self._lock = Lock()
+
+    @property
+    def queue_depth(self) -> int:
+        """The number of events waiting for delivery."""
+        return self._queue.qsize() if self._queue is not None else 0
+
+    def deliver(self, event: RouteChangeEvent) -> None:
+        """Call the subscriber with an event (inline) or enqueue it according to the overflow policy (queued)."""
+        if self._queue is None:
+            self.call(event)
+
+            return
+
+        if self._worker is None:
+            with self._lock:
+                if self._worker is None:
+                    self._worker = Thread(target=self.work, name='FN-event-subscriber', daemon=True)
+
+                    self._worker.start()
+
+        try:
+            if self.overflow == 'block':
+                self._queue.put(event, timeout=self.block_timeout)
+
+            else:
+                self._queue.put_nowait(event)
+        except Full:
+            with self._lock:
+                self.dropped += 1
+
+            if self.overflow != 'drop_oldest':
+                return
+
+            try:
+                self._queue.get_nowait()
+            except Empty:
+                pass
+
+            try:
+                self._queue.put_nowait(event)
+            except Full:
+                return
+
+        queue_depth = self._queue.qsize()
+
+        with self._lock:
+            self.max_queue_depth = max(self.max_queue_depth, queue_depth)
+
+    def call(self, event: RouteChangeEvent) -> None:
+        """Call the subscriber with an event. Exceptions are logged, so a failing subscriber doesn't break the navigation."""
+        try:
+            self.callback(event)
+        except Exception as callback_exc:
+            with self._lock:
+                self.failed += 1
+
+            getLogger('FN').error(f'Route change subscriber {getattr(self.callback, "__name__", self.callback)} failed: {callback_exc}')
+
+            return
+
+        with self._lock:
+            self.delivered += 1
+
+    def work(self) -> None:
+        """Deliver the queued events until the subscriber is closed."""
+        while (event := self._queue.get()) is not None:
+            self.call(event)
+
+    def close(self) -> None:
+        """Stop the worker thread after the already queued events are delivered."""
+        if self._worker is not None:
+            self._queue.put(None)
+
+            self._worker = None
+
+    def stats(self) -> dict[str, Any]:
+        """Get the delivery statistics of the subscriber."""
+        return {
+            'subscriber': getattr(self.callback, '__name__', repr(self.callback)), 'mode': self.mode, 'overflow': self.overflow,
+            'queue_depth': self.queue_depth, 'max_queue_depth': self.max_queue_depth, 'delivered': self.delivered, 'dropped': self.dropped, 'failed': self.failed
+        }
+
+
+class RouteEventBus:
+    """A route change event bus with any number of subscribers, each with its own delivery mode.
+
+    Inline subscribers are called during the navigation, right after the route change callback.
+    Queued subscribers are called from their own worker thread through a bounded queue, so slow observers
+    (analytics, audit logs) never add their latency to the navigation. A bus can be shared between navigators (sessions)."""
+
+    subscribers: tuple[RouteEventSubscriber, ...] = ()
+    """The current subscribers."""
+
+    def subscribe(self, callback: RouteEventCallback, mode: str='inline', max_queue_size: int=1024, overflow: str='drop_oldest', block_timeout: float=0.1) -> RouteEventSubscriber:
+        """Subscribe a function to the route change events. See `RouteEventSubscriber` for the delivery modes and overflow policies."""
+        subscriber = RouteEventSubscriber(callback, mode, max_queue_size, overflow, block_timeout)
+
+        # Subscribers are replaced, not modified, so publishing never has to lock.
+        self.subscribers = self.subscribers + (subscriber,)
+
+        return subscriber
+
+    def unsubscribe(self, subscriber: RouteEventSubscriber) -> None:
+        """Remove a subscriber, stopping its worker thread after the already queued events are delivered."""
+        self.subscribers = tuple(current for current in self.subscribers if current is not subscriber)
+
+        subscriber.close()
+
+    def publish(self, event: RouteChangeEvent) -> None:
+        """Deliver a route change event to every subscriber."""
+        for subscriber in self.subscribers:
+            subscriber.deliver(event)
+
+    def stats(self) -> list[dict[str, Any]]:
+        """Get the delivery statistics (queue depth, delivered, dropped and failed events) of every subscriber."""
+        return [subscriber.stats() for subscriber in self.subscribers]
+
+    def close(self) -> None:
+        """Stop the worker threads of all the queued subscribers."""
+        for subscriber in self.subscribers:
+            subscriber.close()
+
+
+class RouteContext:
+    """Route context class used for transferring data between routes and providing Navigator shortcuts."""
+
+    __slots__ = ('page', 'navigator', 'arguments', 'parameters', 'route_id', 'loader_future', '_offscreen')
+
+    page: Page
+    """The current page instance."""
+
+    navigator: Union['PublicFletNavigator', 'VirtualFletNavigator']
+    """The navigator that created this RouteContext instance."""
+
+    arguments: Arguments
+    """Arguments passed from the previous page for context."""
+
+    parameters: 'RouteParameters'
+    """URL parameters associated with the current route."""
+
+    route_id: tuple[int, str]
+    """The unique identifier for this page."""
+
+    loader_future: Optional[Future]
+    """The pending (or cached) result of the route's data loader, or `None` if the route has no loader. See `data`."""
+
+    _offscreen: Optional[list[Control]]
+
+    def __init__(self, page: Page, navigator: Union['PublicFletNavigator', 'VirtualFletNavigator'], arguments: Arguments, parameters: 'RouteParameters', route_id: tuple[int, str]) -> None:
+        """Initialize a RouteContext instance."""
+        self.page = page
+
+        self.navigator = navigator
+
+        self.arguments = arguments
+
+        self.parameters = parameters
+
+        self.route_id = route_id
+
+        self.loader_future = self._offscreen = None
+
+    def add(self, *controls: Control) -> None:
+        """Add one or more controls to the current page (or to the layout outlet, if the route has a layout)."""
+        if self._offscreen is not None:
+            self._offscreen.extend(controls)
+
+        elif self.navigator._render_target is not None:
+            self.navigator._render_target.controls.extend(controls)
+
+            # After the render (e.g. from an event handler), only the outlet is sent to the client.
+            if not self.navigator._rendering:
+                self.page.update(self.navigator._render_target)
+
+        elif self.navigator._batching:
+            self.page.controls.extend(controls)
+
+        else:
+            self.page.add(*controls)
+
+    def navigate(self, route: str, args: Arguments=(), **parameters: RouteParameters) -> None:
+        """Navigate to a specific route. If the navigator is virtual, parameters are not used. Ignored while the page is prerendered."""
+        if self._offscreen is not None:
+            return
+
+        if self.navigator.virtual:
+            self.navigator.navigate(route, self.page, args)
+
+        else:
+            self.navigator.navigate(route, self.page, args, parameters)
+
+    def navigate_homepage(self, args: Arguments=(), **parameters: RouteParameters) -> None:
+        """Navigate to the homepage. If the navigator is virtual, parameters are not used. Ignored while the page is prerendered."""
+        if self._offscreen is not None:
+            return
+
+        if self.navigator.virtual:
+            self.navigator.navigate_homepage(self.page, args)
+
+        else:
+            self.navigator.navigate_homepage(self.page, args, parameters)
+
+    def navigate_back(self, args: Arguments=(), **parameters: RouteParameters) -> None:
+        """Navigate back to the previous route. If the navigator is virtual, parameters are not used. Ignored while the page is prerendered."""
+        if self._offscreen is not None:
+            return
+
+        if self.navigator.virtual:
+            self.navigator.navigate_back(self.page, args)
+
+        else:
+            self.navigator.navigate_back(self.page, args, parameters)
+
+    def navigate_forward(self, args: Arguments=(), **parameters: RouteParameters) -> None:
+        """Navigate forward to the route left by `navigate_back`. If the navigator is virtual, parameters are not used. Ignored while the page is prerendered."""
+        if self._offscreen is not None:
+            return
+
+        if self.navigator.virtual:
+            self.navigator.navigate_forward(self.page, args)
+
+        else:
+            self.navigator.navigate_forward(self.page, args, parameters)
+
+    def set_homepage(self, homepage: str) -> None:
+        """Update navigator's homepage address. Ignored while the page is prerendered."""
+        if self._offscreen is not None:
+            return
+
+        self.navigator.set_homepage(homepage)
+
+    def spec_cpage_props(self, **props: dict[str, Any]) -> None:
+        """Specify current page properties."""
+        self.navigator.props_map[self.route_id] = props
+
+        if self._offscreen is not None:
+            return
+
+        applied = self.navigator._applied_props
+
+        changed_props = props if applied is None else {prop: prop_value for prop, prop_value in props.items() if applied.get(prop, ...) is not prop_value}
+
+        AbstractFletNavigator.proc_page_props(self.page, changed_props, ())
+
+        if applied is not None:
+            applied.update(props)
+
+        if not self.navigator._batching:
+            self.page.update()
+
+        # A batched render sends changed page properties with a full page update rather than just the outlet.
+        elif changed_props:
+            self.navigator._update_target = None
+
+    def current_route(self) -> str:
+        """Get the navigator's current route state."""
+        return self.navigator.route
+
+    def data(self, timeout: Optional[float]=None) -> Any:
+        """Get the result of the route's data loader, waiting for it if it's still loading. Returns `None` if the route has no loader.
+
+        The loader is started as soon as the navigation is requested, so it usually runs while the page is being built."""
+        return None if self.loader_future is None else self.loader_future.result(timeout)
+
+    async def data_async(self) -> Any:
+        """Await the result of the route's data loader (for async pages). Returns `None` if the route has no loader."""
+        return None if self.loader_future is None else await wrap_future(self.loader_future)
+
+    def __repr__(self) -> str:
+        """Represent the RouteContext instance as a string for debugging purposes."""
+        return f'{self.previous_page} -> {self.navigator.route} [{"NO-ARGUMENTS" if not self.arguments else self.arguments}, {"NO-PARAMETERS" if len(self.parameters) <= 0 else self.parameters}] ({self.route_id}) (NAVIGATOR-OBJECT {self.navigator})'
+
+
+class AbstractFletNavigator:
+    @staticmethod
+    def init_nav(nav: Union['VirtualFletNavigator', 'PublicFletNavigator'], page: Page=None, routes: Routes={}, route_change_callback: RouteChangeCallback=None) -> None:
+        basicConfig(format=f'%(name)s %(levelname)s: %(message)s')
+
+        nav._logger = getLogger(f'FN')
+
+        if nav._logger.level != ERROR:
+            nav._logger.setLevel(ERROR)
+
+        nav.page = page
+
+        nav.virtual = not page
+
+        nav.route = '/'
+
+        nav.routes = routes
+
+        AbstractFletNavigator.compile_routes(nav)
+
+        nav.props_map = _RoutePropertiesMap()
+
+        nav._applied_props = None
+
+        nav.route_change_callback = route_change_callback
+
+        if not nav.virtual:
+            page.on_route_change = nav.fn_route_change_handler_
+
+        nav._returning = nav._history_pushed = False
+
+        nav.arguments_store = ArgumentStore()
+
+        nav._arguments_token = None
+
+        nav.previous_routes = NavigationHistory()
+
+        nav._route_parameters = {}
+
+        nav._keep_alive_cache = None
+
+        nav._keep_alive_size = 0
+
+        nav._lazy_prefetched = False
+
+        nav._render_generation = 0
+
+        nav._render_future = nav._render_awaitable = None
+
+        nav._pending_navigation = None
+
+        nav._batching = nav._rendering = False
+
+        nav._template_cache = None
+
+        nav._profiled_route = None
+
+        nav._mounted_layouts = []
+
+        nav._render_target = nav._update_target = None
+
+        nav._transitions = nav._prerendered = nav._last_route_pattern = None
+
+        nav._prerender_size = 0
+
+        nav._prerender_stats = [0, 0]
+
+        nav._loader_cache = nav._pending_loader = None
+
+        nav._guard_decisions = None
+
+        nav._guard_redirects = 0
+
+    @staticmethod
+    def compile_routes(nav: Union['VirtualFletNavigator', 'PublicFletNavigator']) -> None:
+        if not isinstance(nav.routes, RouteRegistry):
+            nav.routes = _fn_shared_route_registry(nav.routes)
+
+    @staticmethod
+    def add_routes(nav: Union['VirtualFletNavigator', 'PublicFletNavigator'], routes: Routes) -> None:
+        nav.routes = nav.routes.with_routes(routes)
+
+    @staticmethod
+    def resolve_route(nav: Union['VirtualFletNavigator', 'PublicFletNavigator'], path: str) -> Optional[tuple[str, RouteParameters]]:
+        return nav.routes.table.resolve(path)
+
+    @staticmethod
+    def navigate(nav: Union['VirtualFletNavigator', 'PublicFletNavigator'], route: str, page: Page, args: Arguments=(), parameters: RouteParameters={}) -> None:
+        if nav.virtual and '?' in route:
+            route = route.split('?')[0]
+
+            nav._logger.error('VirtualFletNavigator does not support URL parameters. Use page arguments instead, or switch to PublicFletNavigator for full URL parameters support.')
+
+        if nav.coalesce_window is not None:
+            flush_scheduled = nav._pending_navigation is not None
+
+            if not flush_scheduled and not nav._returning:
+                nav.previous_routes.push(nav.route, nav._route_parameters, nav._arguments_token)
+
+                nav._history_pushed = True
+
+            nav.route = route
+
+            nav._pending_navigation = (route, page, args, parameters)
+
+            if not flush_scheduled:
+                page.run_task(AbstractFletNavigator.flush_navigation, nav, nav.coalesce_window)
+
+            return
+
+        if not nav._returning:
+            nav.previous_routes.push(nav.route, nav._route_parameters, nav._arguments_token)
+
+            nav._history_pushed = True
+
+        AbstractFletNavigator.go(nav, route, page, args, parameters)
+
+    @staticmethod
+    def go(nav: Union['VirtualFletNavigator', 'PublicFletNavigator'], route: str, page: Page, args: Arguments=(), parameters: RouteParameters={}) -> None:
+        nav.route = route
+
+        if _route_loaders:
+            AbstractFletNavigator.preload_route_data(nav, page, route, parameters)
+
+        token = nav.arguments_store.put(args)
+
+        if not nav.virtual:
+            if route == '/' and parameters:
+                nav._logger.error('Index/Main route does not support parameters; parameters transferring skipped.')
+
+            url = route if route == '/' else AbstractFletNavigator.fparams(route, **parameters)
+
+            # The arguments wait for the route change event of this very URL, so overlapping navigations keep their own.
+            if not _fn_no_arguments(args):
+                nav.arguments_store.hand_off(_fn_parse_route(url), token, args)
+
+            page.go(url)
+
+        else:
+            nav._arguments_token = token
+
+            AbstractFletNavigator.process(nav, page, args, {}, route)
+
+    @staticmethod
+    async def flush_navigation(nav: Union['VirtualFletNavigator', 'PublicFletNavigator'], window: float) -> None:
+        await sleep(window)
+
+        pending_navigation, nav._pending_navigation = nav._pending_navigation, None
+
+        if pending_navigation is None:
+            return
+
+        route, page, args, parameters = pending_navigation
+
+        # Page definitions are synchronous by default, so the single coalesced render runs outside of the event loop.
+        await get_running_loop().run_in_executor(None, AbstractFletNavigator.go, nav, route, page, args, parameters)
+
+    @staticmethod
+    def navigate_homepage(nav: Union['VirtualFletNavigator', 'PublicFletNavigator'], page: Page, args: Arguments=(), parameters: RouteParameters={}) -> None:
+        AbstractFletNavigator.navigate(nav, nav.homepage, page, args, parameters)
+
+    @staticmethod
+    def set_homepage(nav: Union['VirtualFletNavigator', 'PublicFletNavigator'], homepage: str) -> None:
+        if homepage not in nav.routes:
+            nav._logger.error('Can\'t update homepage address: invalid route.')
+
+            return
+
+        nav.homepage = homepage
+
+    @staticmethod
+    def navigate_back(nav: Union['VirtualFletNavigator', 'PublicFletNavigator'], page: Page, args: Arguments=(), parameters: RouteParameters={}) -> None:
+        AbstractFletNavigator.navigate_history(nav, nav.previous_routes.back, page, args, parameters)
+
+    @staticmethod
+    def navigate_forward(nav: Union['VirtualFletNavigator', 'PublicFletNavigator'], page: Page, args: Arguments=(), parameters: RouteParameters={}) -> None:
+        AbstractFletNavigator.navigate_history(nav, nav.previous_routes.forward, page, args, parameters)
+
+    @staticmethod
+    def navigate_history(nav: Union['VirtualFletNavigator', 'PublicFletNavigator'], step: Callable[[str, RouteParameters, Optional[int]], Optional[tuple[str, RouteParameters, Optional[int]]]], page: Page, args: Arguments=(), parameters: RouteParameters={}) -> None:
+        history_entry = step(nav.route, nav._route_parameters, nav._arguments_token)
+
+        if history_entry:
+            nav._returning = True
+
+            # Without explicit parameters and arguments, the ones the route was visited with are restored (if still retained).
+            AbstractFletNavigator.navigate(nav, history_entry[0], page, nav.arguments_store.get(history_entry[2]) if _fn_no_arguments(args) else args, parameters or history_entry[1])
+
+            nav._returning = False
+
+    @staticmethod
+    def restore_history(nav: Union['VirtualFletNavigator', 'PublicFletNavigator'], history: list[Union[str, tuple[str, RouteParameters]]], page: Page, args: Arguments=()) -> None:
+        restored_history = []
+
+        # Every entry is parsed and validated before anything is pushed or rendered; invalid entries are skipped.
+        for history_entry in history:
+            route, parameters = (history_entry, {}) if isinstance(history_entry, str) else history_entry
+
+            if nav.virtual:
+                if parameters or '?' in route:
+                    route, parameters = route.split('?')[0], {}
+
+                    nav._logger.error('VirtualFletNavigator does not support URL parameters. Use page arguments instead, or switch to PublicFletNavigator for full URL parameters support.')
+
+            elif route != '/':
+                route, query_parameters = _fn_parse_route(AbstractFletNavigator.fparams(route, **parameters))
+
+                parameters = dict(query_parameters)
+
+            if not nav.routes.table.dispatch(route):
+                nav._logger.error(f'Route "{route}" does not exist in the defined routes. Unable to restore it.')
+
+                continue
+
+            restored_history.append((route, parameters))
+
+        if not restored_history:
+            return
+
+        nav.previous_routes.push_many([(nav.route, nav._route_parameters, nav._arguments_token), *restored_history[:-1]])
+
+        AbstractFletNavigator.go(nav, restored_history[-1][0], page, args, restored_history[-1][1])
+
+    @staticmethod
+    def process(nav: Union['VirtualFletNavigator', 'PublicFletNavigator'], page: Page, args: Arguments=(), route_parameters: RouteParameters={}, route: Optional[str]=None) -> None:
+        # Coalesced navigations are processed off the UI thread, where `nav.route` may already hold the next navigation: they pass their own route.
+        route = nav.route if route is None else route
+
+        AbstractFletNavigator.cancel_render(nav)
+
+        nav._batching = nav.batch_updates
+
+        nav._rendering = True
+
+        nav._render_target = nav._update_target = None
+
+        nav._route_parameters = route_parameters
+
+        # Whether this navigation pushed a history entry (route changes from the browser don't), so a guard can take it back.
+        history_pushed, nav._history_pushed = nav._history_pushed, False
+
+        dispatch_entry = nav.routes.table.dispatch(route)
+
+        profiler = nav.profiler
+
+        if profiler:
+            nav._profiled_route = dispatch_entry[0] if dispatch_entry else ROUTE_404
+
+            phase_started = perf_counter()
+
+        if not dispatch_entry:
+            nav._mounted_layouts = []
+
+            page.controls.clear() if nav._batching else page.clean()
+
+            if profiler: phase_started = profiler.record(ROUTE_404, 'clean', phase_started)
+
+            r404_rctx_inst = RouteContext(page, nav, args, route_parameters, ROUTE_404)
+
+            if ROUTE_404 in nav.routes:
+                AbstractFletNavigator.apply_page_props(nav, page, nav.props_map.get(ROUTE_404))
+
+                if profiler: profiler.record(ROUTE_404, 'props', phase_started)
+
+            AbstractFletNavigator.render(nav, page, nav.routes.get(ROUTE_404, _DEFAULT_PAGE_404), r404_rctx_inst, ROUTE_404, None)
+
+            nav._logger.error(f'Route "{route}" does not exist in the defined routes. Unable to process the page.')
+
+        else:
+            route_pattern, route_id, page_definition, path_parameters = dispatch_entry
+
+            # Path parameters are parsed into a fresh dictionary, so it's reused when there are no URL parameters.
+            if path_parameters:
+                route_parameters = {**route_parameters, **path_parameters} if route_parameters else path_parameters
+
+            nxrctx = RouteContext(page, nav, args, route_parameters, route_id)
+
+            guard_chain = _fn_guard_chain(route_pattern)
+
+            # A redirecting guard navigates away before anything of the guarded page is cleaned or rendered.
+            if guard_chain:
+                generation = nav._render_generation
+
+                if AbstractFletNavigator.run_guards(nav, page, guard_chain, nxrctx, route_pattern, history_pushed):
+                    # A redirect that was processed right away owns the render state now; otherwise nothing will finish this render.
+                    if generation == nav._render_generation:
+                        AbstractFletNavigator.abort_render(nav)
+
+                    return
+
+            if profiler and guard_chain: phase_started = profiler.record(route_pattern, 'guard', phase_started)
+
+            layout_chain = _fn_layout_chain(route_pattern)
+
+            mounted_layouts = AbstractFletNavigator.reusable_layouts(nav, page, layout_chain)
+
+            if mounted_layouts:
+                nav._render_target = nav._update_target = mounted_layouts[-1][1]
+
+                nav._render_target.controls.clear()
+
+            else:
+                page.controls.clear() if nav._batching else page.clean()
+
+            if profiler: phase_started = profiler.record(route_pattern, 'clean', phase_started)
+
+            # Changed page properties only reach the client with a full page update, not with the outlet.
+            if AbstractFletNavigator.apply_page_props(nav, page, nav.props_map.get(route_id)):
+                nav._update_target = None
+
+            if profiler: profiler.record(route_pattern, 'props', phase_started)
+
+            if route_pattern in _route_loaders:
+                nxrctx.loader_future = AbstractFletNavigator.load_route_data(nav, page, route_pattern, route_parameters)
+
+            for layout_prefix in layout_chain[len(mounted_layouts):]:
+                try:
+                    _global_layouts[layout_prefix](nxrctx, outlet := Column(expand=True))
+                except BaseException:
+                    AbstractFletNavigator.abort_render(nav)
+
+                    raise
+
+                mounted_layouts.append((layout_prefix, outlet))
+
+                nav._render_target = outlet
+
+            nav._mounted_layouts = mounted_layouts
+
+            # Trees built from page arguments are neither reused nor kept: the arguments aren't a part of the key.
+            keep_alive_key = (route, tuple(sorted(route_parameters.items()))) \
+                if nav.keep_alive and route_pattern not in nav.keep_alive_exclude and _fn_no_arguments(args) else None
+
+            if keep_alive_key and nav._keep_alive_cache and keep_alive_key in nav._keep_alive_cache:
+                nav._keep_alive_cache.move_to_end(keep_alive_key)
+
+                (page if nav._render_target is None else nav._render_target).controls.extend(nav._keep_alive_cache[keep_alive_key][0])
+
+                AbstractFletNavigator.finish_render(nav, page, nxrctx, route_pattern, None)
+
+            elif nav.prerender and (prerendered := AbstractFletNavigator.take_prerendered(nav, page, route_pattern, route_parameters, args)) is not None:
+                prerendered_controls, prerendered_context = prerendered
+
+                prerendered_context.loader_future = nxrctx.loader_future
+
+                (page if nav._render_target is None else nav._render_target).controls.extend(prerendered_controls)
+
+                AbstractFletNavigator.finish_render(nav, page, prerendered_context, route_pattern, keep_alive_key)
+
+            else:
+                AbstractFletNavigator.render(nav, page, page_definition, nxrctx, route_pattern, keep_alive_key)
+
+    @staticmethod
+    def run_guards(nav: Union['VirtualFletNavigator', 'PublicFletNavigator'], page: Page, guard_chain: tuple[tuple[RouteGuard, float], ...], route_context: RouteContext, route_pattern: str, history_pushed: bool) -> bool:
+        parameters_key = tuple(sorted(route_context.parameters.items())) if route_context.parameters else ()
+
+        for guard_definition, ttl in guard_chain:
+            if ttl > 0:
+                if nav._guard_decisions is None:
+                    nav._guard_decisions = {}
+
+                decision_key = (guard_definition, route_pattern, parameters_key)
+
+                memoized_decision = nav._guard_decisions.get(decision_key)
+
+                if memoized_decision and memoized_decision[0] > monotonic():
+                    decision = memoized_decision[1]
+
+                else:
+                    decision = guard_definition(route_context)
+
+                    nav._guard_decisions.pop(decision_key, None)
+
+                    nav._guard_decisions[decision_key] = (monotonic() + ttl, decision)
+
+                    if len(nav._guard_decisions) > 256:
+                        nav._guard_decisions.pop(next(iter(nav._guard_decisions)))
+
+            else:
+                decision = guard_definition(route_context)
+
+            if decision is None or decision is True:
+                continue
+
+            if nav._guard_redirects >= 8:
+                nav._logger.error(f'Too many guard redirects while navigating to "{nav.route}"; the navigation is stopped.')
+
+                return True
+
+            redirect_route = nav.homepage if decision is False else decision
+
+            returning, nav._returning = nav._returning, True
+
+            nav._guard_redirects += 1
+
+            # The entry pushed by the rejected navigation is the route it came from, so it's real history,
+            # unless the guard redirects right back to it (e.g. `login` -> `admin` -> `login`): then it's taken back.
+            if history_pushed and nav.previous_routes.back_entries and nav.previous_routes.back_entries[-1][0] == redirect_route:
+                nav.previous_routes.back_entries.pop()
+
+            # The guarded route is replaced by the redirect target rather than pushed to the history.
+            try:
+                AbstractFletNavigator.navigate(nav, redirect_route, page)
+            finally:
+                nav._returning = returning
+
+                nav._guard_redirects -= 1
+
+            return True
+
+        return False
+
+    @staticmethod
+    def invalidate_guards(nav: Union['VirtualFletNavigator', 'PublicFletNavigator']) -> None:
+        nav._guard_decisions = None
+
+    @staticmethod
+    def reusable_layouts(nav: Union['VirtualFletNavigator', 'PublicFletNavigator'], page: Page, layout_chain: tuple[str, ...]) -> list[tuple[str, Column]]:
+        reusable = []
+
+        # The page was cleaned outside of the navigator: nothing is mounted anymore.
+        if not page.controls:
+            return reusable
+
+        for mounted_layout, layout_prefix in zip(nav._mounted_layouts, layout_chain):
+            if mounted_layout[0] != layout_prefix:
+                break
+
+            reusable.append(mounted_layout)
+
+        return reusable
+
+    @staticmethod
+    def render(nav: Union['VirtualFletNavigator', 'PublicFletNavigator'], page: Page, page_definition: PageDefinition, route_context: RouteContext, route_pattern: str, keep_alive_key: Optional[tuple[str, tuple]]) -> None:
+        if nav.profiler:
+            render_started = perf_counter()
+
+        try:
+            rendering = page_definition(route_context)
+        except BaseException:
+            AbstractFletNavigator.abort_render(nav)
+
+            raise
+
+        if not isawaitable(rendering):
+            if nav.profiler: nav.profiler.record(nav._profiled_route, 'render', render_started)
+
+            AbstractFletNavigator.finish_render(nav, page, route_context, route_pattern, keep_alive_key)
+
+            return
+
+        nav._render_awaitable = rendering
+
+        nav._render_future = page.run_task(AbstractFletNavigator.render_async, nav, page, nav._render_generation, rendering, route_context, route_pattern, keep_alive_key)
+
+    @staticmethod
+    async def render_async(nav: Union['VirtualFletNavigator', 'PublicFletNavigator'], page: Page, generation: int, rendering: Any, route_context: RouteContext, route_pattern: str, keep_alive_key: Optional[tuple[str, tuple]]) -> None:
+        if generation != nav._render_generation:
+            if iscoroutine(rendering) and getcoroutinestate(rendering) == CORO_CREATED:
+                rendering.close()
+
+            return
+
+        if nav.profiler:
+            render_started = perf_counter()
+
+        try:
+            await rendering
+        except BaseException:
+            if generation == nav._render_generation:
+                AbstractFletNavigator.abort_render(nav)
+
+            raise
+
+        if generation == nav._render_generation:
+            if nav.profiler: nav.profiler.record(nav._profiled_route, 'render', render_started)
+
+            AbstractFletNavigator.finish_render(nav, page, route_context, route_pattern, keep_alive_key)
+
+    @staticmethod
+    def abort_render(nav: Union['VirtualFletNavigator', 'PublicFletNavigator']) -> None:
+        # The render failed, so `finish_render` won't run: controls added from now on (e.g. by event handlers) must be sent right away.
+        nav._batching = nav._rendering = False
+
+        nav._update_target = None
+
+    @staticmethod
+    def cancel_render(nav: Union['VirtualFletNavigator', 'PublicFletNavigator']) -> None:
+        nav._render_generation += 1
+
+        if nav._render_future is not None and not nav._render_future.done():
+            nav._render_future.cancel()
+
+            # The render may be cancelled before it starts; close it so it isn't reported as never awaited.
+            if iscoroutine(nav._render_awaitable) and getcoroutinestate(nav._render_awaitable) == CORO_CREATED:
+                try:
+                    nav._render_awaitable.close()
+                except ValueError:
+                    pass
+
+        nav._render_future = nav._render_awaitable = None
+
+    @staticmethod
+    def finish_render(nav: Union['VirtualFletNavigator', 'PublicFletNavigator'], page: Page, route_context: RouteContext, route_pattern: str, keep_alive_key: Optional[tuple[str, tuple]]) -> None:
+        if nav.leak_detector is not None:
+            nav.leak_detector.track(route_pattern, (page if nav._render_target is None else nav._render_target).controls)
+
+        if keep_alive_key:
+            AbstractFletNavigator.keep_alive_store(nav, keep_alive_key, list((page if nav._render_target is None else nav._render_target).controls))
+
+        profiler = nav.profiler
+
+        if profiler: phase_started = perf_counter()
+
+        # With persistent layouts, only the outlet holding the route content is sent to the client.
+        page.update(*(() if nav._update_target is None else (nav._update_target,)))
+
+        if profiler: phase_started = profiler.record(nav._profiled_route, 'update', phase_started)
+
+        nav._batching = nav._rendering = False
+
+        if nav.route_change_callback:
+            nav.route_change_callback(route_context)
+
+        # Subscribers get a snapshot, not the live context: queued ones run after the next navigation may have started.
+        if nav.events is not None:
+            nav.events.publish(RouteChangeEvent(nav.route, route_pattern, MappingProxyType(dict(route_context.parameters)), route_context.route_id, time_ns() / 1e9))
+
+        if profiler and (nav.route_change_callback or nav.events is not None):
+            profiler.record(nav._profiled_route, 'callback', phase_started)
+
+        if nav.lazy_prefetch and not nav._lazy_prefetched and route_pattern == nav.homepage:
+            AbstractFletNavigator.prefetch(nav, None if nav.lazy_prefetch is True else nav.lazy_prefetch)
+
+        if nav.prerender and route_pattern != ROUTE_404:
+            AbstractFletNavigator.learn_transition(nav, route_pattern)
+
+            page.run_task(AbstractFletNavigator.prerender_idle, nav, page, route_pattern, nav._render_generation)
+
+    @staticmethod
+    def learn_transition(nav: Union['VirtualFletNavigator', 'PublicFletNavigator'], route_pattern: str) -> None:
+        if nav._transitions is None:
+            nav._transitions = OrderedDict()
+
+            nav._prerendered = OrderedDict()
+
+            nav._prerender_lock = Lock()
+
+        previous_pattern, nav._last_route_pattern = nav._last_route_pattern, route_pattern
+
+        if previous_pattern is None or previous_pattern == route_pattern:
+            return
+
+        successors = nav._transitions.get(previous_pattern)
+
+        if successors is None:
+            successors = nav._transitions[previous_pattern] = Counter()
+
+            while len(nav._transitions) > nav.transition_table_limit:
+                nav._transitions.popitem(last=False)
+
+        nav._transitions.move_to_end(previous_pattern)
+
+        successors[route_pattern] += 1
+
+        if len(successors) > nav.transition_table_limit:
+            nav._transitions[previous_pattern] = Counter(dict(successors.most_common(nav.transition_table_limit // 2)))
+
+    @staticmethod
+    def likely_next_routes(nav: Union['VirtualFletNavigator', 'PublicFletNavigator'], route_pattern: str, count: int) -> list[str]:
+        successors = (nav._transitions or {}).get(route_pattern)
+
+        return [successor for successor, _ in successors.most_common(count)] if successors else []
+
+    @staticmethod
+    async def prerender_idle(nav: Union['VirtualFletNavigator', 'PublicFletNavigator'], page: Page, route_pattern: str, generation: int) -> None:
+        # Yield first, so the page update of the current render goes out before any speculative work.
+        await sleep(0)
+
+        for candidate in AbstractFletNavigator.likely_next_routes(nav, route_pattern, nav.prerender):
+            if generation != nav._render_generation:
+                return
+
+            # Routes with path parameters can't be predicted, and prerendered pages are never rebuilt until used.
+            if '<' in candidate or candidate in nav._prerendered or candidate not in nav.routes:
+                continue
+
+            # Guarded pages are never built before their guards run.
+            if _fn_guard_chain(candidate):
+                continue
+
+            await get_running_loop().run_in_executor(None, AbstractFletNavigator.prerender_route, nav, page, candidate)
+
+    @staticmethod
+    def prerender_route(nav: Union['VirtualFletNavigator', 'PublicFletNavigator'], page: Page, route_pattern: str) -> None:
+        # The page definition runs off the event loop, so it gets a detached page instead of the live one.
+        route_context = RouteContext(_OffscreenPage(page), nav, (), {}, hash(route_pattern))
+
+        route_context._offscreen = []
+
+        if route_pattern in _route_loaders:
+            route_context.loader_future = AbstractFletNavigator.load_route_data(nav, page, route_pattern, {}, True)
+
+        try:
+            rendering = nav.routes[route_pattern](route_context)
+        except Exception as prerender_exc:
+            nav._logger.error(f'Failed to prerender route "{route_pattern}": {prerender_exc}')
+
+            return
+
+        if isawaitable(rendering):
+            if iscoroutine(rendering):
+                rendering.close()
+
+            return
+
+        size = _fn_sizeof_tree(route_context._offscreen)
+
+        if size > nav.prerender_max_size:
+            return
+
+        with nav._prerender_lock:
+            nav._prerendered[route_pattern] = (route_context, size)
+
+            nav._prerender_size += size
+
+            while nav._prerender_size > nav.prerender_max_size:
+                nav._prerender_size -= nav._prerendered.popitem(last=False)[1][1]
+
+    @staticmethod
+    def take_prerendered(nav: Union['VirtualFletNavigator', 'PublicFletNavigator'], page: Page, route_pattern: str, route_parameters: RouteParameters, args: Arguments) -> Optional[tuple[list[Control], RouteContext]]:
+        prerendered = None
+
+        # Prerendered trees are built without parameters and arguments, so they can only stand in for such visits.
+        if nav._prerendered and not route_parameters and _fn_no_arguments(args):
+            with nav._prerender_lock:
+                if route_pattern in nav._prerendered:
+                    prerendered, size = nav._prerendered.pop(route_pattern)
+
+                    nav._prerender_size -= size
+
+        nav._prerender_stats[0 if prerendered is not None else 1] += 1
+
+        if prerendered is None:
+            return None
+
+        # The context goes live with its tree: later `add` and `spec_cpage_props` calls reach the real page.
+        controls, prerendered._offscreen = prerendered._offscreen, None
+
+        prerendered.page = page
+
+        return controls, prerendered
+
+    @staticmethod
+    def prerender_stats(nav: Union['VirtualFletNavigator', 'PublicFletNavigator']) -> dict[str, Any]:
+        hits, misses = nav._prerender_stats
+
+        return {
+            'hits': hits, 'misses': misses, 'hit_rate': hits / (hits + misses) if hits + misses else 0.0,
+            'prerendered': list(nav._prerendered or ()), 'size': nav._prerender_size
+        }
+
+    @staticmethod
+    def preload_route_data(nav: Union['VirtualFletNavigator', 'PublicFletNavigator'], page: Page, route: str, parameters: RouteParameters) -> None:
+        # The public navigator processes the route parsed back from the URL, so the loader is keyed the same way.
+        base_route, query_parameters = (route, ()) if nav.virtual or route == '/' else _fn_parse_route(AbstractFletNavigator.fparams(route, **parameters))
+
+        dispatch_entry = nav.routes.table.dispatch(base_route)
+
+        # Guarded routes start loading only after their guards let the navigation through.
+        if dispatch_entry and dispatch_entry[0] in _route_loaders and not _fn_guard_chain(dispatch_entry[0]):
+            AbstractFletNavigator.load_route_data(nav, page, dispatch_entry[0], {**dict(query_parameters), **(dispatch_entry[3] or {})}, True)
+
+    @staticmethod
+    def load_route_data(nav: Union['VirtualFletNavigator', 'PublicFletNavigator'], page: Page, route_pattern: str, route_parameters: RouteParameters, preload: bool=False) -> Future:
+        loader_key = (route_pattern, tuple(sorted(route_parameters.items())))
+
+        # A load started by the navigation request is handed to the render it was started for, even if its TTL is already over.
+        if not preload:
+            pending_loader, nav._pending_loader = nav._pending_loader, None
+
+            if pending_loader and pending_loader[0] == loader_key:
+                return pending_loader[1]
+
+        loader_definition, ttl, stale_while_revalidate = _route_loaders[route_pattern]
+
+        if nav._loader_cache is None:
+            nav._loader_cache = OrderedDict()
+
+            nav._loader_lock = RLock()
+
+        with nav._loader_lock:
+            # Entries are `[loaded_at, future, revalidating]`; `loaded_at` is `None` while the load is in flight.
+            cached = nav._loader_cache.get(loader_key)
+
+            age = None if not cached or cached[0] is None else monotonic() - cached[0]
+
+            if cached and (age is None or age <= ttl + stale_while_revalidate):
+                nav._loader_cache.move_to_end(loader_key)
+
+                if age is not None and age > ttl and not cached[2]:
+                    cached[2] = True
+
+                    AbstractFletNavigator.run_loader(nav, page, loader_definition, route_parameters).add_done_callback(
+                        lambda future: AbstractFletNavigator.loader_done(nav, loader_key, cached, future, True))
+
+                future = cached[1]
+
+            else:
+                future = AbstractFletNavigator.run_loader(nav, page, loader_definition, route_parameters)
+
+                nav._loader_cache[loader_key] = entry = [None, future, False]
+
+                while len(nav._loader_cache) > max(nav.loader_cache_limit, 1):
+                    nav._loader_cache.popitem(last=False)
+
+                future.add_done_callback(lambda future: AbstractFletNavigator.loader_done(nav, loader_key, entry, future, False))
+
+        if preload:
+            nav._pending_loader = (loader_key, future)
+
+        return future
+
+    @staticmethod
+    def run_loader(nav: Union['VirtualFletNavigator', 'PublicFletNavigator'], page: Page, loader_definition: LoaderDefinition, route_parameters: RouteParameters) -> Future:
+        if iscoroutinefunction(loader_definition):
+            return page.run_task(loader_definition, dict(route_parameters))
+
+        global _loader_executor
+
+        # One pool serves every session, so sessions never leave idle loader threads behind.
+        if _loader_executor is None:
+            with _loader_executor_lock:
+                if _loader_executor is None:
+                    _loader_executor = ThreadPoolExecutor(max(nav.loader_workers, 1), 'FN-loader')
+
+        return _loader_executor.submit(loader_definition, dict(route_parameters))
+
+    @staticmethod
+    def loader_done(nav: Union['VirtualFletNavigator', 'PublicFletNavigator'], loader_key: tuple[str, tuple], entry: list, future: Future, revalidation: bool) -> None:
+        failure = 'cancelled' if future.cancelled() else future.exception()
+
+        with nav._loader_lock:
+            if failure is not None:
+                nav._logger.error(f'Data loader of route "{loader_key[0]}" failed: {failure}')
+
+                # A failed revalidation keeps serving the stale result; a failed load is retried on the next visit.
+                if revalidation:
+                    entry[2] = False
+
+                elif nav._loader_cache.get(loader_key) is entry:
+                    del nav._loader_cache[loader_key]
+
+            elif revalidation:
+                if nav._loader_cache.get(loader_key) is entry:
+                    nav._loader_cache[loader_key] = [monotonic(), future, False]
+
+            else:
+                entry[0] = monotonic()
+
+    @staticmethod
+    def invalidate_route_data(nav: Union['VirtualFletNavigator', 'PublicFletNavigator'], route: Optional[str]=None) -> None:
+        if nav._loader_cache is None:
+            return
+
+        with nav._loader_lock:
+            for loader_key in [loader_key for loader_key in nav._loader_cache if route is None or loader_key[0] == route]:
+                del nav._loader_cache[loader_key]
+
+    @staticmethod
+    def prefetch(nav: Union['VirtualFletNavigator', 'PublicFletNavigator'], routes: Optional[tuple[str, ...]]=None) -> None:
+        nav._lazy_prefetched = True
+
+        lazy_pages = [nav.routes[route] for route in (nav.routes if routes is None else routes) \
+            if isinstance(nav.routes.get(route), LazyPageDefinition) and not nav.routes[route].loaded]
+
+        if not lazy_pages:
+            return
+
+        executor = ThreadPoolExecutor(max(nav.lazy_prefetch_workers, 1), 'FN-prefetch')
+
+        for lazy_page in lazy_pages:
+            executor.submit(lazy_page.load).add_done_callback(
+                lambda future, lazy_page=lazy_page: future.exception() and nav._logger.error(f'Failed to prefetch page "{lazy_page.path}": {future.exception()}')
+            )
+
+        executor.shutdown(wait=False)
+
+    @staticmethod
+    def import_timings(nav: Union['VirtualFletNavigator', 'PublicFletNavigator']) -> dict[str, float]:
+        return {route: page_definition.import_time for route, page_definition in nav.routes.items() \
+            if isinstance(page_definition, LazyPageDefinition) and page_definition.loaded}
+
+    @staticmethod
+    def keep_alive_store(nav: Union['VirtualFletNavigator', 'PublicFletNavigator'], key: tuple[str, tuple], controls: list[Control]) -> None:
+        size = _fn_sizeof_tree(controls)
+
+        if nav.keep_alive_max_size > 0 and size > nav.keep_alive_max_size:
+            nav._logger.error(f'Page "{key[0]}" is too large to be kept alive ({size} bytes); keep-alive skipped.')
+
+            return
+
+        if nav._keep_alive_cache is None:
+            nav._keep_alive_cache = OrderedDict()
+
+        nav._keep_alive_cache[key] = (controls, size)
+
+        nav._keep_alive_size += size
+
+        while len(nav._keep_alive_cache) > max(nav.keep_alive_limit, 0) or \
+                (nav.keep_alive_max_size > 0 and nav._keep_alive_size > nav.keep_alive_max_size):
+            nav._keep_alive_size -= nav._keep_alive_cache.popitem(last=False)[1][1]
+
+    @staticmethod
+    def discard_kept_alive(nav: Union['VirtualFletNavigator', 'PublicFletNavigator'], route: Optional[str]=None) -> None:
+        for key in [key for key in nav._keep_alive_cache or () if route is None or key[0] == route]:
+            nav._keep_alive_size -= nav._keep_alive_cache.pop(key)[1]
+
+    @staticmethod
+    def find_all_specified_props(routes: Routes, props_map: RouteProperties) -> tuple[str]:
+        total_props_specified = []
+
+        for route in routes:
+            route_id = hash(route)
+
+            if route_id in props_map:
+                total_props_specified += list(props_map[route_id].keys())
+
+        return tuple(total_props_specified)
+
+    @staticmethod
+    def proc_page_props(page: Page, props: RouteProperties, total_props: tuple[str]) -> None:
+        for prop in total_props:
+            setattr(page, prop, None)
+
+        if props:
+            for prop, prop_value in props.items():
+                setattr(page, prop, prop_value)
+
+    @staticmethod
+    def apply_page_props(nav: Union['VirtualFletNavigator', 'PublicFletNavigator'], page: Page, props: Optional[dict[str, Any]]) -> bool:
+        # Neither the outgoing nor the incoming page has properties: the applied state (an empty map) stays as is.
+        if not props and nav._applied_props == {}:
+            return False
+
+        props = props or {}
+
+        # Nothing is known about the page state before the first application, so every known property is reset once.
+        outgoing = nav._applied_props if nav._applied_props is not None else dict.fromkeys(nav.props_map.known_props, ...)
+
+        changed = False
+
+        for prop in outgoing:
+            if prop not in props:
+                setattr(page, prop, None)
+
+                changed = True
+
+        for prop, prop_value in props.items():
+            if outgoing.get(prop, ...) is not prop_value:
+                setattr(page, prop, prop_value)
+
+                changed = True
+
+        nav._applied_props = dict(props)
+
+        return changed
+
+    @staticmethod
+    def fparams(route: str, **_parameters: dict) -> str:
+        return f'{route}?{"&".join(f"{key}={value}" for key, value in _parameters.items())}' if len(_parameters) > 0 else route
+
+    @staticmethod
+    def is_virtual(nav: Union['VirtualFletNavigator', 'PublicFletNavigator']) -> bool:
+        return nav.virtual
+
+
+# The per-session navigator state lives in slots; the public options keep their class-level defaults,
+# so a navigator only allocates its `__dict__` once an option is set on it.
+_NAVIGATOR_STATE_SLOTS: tuple[str, ...] = (
+    'page', 'route', 'routes', 'props_map', 'previous_routes', 'arguments_store', 'route_change_callback',
+    'virtual', '_logger', '_arguments_token', '_returning', '_history_pushed', '_route_parameters', '_applied_props', '_batching', '_rendering',
+    '_render_generation', '_render_future', '_render_awaitable', '_render_target', '_update_target', '_mounted_layouts', '_pending_navigation',
+    '_keep_alive_cache', '_keep_alive_size', '_lazy_prefetched', '_template_cache', '_profiled_route',
+    '_transitions', '_prerendered', '_last_route_pattern', '_prerender_size', '_prerender_stats', '_prerender_lock',
+    '_loader_cache', '_pending_loader', '_loader_lock', '_guard_decisions', '_guard_redirects',
+    '__dict__', '__weakref__'
+)
+
+
+class PublicFletNavigator:
+    """The Public Flet Navigator. It's just like the virtual one, but with URL parameters and visible routes."""
+
+    __slots__ = _NAVIGATOR_STATE_SLOTS
+
+    page: Page
+    """Page object representing the current page."""
+
+    route: str
+    """The current active route."""
+
+    routes: RouteRegistry
+    """A map of all registered routes in the application (immutable and shared between navigators, see `add_routes`)."""
+
+    previous_routes: NavigationHistory
+    """The bounded history of previously visited routes, with a forward stack."""
+
+    arguments_store: ArgumentStore
+    """The store handing the page arguments over to their navigation and retaining them for back/forward navigation (see `ArgumentStore`)."""
+
+    homepage: str = '/'
+    """The homepage route."""
+
+    props_map: RouteProperties
+    """A page properties map for each page ID."""
+
+    route_change_callback: RouteChangeCallback
+    """A callback function that is triggered when the route changes."""
+
+    events: Optional[RouteEventBus] = None
+    """A route change event bus with any number of inline or queued subscribers (see `RouteEventBus`), or `None`. A bus can be shared between navigators."""
+
+    keep_alive: bool = False
+    """Reuse the built control trees on repeated visits (keyed by route and parameters) instead of rebuilding them. Visits with page arguments are always rebuilt."""
+
+    keep_alive_limit: int = 16
+    """The maximum number of kept-alive pages. The least recently used pages are evicted first."""
+
+    keep_alive_max_size: int = 0
+    """The approximate memory budget (in bytes) for kept-alive pages. Zero disables size-based eviction."""
+
+    keep_alive_exclude: tuple[str, ...] = ()
+    """Routes that are always rebuilt, even if keep-alive is enabled."""
+
+    lazy_prefetch: Union[bool, tuple[str, ...]] = False
+    """Import lazy routes in the background after the homepage renders: `True` for all lazy routes, or a tuple of the likely ones."""
+
+    lazy_prefetch_workers: int = 2
+    """The number of threads used for prefetching lazy routes."""
+
+    coalesce_window: Optional[float] = None
+    """Collapse navigations requested within this window (in seconds) into a single render. `0` coalesces navigations within one event-loop tick, `None` disables coalescing."""
+
+    batch_updates: bool = False
+    """Send the controls and the property changes of a render in a single `page.update` instead of several round trips."""
+
+    profiler: Optional[NavigationProfiler] = None
+    """A profiler timing every navigation phase (see `NavigationProfiler`), or `None` to disable profiling."""
+
+    leak_detector: Optional[ControlLeakDetector] = None
+    """A detector reporting routes whose control trees stay alive after navigating away (see `ControlLeakDetector`), or `None`."""
+
+    prerender: int = 0
+    """Learn which routes usually follow each route and prebuild this many likely next routes during idle time (`0` disables prerendering)."""
+
+    prerender_max_size: int = 4 * 1024 * 1024
+    """The approximate memory budget (in bytes) for prerendered pages."""
+
+    transition_table_limit: int = 256
+    """The maximum number of routes (and of successors per route) in the learned transition table."""
+
+    loader_cache_limit: int = 64
+    """The maximum number of cached route loader results (per route and parameters). The least recently used results are evicted first."""
+
+    loader_workers: int = 4
+    """The number of threads running synchronous route loaders. The thread pool is shared by all the navigators and sized by the first one that runs a loader. Async loaders run on the page's event loop."""
+
+    def __init__(self, page: Page, routes: Routes={}, route_change_callback: RouteChangeCallback=None) -> None:
+        """Initialize the public navigator."""
+        AbstractFletNavigator.init_nav(self, page, routes, route_change_callback)
+
+    @property
+    def history_limit(self) -> Optional[int]:
+        """The maximum navigation history depth (256 by default, `None` for unbounded)."""
+        return self.previous_routes.max_depth
+
+    @history_limit.setter
+    def history_limit(self, history_limit: Optional[int]) -> None:
+        self.previous_routes.max_depth = history_limit
+
+    def navigate(self, route: str, page: Page, args: Arguments=(), parameters: RouteParameters={}) -> None:
+        """Navigate to a specific route in the application."""
+        AbstractFletNavigator.navigate(self, route, page, args, parameters)
+
+    def navigate_homepage(self, page: Page, args: Arguments=(), parameters: RouteParameters={}) -> None:
+        """Navigate to the homepage route."""
+        AbstractFletNavigator.navigate_homepage(self, page, args, parameters)
+
+    def set_homepage(self, homepage: str) -> None:
+        """Update navigator's homepage address."""
+        AbstractFletNavigator.set_homepage(self, homepage)
+
+    def navigate_back(self, page: Page, args: Arguments=(), parameters: RouteParameters={}) -> None:
+        """Navigate back to the previous route."""
+        AbstractFletNavigator.navigate_back(self, page, args, parameters)
+
+    def navigate_forward(self, page: Page, args: Arguments=(), parameters: RouteParameters={}) -> None:
+        """Navigate forward to the route left by `navigate_back`."""
+        AbstractFletNavigator.navigate_forward(self, page, args, parameters)
+
+    def restore_history(self, history: list[Union[str, tuple[str, RouteParameters]]], page: Page, args: Arguments=()) -> None:
+        """Restore a navigation history (e.g. of a deep link or a saved session) in one step: routes or `(route, parameters)` pairs, oldest first.
+
+        It's equivalent to navigating to every route in turn, but only the last route is rendered."""
+        AbstractFletNavigator.restore_history(self, history, page, args)
+
+    def process(self, page: Page, args: Arguments=(), route_parameters: RouteParameters={}) -> None:
+        """Process the current route on the provided page."""
+        AbstractFletNavigator.process(self, page, args, route_parameters)
+
+    def discard_kept_alive(self, route: Optional[str]=None) -> None:
+        """Drop the kept-alive pages of the given route, or all of them if no route is specified."""
+        AbstractFletNavigator.discard_kept_alive(self, route)
+
+    def compile_routes(self) -> None:
+        """Validate and compile the routes. Call it after assigning a plain routes map to `routes`."""
+        AbstractFletNavigator.compile_routes(self)
+
+    def add_routes(self, routes: Routes) -> None:
+        """Add or replace routes for this navigator only. The shared registry is copied, not modified."""
+        AbstractFletNavigator.add_routes(self, routes)
+
+    def resolve_route(self, path: str) -> Optional[tuple[str, RouteParameters]]:
+        """Resolve a path to its route pattern and typed path parameters, or `None` if no route matches."""
+        return AbstractFletNavigator.resolve_route(self, path)
+
+    def prefetch(self, routes: Optional[tuple[str, ...]]=None) -> None:
+        """Import the given lazy routes (or all of them) in a background thread pool."""
+        AbstractFletNavigator.prefetch(self, routes)
+
+    def import_timings(self) -> dict[str, float]:
+        """Get the import time (in seconds) of every lazy route loaded so far."""
+        return AbstractFletNavigator.import_timings(self)
+
+    def prerender_stats(self) -> dict[str, Any]:
+        """Get the prerendering statistics: hits, misses, hit rate, prerendered routes and their approximate size."""
+        return AbstractFletNavigator.prerender_stats(self)
+
+    def invalidate_route_data(self, route: Optional[str]=None) -> None:
+        """Drop the cached loader results of the given route pattern, or all of them if no route is specified."""
+        AbstractFletNavigator.invalidate_route_data(self, route)
+
+    def invalidate_guards(self) -> None:
+        """Forget the memoized guard decisions of this session (e.g. after signing in or out)."""
+        AbstractFletNavigator.invalidate_guards(self)
+
+    def is_virtual(self) -> bool:
+        """Check if the navigator is virtual or public."""
+        return AbstractFletNavigator.is_virtual(self)
+
+    def fn_route_change_handler_(self, _) -> None:
+        if self.profiler: parse_started = perf_counter()
+
+        base_route, parameters = _fn_parse_route(self.page.route)
+
+        if self.profiler:
+            self.profiler.record(dispatched[0] if (dispatched := self.routes.table.dispatch(base_route)) else ROUTE_404, 'parse', parse_started)
+
+        self.route = base_route
+
+        if not globals().get('_FNDP404_CLOSED'):
+            setattr(self.page, 'horizontal_alignment', globals().get('_FNDP404_PRE_H_A')),
+            setattr(self.page, 'vertical_alignment', globals().get('_FNDP404_PRE_V_A')),
+
+        self._arguments_token, args = self.arguments_store.take((base_route, parameters))
+
+        AbstractFletNavigator.process(self, self.page, () if args is None else args, dict(parameters) if parameters else {}, base_route)
+
+
+class VirtualFletNavigator:
+    """The Virtual Flet Navigator. It's just like the public one, but without URL parameters and visible routes."""
+
+    __slots__ = _NAVIGATOR_STATE_SLOTS
+
+    route: str
+    """The current active route."""
+
+    routes: RouteRegistry
+    """A map of all registered routes in the application (immutable and shared between navigators, see `add_routes`)."""
+
+    previous_routes: NavigationHistory
+    """The bounded history of previously visited routes, with a forward stack."""
+
+    arguments_store: ArgumentStore
+    """The store handing the page arguments over to their navigation and retaining them for back/forward navigation (see `ArgumentStore`)."""
+
+    homepage: str = '/'
+    """The homepage route."""
+
+    props_map: RouteProperties
+    """A page properties map for each page ID."""
+
+    route_change_callback: RouteChangeCallback
+    """A callback function that is triggered when the route changes."""
+
+    events: Optional[RouteEventBus] = None
+    """A route change event bus with any number of inline or queued subscribers (see `RouteEventBus`), or `None`. A bus can be shared between navigators."""
+
+    keep_alive: bool = False
+    """Reuse the built control trees on repeated visits (keyed by route and parameters) instead of rebuilding them. Visits with page arguments are always rebuilt."""
+
+    keep_alive_limit: int = 16
+    """The maximum number of kept-alive pages. The least recently used pages are evicted first."""
+
+    keep_alive_max_size: int = 0
+    """The approximate memory budget (in bytes) for kept-alive pages. Zero disables size-based eviction."""
+
+    keep_alive_exclude: tuple[str, ...] = ()
+    """Routes that are always rebuilt, even if keep-alive is enabled."""
+
+    lazy_prefetch: Union[bool, tuple[str, ...]] = False
+    """Import lazy routes in the background after the homepage renders: `True` for all lazy routes, or a tuple of the likely ones."""
+
+    lazy_prefetch_workers: int = 2
+    """The number of threads used for prefetching lazy routes."""
+
+    coalesce_window: Optional[float] = None
+    """Collapse navigations requested within this window (in seconds) into a single render. `0` coalesces navigations within one event-loop tick, `None` disables coalescing."""
+
+    batch_updates: bool = False
+    """Send the controls and the property changes of a render in a single `page.update` instead of several round trips."""
+
+    profiler: Optional[NavigationProfiler] = None
+    """A profiler timing every navigation phase (see `NavigationProfiler`), or `None` to disable profiling."""
+
+    leak_detector: Optional[ControlLeakDetector] = None
+    """A detector reporting routes whose control trees stay alive after navigating away (see `ControlLeakDetector`), or `None`."""
+
+    prerender: int = 0
+    """Learn which routes usually follow each route and prebuild this many likely next routes during idle time (`0` disables prerendering)."""
+
+    prerender_max_size: int = 4 * 1024 * 1024
+    """The approximate memory budget (in bytes) for prerendered pages."""
+
+    transition_table_limit: int = 256
+    """The maximum number of routes (and of successors per route) in the learned transition table."""
+
+    loader_cache_limit: int = 64
+    """The maximum number of cached route loader results (per route and parameters). The least recently used results are evicted first."""
+
+    loader_workers: int = 4
+    """The number of threads running synchronous route loaders. The thread pool is shared by all the navigators and sized by the first one that runs a loader. Async loaders run on the page's event loop."""
+
+    def __init__(self, routes: Routes={}, route_change_callback: RouteChangeCallback=None) -> None:
+        """Initialize the virtual navigator."""
+        AbstractFletNavigator.init_nav(self, None, routes, route_change_callback)
+
+    @property
+    def history_limit(self) -> Optional[int]:
+        """The maximum navigation history depth (256 by default, `None` for unbounded)."""
+        return self.previous_routes.max_depth
+
+    @history_limit.setter
+    def history_limit(self, history_limit: Optional[int]) -> None:
+        self.previous_routes.max_depth = history_limit
+
+    def navigate(self, route: str, page: Page, args: Arguments=()) -> None:
+        """Navigate to a specific route in the application."""
+        AbstractFletNavigator.navigate(self, route, page, args)
+
+    def navigate_homepage(self, page: Page, args: Arguments=()) -> None:
+        """Navigate to the homepage route."""
+        AbstractFletNavigator.navigate_homepage(self, page, args)
+
+    def set_homepage(self, homepage: str) -> None:
+        """Update navigator's homepage address."""
+        AbstractFletNavigator.set_homepage(self, homepage)
+
+    def navigate_back(self, page: Page, args: Arguments=()) -> None:
+        """Navigate back to the previous route."""
+        AbstractFletNavigator.navigate_back(self, page, args)
+
+    def navigate_forward(self, page: Page, args: Arguments=()) -> None:
+        """Navigate forward to the route left by `navigate_back`."""
+        AbstractFletNavigator.navigate_forward(self, page, args)
+
+    def restore_history(self, history: list[str], page: Page, args: Arguments=()) -> None:
+        """Restore a navigation history (e.g. of a saved session) in one step: routes, oldest first.
+
+        It's equivalent to navigating to every route in turn, but only the last route is rendered."""
+        AbstractFletNavigator.restore_history(self, history, page, args)
+
+    def process(self, page: Page, args: Arguments=()) -> None:
+        """Process the current route on the provided page."""
+        AbstractFletNavigator.process(self, page, args)
+
+    def discard_kept_alive(self, route: Optional[str]=None) -> None:
+        """Drop the kept-alive pages of the given route, or all of them if no route is specified."""
+        AbstractFletNavigator.discard_kept_alive(self, route)
+
+    def compile_routes(self) -> None:
+        """Validate and compile the routes. Call it after assigning a plain routes map to `routes`."""
+        AbstractFletNavigator.compile_routes(self)
+
+    def add_routes(self, routes: Routes) -> None:
+        """Add or replace routes for this navigator only. The shared registry is copied, not modified."""
+        AbstractFletNavigator.add_routes(self, routes)
+
+    def resolve_route(self, path: str) -> Optional[tuple[str, RouteParameters]]:
+        """Resolve a path to its route pattern and typed path parameters, or `None` if no route matches."""
+        return AbstractFletNavigator.resolve_route(self, path)
+
+    def prefetch(self, routes: Optional[tuple[str, ...]]=None) -> None:
+        """Import the given lazy routes (or all of them) in a background thread pool."""
+        AbstractFletNavigator.prefetch(self, routes)
+
+    def import_timings(self) -> dict[str, float]:
+        """Get the import time (in seconds) of every lazy route loaded so far."""
+        return AbstractFletNavigator.import_timings(self)
+
+    def prerender_stats(self) -> dict[str, Any]:
+        """Get the prerendering statistics: hits, misses, hit rate, prerendered routes and their approximate size."""
+        return AbstractFletNavigator.prerender_stats(self)
+
+    def invalidate_route_data(self, route: Optional[str]=None) -> None:
+        """Drop the cached loader results of the given route pattern, or all of them if no route is specified."""
+        AbstractFletNavigator.invalidate_route_data(self, route)
+
+    def invalidate_guards(self) -> None:
+        """Forget the memoized guard decisions of this session (e.g. after signing in or out)."""
+        AbstractFletNavigator.invalidate_guards(self)
+
+    def is_virtual(self) -> bool:
+        """Check if the navigator is virtual or public."""
+        return AbstractFletNavigator.is_virtual(self)
+
+
+class HeadlessPage:
+    """A headless, in-memory stand-in for the `Page` surface used by the navigators.
+
+    It lets navigators run (and be measured) without a Flet client: controls are kept in a list,
+    `go` triggers `on_route_change` synchronously and `run_task` runs coroutines on a private background event loop.
+    `updates` and `cleans` count the round trips a real page would send to the client."""
+
+    route: str = '/'
+    """The current page route."""
+
+    on_route_change: Optional[Callable[[Any], None]] = None
+    """The route change event handler."""
+
+    horizontal_alignment: Any = None
+    """The page horizontal alignment."""
+
+    vertical_alignment: Any = None
+    """The page vertical alignment."""
+
+    def __init__(self, route: str='/') -> None:
+        """Initialize an empty headless page."""
+        self.route = route
+
+        self.controls: list[Control] = []
+
+        self.updates = 0
+
+        self.cleans = 0
+
+        self._loop: Optional[AbstractEventLoop] = None
+
+    def add(self, *controls: Control) -> None:
+        """Add controls to the page and update it."""
+        self.controls.extend(controls)
+
+        self.update()
+
+    def clean(self) -> None:
+        """Remove all the controls from the page."""
+        self.controls.clear()
+
+        self.cleans += 1
+
+    def update(self, *_controls: Control) -> None:
+        """Count a page update."""
+        self.updates += 1
+
+    def go(self, route: str) -> None:
+        """Change the page route and dispatch the route change event."""
+        self.route = route
+
+        if self.on_route_change:
+            self.on_route_change(SimpleNamespace(route=route, page=self))
+
+    def run_task(self, handler: Callable[..., Coroutine], *args: Any) -> Future:
+        """Run a coroutine function on the page's background event loop."""
+        if self._loop is None:
+            self._loop = new_event_loop()
+
+            Thread(target=self._loop.run_forever, name='FN-headless-page', daemon=True).start()
+
+        return run_coroutine_threadsafe(handler(*args), self._loop)
+
+
+class _OffscreenPage(HeadlessPage):
+    """The detached page handed to prerendered pages.
+
+    Controls, updates and route changes stay offscreen, tasks run on the live page
+    and plain values (sizes, theme mode, ...) are read from the live page."""
+
+    def __init__(self, live_page: Page) -> None:
+        self._live_page = live_page
+
+        super().__init__(getattr(live_page, 'route', '/'))
+
+    def __getattr__(self, name: str) -> Any:
+        value = getattr(self._live_page, name)
+
+        if value is None or isinstance(value, (str, int, float, Enum)):
+            return value
+
+        raise AttributeError(f'"{name}" of the live page is not available while prerendering.')
+
+    def go(self, route: str) -> None:
+        """Change the offscreen route without dispatching anything."""
+        self.route = route
+
+    def run_task(self, handler: Callable[..., Coroutine], *args: Any) -> Future:
+        """Run a coroutine function on the live page."""
+        return self._live_page.run_task(handler, *args)
+
+
+def route(route: Union[str, PageDefinition]) -> Any:
+    """Link a route to the last initialized navigator.
+
+    This function registers the route and associates it with a given page definition.
+    The only difference is the name. You can specify the name in the first argument.
+    or this function will fetch the given function name automatically."""
+    def _register_route(route_name: str, page_definition: PageDefinition) -> PageDefinition:
+        global _pre_def_routes_version
+
+        # A manifest page imported on its first visit is already registered (lazily): re-registering it would invalidate the shared registries.
+        if _manifest_routes.get(route_name) == (getattr(page_definition, '__module__', None), getattr(page_definition, '__name__', None)):
+            return page_definition
+
+        _pre_def_routes[route_name] = page_definition
+
+        _pre_def_routes_version += 1
+
+        return page_definition
+
+    if isinstance(route, Callable):
+        return _register_route(route.__name__, route)
+
+    return lambda page_definition: _register_route(route, page_definition)
+
+
+def load_page(path: str, name: Optional[str]=None) -> PageDefinition:
+    """Load a page definition from a specified module.
+
+    Let me explain this technically: it replaces all the system path separators with a dot.
+    After loading the module by its path, it loads the page definition function.
+    The function name is determined by the path. If a name is specified, then it loads the specified name.
+    Otherwise, it uses the last name in the path.
+    
+    Can throw `ModuleNotFoundError` and `AttributeError`."""
+    path = path.replace('\\', '.').replace('/', '.')
+
+    page = None
+
+    try:
+        page = getattr(import_module(path), _pd := path.split('.')[-1] if not name else name)
+    except ModuleNotFoundError as module_exc:
+        raise TypeError(f'Failed to load page definition module: "{path}".') from module_exc
+    except AttributeError as attr_error:
+        raise ImportError(f'Failed to load page definition: "{_pd}".') from attr_error
+
+    return page
+
+
+class LazyPageDefinition:
+    """A page definition that is imported from its module on the first navigation to its route. See `lazy`."""
+
+    path: str = None
+    """The page definition module path."""
+
+    name: Optional[str] = None
+    """The page definition name, or `None` for the last name in the path."""
+
+    import_time: Optional[float] = None
+    """The time (in seconds) it took to import the page definition, or `None` if it's not loaded yet."""
+
+    def __init__(self, path: str, name: Optional[str]=None) -> None:
+        """Initialize a lazy page definition. Nothing is imported until the page is loaded."""
+        self.path = path
+
+        self.name = name
+
+        self._page_definition = None
+
+        self._lock = Lock()
+
+    @property
+    def loaded(self) -> bool:
+        """Check if the page definition is already imported."""
+        return self._page_definition is not None
+
+    def load(self) -> PageDefinition:
+        """Import the page definition via `load_page` (once) and return it."""
+        if self._page_definition is None:
+            with self._lock:
+                if self._page_definition is None:
+                    import_start = perf_counter()
+
+                    page_definition = load_page(self.path, self.name)
+
+                    self.import_time = perf_counter() - import_start
+
+                    self._page_definition = page_definition
+
+        return self._page_definition
+
+    def __call__(self, route_context: RouteContext) -> Any:
+        """Render the page, importing it first if needed."""
+        return self.load()(route_context)
+
+    def __repr__(self) -> str:
+        """Represent the lazy page definition as a string for debugging purposes."""
+        return f'LazyPageDefinition({self.path!r}, {self.name!r}) ({"LOADED" if self.loaded else "NOT-LOADED"})'
+
+
+def lazy(path: str, name: Optional[str]=None) -> LazyPageDefinition:
+    """Register a route by its module path instead of its page definition, e.g. `routes={'reports': lazy('pages/reports')}`.
+
+    The module is imported with `load_page` on the first navigation to the route (or earlier, if prefetched)."""
+    return LazyPageDefinition(path, name)
+
+
+async def _fn_await(awaitable: Any) -> Any:
+    return await awaitable
+
+
+def _fn_route_decorator_name(decorator: ast.expr, function_name: str, module_path: str) -> Optional[str]:
+    """Get the route name registered by a `@route` decorator node, or `None` if it's not a route decorator (or its name isn't a literal)."""
+    target = decorator.func if isinstance(decorator, ast.Call) else decorator
+
+    if (target.id if isinstance(target, ast.Name) else target.attr if isinstance(target, ast.Attribute) else None) != 'route':
+        return None
+
+    if not isinstance(decorator, ast.Call):
+        return function_name
+
+    if decorator.args and isinstance(decorator.args[0], ast.Constant) and isinstance(decorator.args[0].value, str):
+        return decorator.args[0].value
+
+    getLogger('FN').error(f'The route name of page definition "{module_path}.{function_name}" is not a string literal; the route is left out of the manifest.')
+
+    return None
+
+
+def _fn_declared_props(function: ast.AST) -> Optional[dict[str, Any]]:
+    """Get the page properties a page definition declares with literal `spec_cpage_props` calls."""
+    props = {}
+
+    for node in ast.walk(function):
+        if isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute) and node.func.attr == 'spec_cpage_props':
+            for keyword in node.keywords:
+                try:
+                    props[keyword.arg] = ast.literal_eval(keyword.value)
+                except ValueError:
+                    return None
+
+    return props
+
+
+def scan_routes(package_path: str, root: Optional[str]=None) -> list[dict[str, Any]]:
+    """Find the `@route`-decorated page definitions of a pages package without importing it.
+
+    Modules are parsed, not executed. Each route is described by its name, module path (relative to `root`, the current directory by default),
+    page definition name and, if they are all literal, the page properties declared with `spec_cpage_props`."""
+    root = abspath(root or '.')
+
+    routes = []
+
+    for directory, _, files in walk(package_path):
+        for file in sorted(files):
+            if not file.endswith('.py'):
+                continue
+
+            with open(join(directory, file), encoding='utf-8') as source:
+                module = ast.parse(source.read())
+
+            module_path = splitext(relpath(abspath(join(directory, file)), root))[0].replace('\\', '.').replace('/', '.')
+
+            module_path = module_path[:-len('.__init__')] if module_path.endswith('.__init__') else module_path
+
+            for node in module.body:
+                if not isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                    continue
+
+                for decorator in node.decorator_list:
+                    if (route_name := _fn_route_decorator_name(decorator, node.name, module_path)) is not None:
+                        route_entry = {'route': route_name, 'module': module_path, 'name': node.name}
+
+                        if props := _fn_declared_props(node):
+                            route_entry['props'] = props
+
+                        routes.append(route_entry)
+
+    return routes
+
+
+def write_route_manifest(package_path: str, output: str='routes.json', root: Optional[str]=None) -> int:
+    """Scan a pages package (see `scan_routes`) and write a compact route manifest. Returns the number of routes written."""
+    routes = scan_routes(package_path, root)
+
+    with open(output, 'w', encoding='utf-8') as manifest:
+        manifest.write(dumps({'flet_navigator': FLET_NAVIGATOR_VERSION, 'routes': routes}, separators=(',', ':')))
+
+    return len(routes)
+
+
+def load_route_manifest(manifest_path: str) -> tuple[Routes, RouteProperties]:
+    """Load a route manifest written by `write_route_manifest`.
+
+    Returns lazy routes (no page module is imported until its route is visited) and the declared page properties by route ID."""
+    with open(manifest_path, encoding='utf-8') as manifest:
+        route_entries = loads(manifest.read())['routes']
+
+    routes = {entry['route']: LazyPageDefinition(entry['module'], entry['name']) for entry in route_entries}
+
+    _manifest_routes.update((entry['route'], (entry['module'], entry['name'])) for entry in route_entries)
+
+    return routes, {hash(entry['route']): entry['props'] for entry in route_entries if entry.get('props')}
+
+
+def template(template_definition: Union[str, TemplateDefinition], route_data: RouteContext, arguments: Arguments=()) -> Optional[Any]:
+    """Render a template for the given page data and arguments.
+    
+    If `template_definition` is a string, then it's a global template.
     The function will try to find the template you defined earlier via `@global_template` in the list of global templates.
     If `template_definition` is a callable, then it's a local template.
-    The template will be rendered by calling the template function."""
+    The template will be rendered by calling the template function.
+
+    Async templates return an awaitable when called from an async page (await it),
+    otherwise they are scheduled on the page's task runner and a `concurrent.futures.Future` is returned."""
     if isinstance(template_definition, str):
+        if template_definition in _memoized_templates:
+            return _fn_render_memoized_template(template_definition, route_data, arguments)
+
         if template_definition in _global_templates:
-            return _global_templates[template_definition](route_data, arguments)
+            template_definition = _global_templates[template_definition]
 
         else:
             route_data.navigator._logger.error(f'No global template found with the name: "{template_definition}". Ensure the template is registered and its name is correct.')
 
-    else:
-        return template_definition(route_data, arguments)
+            return None
+
+    rendered = template_definition(route_data, arguments)
+
+    if isawaitable(rendered):
+        try:
+            get_running_loop()
+        except RuntimeError:
+            return route_data.page.run_task(_fn_await, rendered)
+
+    return rendered
+
+
+def _fn_render_memoized_template(template_name: str, route_data: RouteContext, arguments: Arguments) -> Optional[Any]:
+    """Render a memoized global template, reusing the subtree rendered by an earlier render of this session for the same arguments."""
+    stats = _template_cache_stats.setdefault(template_name, [0, 0])
+
+    try:
+        hash(arguments)
+    except TypeError:
+        stats[1] += 1
+
+        return template(_global_templates[template_name], route_data, arguments)
+
+    if route_data.navigator._template_cache is None:
+        route_data.navigator._template_cache = {}
+
+    template_cache = route_data.navigator._template_cache.setdefault(template_name, OrderedDict())
+
+    cached = template_cache.get(arguments)
+
+    generation = route_data.navigator._render_generation
+
+    # A control can only be mounted once, so a subtree already handed out during this render is rendered anew.
+    if cached and cached[0] == _template_versions.get(template_name, 0) and cached[2] != generation:
+        stats[0] += 1
+
+        cached[2] = generation
+
+        template_cache.move_to_end(arguments)
+
+        return cached[1]
+
+    stats[1] += 1
+
+    rendered = template(_global_templates[template_name], route_data, arguments)
+
+    # Pending async renders can't be reused.
+    if not isawaitable(rendered) and not isinstance(rendered, Future):
+        template_cache[arguments] = [_template_versions.get(template_name, 0), rendered, generation]
+
+        template_cache.move_to_end(arguments)
 
+        while len(template_cache) > _memoized_templates[template_name]:
+            template_cache.popitem(last=False)
 
-def global_template(template_name: Optional[str]=None) -> Any:
+    return rendered
+
+
+def global_template(template_name: Optional[str]=None, memoize: bool=False, memo_limit: int=16) -> Any:
     """Register a global template to the last initialized navigator.
 
     This function registers the template and associates it with a given template definition.
     The only difference is the name. You can specify the name in the first argument.
-    or this function will fetch the given template function name automatically."""
+    or this function will fetch the given template function name automatically.
+
+    If `memoize` is enabled, the rendered subtree is reused across navigations of a session
+    for the same (hashable) arguments, until `invalidate_template` is called. Within one render, repeated calls get separate subtrees. `memo_limit` bounds the cached renders per session (LRU)."""
+    def _register_global_template(name: str, template: TemplateDefinition) -> None:
+        _global_templates[name] = template
+
+        if memoize:
+            _memoized_templates[name] = max(memo_limit, 1)
+
+        else:
+            _memoized_templates.pop(name, None)
+
+        invalidate_template(name)
+
     if isinstance(template_name, Callable):
-        _global_templates[template_name.__name__] = template_name
+        _register_global_template(template_name.__name__, template_name)
 
     else:
         def _global_template(template: TemplateDefinition) -> None:
-            _global_templates[template.__name__ if not template_name or not isinstance(template_name, str) else template_name] = template
+            _register_global_template(template.__name__ if not template_name or not isinstance(template_name, str) else template_name, template)
 
         return _global_template
 
 
-def fn_process(start: str='/', virtual: bool=False, routes: Routes={}, route_change_callback: RouteChangeCallback=None, startup_args: Arguments=(), public_startup_parameters: RouteParameters={}) -> Callable[[Page], None]:
+def invalidate_template(template_name: Optional[str]=None) -> None:
+    """Invalidate the memoized renders of the given global template (or of all of them) in every session."""
+    for name in (_global_templates if template_name is None else (template_name,)):
+        _template_versions[name] = _template_versions.get(name, 0) + 1
+
+
+def template_cache_stats(template_name: Optional[str]=None) -> dict[str, Any]:
+    """Get the memoized templates hit and miss counters: `{'hits': ..., 'misses': ...}` for one template, or a map of them for all."""
+    if template_name is not None:
+        hits, misses = _template_cache_stats.get(template_name, (0, 0))
+
+        return {'hits': hits, 'misses': misses}
+
+    return {name: {'hits': hits, 'misses': misses} for name, (hits, misses) in _template_cache_stats.items()}
+
+
+def _fn_route_prefixes(route_pattern: str) -> list[str]:
+    """Get the prefixes covering the given route pattern, outermost first: `/`, then every leading run of its segments."""
+    segments = route_pattern.split('/') if route_pattern not in ('/', ROUTE_404) else []
+
+    return ['/'] + ['/'.join(segments[:depth]) for depth in range(1, len(segments) + 1)]
+
+
+def _fn_layout_chain(route_pattern: str) -> tuple[str, ...]:
+    """Get the prefixes of the layouts wrapping the given route pattern, outermost first."""
+    if route_pattern not in _layout_chains:
+        _layout_chains[route_pattern] = tuple(prefix for prefix in _fn_route_prefixes(route_pattern) if prefix in _global_layouts)
+
+    return _layout_chains[route_pattern]
+
+
+def layout(route_prefix: str='/') -> Any:
+    """Register a persistent layout for every route under the given prefix (`/` for all the routes).
+
+    A layout is built once and stays mounted while navigating between the routes it wraps; only its outlet is refilled.
+    Layouts nest by prefix: a `dashboard` layout is placed in the outlet of the `/` layout and wraps `dashboard` and `dashboard/...`.
+    The layout definition receives the route context and the outlet (a `Column`) to place where the route content goes:
+    ```
+    @layout('/')
+    def shell(ctx: RouteContext, outlet: Column) -> None:
+        ctx.add(AppBar(title=Text('App')), outlet)
+    ```"""
+    def _layout(layout_definition: LayoutDefinition) -> LayoutDefinition:
+        # Layouts are built synchronously, before the route content; an async layout would never be awaited.
+        if iscoroutinefunction(layout_definition):
+            raise TypeError(f'Layout "{getattr(layout_definition, "__name__", layout_definition)}" can\'t be async: layouts are built before the route content renders.')
+
+        _global_layouts[route_prefix] = layout_definition
+
+        _layout_chains.clear()
+
+        return layout_definition
+
+    return _layout
+
+
+def loader(route_name: str, ttl: float=0, stale_while_revalidate: float=0) -> Any:
+    """Register a data loader for the given route (pattern), e.g. `@loader('user/<id:int>', ttl=30)`.
+
+    The loader receives the route parameters and is started as soon as the navigation is requested:
+    synchronous loaders run in the navigator's thread pool, async ones on the page's event loop.
+    Pages get the result with `RouteContext.data` (or `data_async`). Results are cached per session, route and parameters:
+    for `ttl` seconds after loading they are reused as is, and for `stale_while_revalidate` more seconds
+    the stale result is served instantly while a fresh one is loaded in the background for the next visit."""
+    def _loader(loader_definition: LoaderDefinition) -> LoaderDefinition:
+        _route_loaders[route_name] = (loader_definition, ttl, stale_while_revalidate)
+
+        return loader_definition
+
+    return _loader
+
+
+def _fn_guard_chain(route_pattern: str) -> tuple[tuple[RouteGuard, float], ...]:
+    """Get the flat list of guards protecting the given route pattern: global guards first, then by prefix, outermost first."""
+    if route_pattern not in _guard_chains:
+        _guard_chains[route_pattern] = tuple(guard_entry for prefix in _fn_route_prefixes(route_pattern) for guard_entry in _global_guards.get(prefix, ()))
+
+    return _guard_chains[route_pattern]
+
+
+def guard(route_prefix: Union[str, RouteGuard]='/', ttl: float=0) -> Any:
+    """Register a route guard for every route under the given prefix (`/` for all the routes).
+
+    Guards run before the page is cleaned or rendered, global ones first, then by prefix, outermost first.
+    A guard receives the route context and returns `None` (or `True`) to let the navigation through,
+    a route to redirect to (the guarded page is not rendered at all), or `False` to redirect to the homepage.
+    If `ttl` is set, the decision is memoized per session, route and parameters for that many seconds,
+    so repeated navigation between protected pages skips the check (see `invalidate_guards`):
+    ```
+    @guard('admin', ttl=60)
+    def admin_only(ctx: RouteContext) -> Optional[str]:
+        return None if is_admin(ctx.page) else 'login'
+    ```"""
+    def _register_guard(prefix: str, guard_definition: RouteGuard) -> RouteGuard:
+        _global_guards.setdefault(prefix, []).append((guard_definition, ttl))
+
+        _guard_chains.clear()
+
+        return guard_definition
+
+    if isinstance(route_prefix, Callable):
+        return _register_guard('/', route_prefix)
+
+    return lambda guard_definition: _register_guard(route_prefix, guard_definition)
+
+
+def path_converter(converter_name: Optional[str]=None) -> Any:
+    """Register a path parameter converter for typed route segments (`<name:converter>`).
+
+    The converter receives the raw segment and must return the converted value or raise `ValueError` if the segment doesn't fit.
+    The only difference is the name. You can specify the name in the first argument.
+    or this function will fetch the given converter function name automatically.
+    Built-in converters: `str` (default), `int` and `float`. Register converters before initializing the navigator."""
+    if isinstance(converter_name, Callable):
+        _path_converters[converter_name.__name__] = converter_name
+
+    else:
+        def _path_converter(converter: Callable[[str], Any]) -> None:
+            _path_converters[converter.__name__ if not converter_name or not isinstance(converter_name, str) else converter_name] = converter
+
+        return _path_converter
+
+
+def fn_process(start: str='/', virtual: bool=False, routes: Routes={}, route_change_callback: RouteChangeCallback=None, startup_args: Arguments=(), public_startup_parameters: RouteParameters={}, navigator_options: dict[str, Any]={}, manifest: Optional[str]=None) -> Callable[[Page], None]:
     """Shortcut to skip main function implementation and just calling `fn_process` in Flet's `app` function.
     
     The best way to explain this function is to show an example:
@@ -551,17 +3053,37 @@ def fn_process(start: str='/', virtual: bool=False, routes: Routes={}, route_cha
         ...
 
     app(fn_process()) # Instead of: app(lambda page: PublicFletNavigator(page).process(page))
-    ```"""
+    ```
+
+    `navigator_options` are assigned to the navigator before the first page is processed, e.g. `navigator_options={'keep_alive': True}`.
+
+    If a route `manifest` (see `python -m flet_navigator manifest`) is specified, its routes are registered lazily:
+    no page module is imported until its route is first visited."""
+    manifest_props = {}
+
+    if manifest:
+        manifest_routes, manifest_props = load_route_manifest(manifest)
+
+        routes = {**manifest_routes, **routes}
+
     return lambda page: (
         fn := PublicFletNavigator(page, routes, route_change_callback),
 
         setattr(fn, 'route', start),
 
+        fn.props_map.update(manifest_props),
+
+        [setattr(fn, option, value) for option, value in navigator_options.items()],
+
         fn.process(page, startup_args, public_startup_parameters)) \
      if not virtual else (
         fn := VirtualFletNavigator(routes, route_change_callback),
 
         setattr(fn, 'route', start),
 
+        fn.props_map.update(manifest_props),
+
+        [setattr(fn, option, value) for option, value in navigator_options.items()],
+
         fn.process(page, startup_args)
     )
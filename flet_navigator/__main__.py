@@ -0,0 +1,30 @@
+"""Flet Navigator command-line tools.
+
+`python -m flet_navigator manifest <pages package> [-o routes.json] [--root .]` writes a route manifest for `fn_process(manifest=...)`."""
+
+from argparse import ArgumentParser
+
+from flet_navigator import write_route_manifest
+
+
+def main() -> None:
+    parser = ArgumentParser(prog='python -m flet_navigator', description='Flet Navigator command-line tools.')
+
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    manifest_parser = commands.add_parser('manifest', help='Scan a pages package and write a route manifest without importing any page module.')
+
+    manifest_parser.add_argument('package', help='The pages package directory.')
+
+    manifest_parser.add_argument('-o', '--output', default='routes.json', help='The manifest file to write (default: routes.json).')
+
+    manifest_parser.add_argument('--root', default='.', help='The directory module paths are relative to (default: the current directory).')
+
+    arguments = parser.parse_args()
+
+    if arguments.command == 'manifest':
+        print(f'Wrote {write_route_manifest(arguments.package, arguments.output, arguments.root)} routes to "{arguments.output}".')
+
+
+if __name__ == '__main__':
+    main()
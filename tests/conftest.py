@@ -0,0 +1,37 @@
+"""Shared fixtures: a headless page and isolated module-level registries for every test."""
+
+import pytest
+
+import flet_navigator
+
+from flet_navigator import HeadlessPage
+
+
+_REGISTRIES: tuple[str, ...] = (
+    '_pre_def_routes', '_global_templates', '_memoized_templates', '_template_versions', '_template_cache_stats',
+    '_global_layouts', '_layout_chains', '_path_converters', '_route_loaders', '_global_guards', '_guard_chains', '_manifest_routes'
+)
+
+
+_CACHES: tuple[str, ...] = ('_shared_route_registries', '_recent_route_registries')
+
+
+@pytest.fixture(autouse=True)
+def registries() -> None:
+    """Restore the module-level registries (routes and templates registered by decorators) and empty the caches after every test."""
+    saved = {name: dict(getattr(flet_navigator, name)) for name in _REGISTRIES}
+
+    yield
+
+    for name, registry in saved.items():
+        getattr(flet_navigator, name).clear()
+
+        getattr(flet_navigator, name).update(registry)
+
+    for name in _CACHES:
+        getattr(flet_navigator, name).clear()
+
+
+@pytest.fixture
+def page() -> HeadlessPage:
+    return HeadlessPage()
@@ -0,0 +1,38 @@
+"""Helpers shared by the tests."""
+
+from time import monotonic, sleep
+
+from typing import Callable
+
+from flet_navigator import HeadlessPage
+
+
+class DeferredPage(HeadlessPage):
+    """A headless page whose route changes wait for `flush`, like a client round trip."""
+
+    def __init__(self) -> None:
+        super().__init__()
+
+        self.pending: list[str] = []
+
+    def go(self, route: str) -> None:
+        self.pending.append(route)
+
+    def flush(self) -> None:
+        for route in self.pending:
+            super().go(route)
+
+        self.pending.clear()
+
+
+def wait_until(predicate: Callable[[], bool], timeout: float=2.0) -> bool:
+    """Poll a condition that is set by a background thread or by the headless page's event loop."""
+    deadline = monotonic() + timeout
+
+    while not predicate():
+        if monotonic() > deadline:
+            return False
+
+        sleep(0.005)
+
+    return True
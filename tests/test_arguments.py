@@ -0,0 +1,117 @@
+"""Page arguments handed over through the per-session argument store."""
+
+from flet import Text
+
+from flet_navigator import ArgumentStore, PublicFletNavigator, VirtualFletNavigator
+
+from tests.support import DeferredPage
+
+
+class Frame:
+    """An argument whose truth value is ambiguous, like a data frame."""
+
+    def __bool__(self) -> bool:
+        raise ValueError('The truth value of a Frame is ambiguous.')
+
+
+def _recorder(name: str, visits: list) -> object:
+    def page_definition(ctx) -> None:
+        visits.append((name, ctx.arguments))
+
+        ctx.add(Text(name))
+
+    return page_definition
+
+
+def _navigator(page, virtual: bool, visits: list, *routes: str) -> object:
+    route_map = {route: _recorder(route, visits) for route in ('/',) + routes}
+
+    navigator = VirtualFletNavigator(route_map) if virtual else PublicFletNavigator(page, route_map)
+
+    navigator.process(page)
+
+    return navigator
+
+
+def test_arguments_reach_the_page(page) -> None:
+    for virtual in (False, True):
+        visits = []
+
+        navigator = _navigator(page, virtual, visits, 'a')
+
+        navigator.navigate('a', page, ('payload',))
+
+        assert visits[-1] == ('a', ('payload',))
+
+
+def test_arguments_are_passed_by_reference(page) -> None:
+    visits, frame = [], Frame()
+
+    navigator = _navigator(page, False, visits, 'a')
+
+    navigator.navigate('a', page, frame)
+
+    assert visits[-1][1] is frame
+
+
+def test_arguments_are_restored_when_going_back(page) -> None:
+    for virtual in (False, True):
+        visits, payload = [], object()
+
+        navigator = _navigator(page, virtual, visits, 'a', 'b')
+
+        navigator.navigate('a', page, payload)
+        navigator.navigate('b', page)
+        navigator.navigate_back(page)
+
+        assert visits[-1][0] == 'a' and visits[-1][1] is payload
+
+        navigator.navigate_forward(page)
+
+        assert visits[-1] == ('b', ())
+
+
+def test_overlapping_navigations_keep_their_own_arguments() -> None:
+    page, visits = DeferredPage(), []
+
+    navigator = _navigator(page, False, visits, 'a', 'b')
+
+    navigator.navigate('a', page, 'A')
+    navigator.navigate('b', page, 'B')
+
+    page.flush()
+
+    assert visits[-2:] == [('a', 'A'), ('b', 'B')]
+
+
+def test_navigations_without_arguments_store_nothing(page) -> None:
+    navigator = _navigator(page, False, [], 'a')
+
+    navigator.navigate('a', page)
+
+    assert navigator.arguments_store.size == 0
+    assert navigator.arguments_store.put(()) is None
+
+
+def test_store_evicts_least_recently_used() -> None:
+    store = ArgumentStore(max_entries=2)
+
+    first, second, third = ('first',), ('second',), ('third',)
+
+    tokens = [store.put(args) for args in (first, second)]
+
+    assert store.put(first) == tokens[0]
+
+    store.put(third)
+
+    assert store.get(tokens[0]) is first
+    assert store.get(tokens[1]) == ()
+
+
+def test_oversized_arguments_are_not_retained() -> None:
+    store = ArgumentStore(max_size=64)
+
+    token = store.put((bytes(1024),))
+
+    assert token is not None
+    assert (store.get(token), store.size) == ((), 0)
@@ -0,0 +1,106 @@
+"""Async page definitions, async templates and stale-render cancellation."""
+
+from asyncio import Event, sleep
+
+from concurrent.futures import Future
+
+from threading import Event as ThreadEvent
+
+from time import sleep as pause
+
+from flet import Text
+
+from flet_navigator import VirtualFletNavigator, global_template, template
+
+from tests.support import wait_until
+
+
+def _texts(page) -> list[str]:
+    return [control.value for control in page.controls]
+
+
+def test_async_pages_are_awaited_before_the_update_and_callback(page) -> None:
+    rendered = []
+
+    async def feed(ctx) -> None:
+        await sleep(0.01)
+
+        ctx.add(Text('feed'))
+
+    navigator = VirtualFletNavigator({'/': lambda ctx: None, 'feed': feed}, lambda ctx: rendered.append((ctx.current_route(), _texts(page))))
+
+    navigator.process(page)
+    navigator.navigate('feed', page)
+
+    assert wait_until(lambda: len(rendered) == 2)
+    assert rendered[1] == ('feed', ['feed'])
+
+
+def test_stale_renders_never_reach_the_page(page) -> None:
+    started, callbacks = ThreadEvent(), []
+
+    async def slow(ctx) -> None:
+        started.set()
+
+        await sleep(0.2)
+
+        ctx.add(Text('slow'))
+
+    navigator = VirtualFletNavigator({'/': lambda ctx: None, 'slow': slow, 'fast': lambda ctx: ctx.add(Text('fast'))}, lambda ctx: callbacks.append(ctx.current_route()))
+
+    navigator.process(page)
+    navigator.navigate('slow', page)
+
+    assert started.wait(2)
+
+    navigator.navigate('fast', page)
+
+    pause(0.3)
+
+    assert _texts(page) == ['fast']
+    assert callbacks == ['/', 'fast']
+
+
+def test_renders_replaced_before_they_start_are_closed(page, recwarn) -> None:
+    blocker = Event()
+
+    async def blocked(ctx) -> None:
+        await blocker.wait()
+
+    async def never(ctx) -> None:
+        ctx.add(Text('never'))
+
+    navigator = VirtualFletNavigator({'/': lambda ctx: None, 'blocked': blocked, 'never': never, 'fast': lambda ctx: ctx.add(Text('fast'))})
+
+    navigator.process(page)
+
+    for route in ('blocked', 'never', 'fast'):
+        navigator.navigate(route, page)
+
+    pause(0.1)
+
+    assert _texts(page) == ['fast']
+    assert not [warning for warning in recwarn if 'never awaited' in str(warning.message)]
+
+
+def test_async_templates(page) -> None:
+    @global_template('badge')
+    async def badge(ctx, arguments) -> Text:
+        return Text(f'badge {arguments}')
+
+    results = []
+
+    async def async_page(ctx) -> None:
+        results.append(await template('badge', ctx, 1))
+
+    navigator = VirtualFletNavigator({'/': lambda ctx: results.append(template('badge', ctx, 0)), 'async': async_page})
+
+    navigator.process(page)
+
+    assert isinstance(results[0], Future)
+    assert results[0].result(2).value == 'badge 0'
+
+    navigator.navigate('async', page)
+
+    assert wait_until(lambda: len(results) == 2)
+    assert results[1].value == 'badge 1'
@@ -0,0 +1,146 @@
+"""Navigation coalescing and batched page updates."""
+
+import pytest
+
+from flet import Text
+
+from flet_navigator import AbstractFletNavigator, VirtualFletNavigator, loader
+
+from tests.support import wait_until
+
+
+def _recorder(name: str, renders: list) -> object:
+    return lambda ctx: (renders.append(name), ctx.add(Text(name)))
+
+
+def test_rapid_navigations_are_coalesced_into_one_render(page) -> None:
+    renders = []
+
+    navigator = VirtualFletNavigator({route: _recorder(route, renders) for route in ('/', 'a', 'b', 'c')})
+
+    navigator.coalesce_window = 0.05
+
+    navigator.process(page)
+
+    for route in ('a', 'b', 'c'):
+        navigator.navigate(route, page)
+
+    assert navigator.route == 'c'
+
+    assert wait_until(lambda: renders == ['/', 'c'])
+
+    # Only the route the burst started from is pushed to the history.
+    assert list(navigator.previous_routes)[-1:] == ['/']
+
+    navigator.navigate('a', page)
+
+    assert wait_until(lambda: renders == ['/', 'c', 'a'])
+
+
+def test_flushed_navigation_renders_its_own_route(page, monkeypatch) -> None:
+    renders = []
+
+    navigator = VirtualFletNavigator({route: _recorder(route, renders) for route in ('/', 'a', 'b')})
+
+    navigator.coalesce_window = 0.01
+
+    navigator.process(page)
+
+    # The UI thread starts the next navigation while the flushed one is being processed in the executor.
+    loader('unrelated')(lambda parameters: None)
+
+    monkeypatch.setattr(AbstractFletNavigator, 'preload_route_data', staticmethod(lambda nav, page, route, parameters: setattr(nav, 'route', 'b')))
+
+    navigator.navigate('a', page)
+
+    assert wait_until(lambda: len(renders) == 2)
+    assert renders == ['/', 'a']
+
+
+def test_batched_render_sends_a_single_update(page) -> None:
+    def busy(ctx) -> None:
+        ctx.spec_cpage_props(title='Busy')
+
+        for index in range(3):
+            ctx.add(Text(str(index)))
+
+    navigator = VirtualFletNavigator({'/': lambda ctx: None, 'busy': busy})
+
+    navigator.batch_updates = True
+
+    navigator.process(page)
+
+    updates, cleans = page.updates, page.cleans
+
+    navigator.navigate('busy', page)
+
+    assert (page.updates - updates, page.cleans - cleans) == (1, 0)
+    assert [control.value for control in page.controls] == ['0', '1', '2']
+    assert page.title == 'Busy'
+
+
+def test_unbatched_render_updates_per_add(page) -> None:
+    navigator = VirtualFletNavigator({'/': lambda ctx: None, 'busy': lambda ctx: [ctx.add(Text(str(index))) for index in range(3)]})
+
+    navigator.process(page)
+
+    updates = page.updates
+
+    navigator.navigate('busy', page)
+
+    assert page.updates - updates == 4
+
+
+def test_controls_added_after_a_batched_render_are_sent(page) -> None:
+    contexts = []
+
+    navigator = VirtualFletNavigator({'/': lambda ctx: contexts.append(ctx)})
+
+    navigator.batch_updates = True
+
+    navigator.process(page)
+
+    updates = page.updates
+
+    contexts[0].add(Text('late'))
+
+    assert page.updates == updates + 1
+
+
+def test_failed_render_stops_batching(page) -> None:
+    contexts = []
+
+    def broken(ctx) -> None:
+        contexts.append(ctx)
+
+        raise RuntimeError('broken page')
+
+    async def broken_async(ctx) -> None:
+        contexts.append(ctx)
+
+        raise RuntimeError('broken page')
+
+    navigator = VirtualFletNavigator({'/': lambda ctx: None, 'broken': broken, 'broken_async': broken_async})
+
+    navigator.batch_updates = True
+
+    navigator.process(page)
+
+    with pytest.raises(RuntimeError):
+        navigator.navigate('broken', page)
+
+    updates = page.updates
+
+    contexts[-1].add(Text('late'))
+
+    assert page.updates == updates + 1
+
+    navigator.navigate('broken_async', page)
+
+    assert wait_until(lambda: navigator._render_future.done())
+
+    updates = page.updates
+
+    contexts[-1].add(Text('late'))
+
+    assert page.updates == updates + 1
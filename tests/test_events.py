@@ -0,0 +1,178 @@
+"""The route change event bus: inline and queued subscribers, overflow policies and statistics."""
+
+from threading import Event, current_thread
+
+import pytest
+
+from flet import Text
+
+from flet_navigator import PublicFletNavigator, RouteChangeEvent, RouteEventBus, VirtualFletNavigator
+
+from tests.support import wait_until
+
+
+def _navigator(page, events: RouteEventBus, route_change_callback=None) -> VirtualFletNavigator:
+    navigator = VirtualFletNavigator({'/': lambda ctx: ctx.add(Text('home')), 'a': lambda ctx: ctx.add(Text('a'))}, route_change_callback)
+
+    navigator.events = events
+
+    navigator.process(page)
+
+    return navigator
+
+
+def _blocked_subscriber(bus: RouteEventBus, overflow: str) -> tuple[list, Event]:
+    """A queued subscriber (queue size 1) stuck in its first call until the returned event is set."""
+    delivered, release, started = [], Event(), Event()
+
+    def slow(event) -> None:
+        started.set()
+
+        release.wait(2)
+
+        delivered.append(event)
+
+    bus.subscribe(slow, 'queued', 1, overflow, 0.01)
+
+    bus.publish('first')
+
+    assert started.wait(2)
+
+    for event in ('second', 'third'):
+        bus.publish(event)
+
+    return delivered, release
+
+
+def test_inline_subscribers_follow_the_callback(page) -> None:
+    calls, bus = [], RouteEventBus()
+
+    bus.subscribe(lambda event: calls.append(('subscriber', event.route)))
+
+    navigator = _navigator(page, bus, lambda ctx: calls.append(('callback', ctx.current_route())))
+
+    navigator.navigate('a', page)
+
+    assert calls == [('callback', '/'), ('subscriber', '/'), ('callback', 'a'), ('subscriber', 'a')]
+
+
+def test_queued_subscribers_run_off_the_navigation_thread(page) -> None:
+    threads, bus = [], RouteEventBus()
+
+    subscriber = bus.subscribe(lambda _: threads.append(current_thread().name), 'queued')
+
+    navigator = _navigator(page, bus)
+
+    navigator.navigate('a', page)
+
+    assert wait_until(lambda: subscriber.delivered == 2)
+    assert threads == ['FN-event-subscriber'] * 2
+
+    bus.close()
+
+
+def test_failing_subscriber_is_logged_and_counted(page, caplog) -> None:
+    bus = RouteEventBus()
+
+    def broken(_) -> None:
+        raise RuntimeError('analytics down')
+
+    subscriber = bus.subscribe(broken)
+
+    navigator = _navigator(page, bus)
+
+    navigator.navigate('a', page)
+
+    assert [control.value for control in page.controls] == ['a']
+    assert (subscriber.delivered, subscriber.failed) == (0, 2)
+    assert 'Route change subscriber broken failed: analytics down' in caplog.text
+
+
+def test_subscribers_get_immutable_snapshots(page) -> None:
+    events, bus = [], RouteEventBus()
+
+    bus.subscribe(events.append)
+
+    navigator = PublicFletNavigator(page, {'/': lambda ctx: None, 'user/<id:int>': lambda ctx: None})
+
+    navigator.events = bus
+
+    navigator.process(page)
+    navigator.navigate('user/7', page)
+
+    event = events[-1]
+
+    assert isinstance(event, RouteChangeEvent)
+    assert (event.route, event.route_pattern, dict(event.parameters)) == ('user/7', 'user/<id:int>', {'id': 7})
+
+    with pytest.raises(TypeError):
+        event.parameters['id'] = 8
+
+    with pytest.raises(AttributeError):
+        event.route = '/'
+
+
+def test_queued_subscribers_see_the_navigation_they_were_published_for(page) -> None:
+    routes, bus = [], RouteEventBus()
+
+    subscriber = bus.subscribe(lambda event: routes.append(event.route), 'queued')
+
+    navigator = _navigator(page, bus)
+
+    for route in ('a', '/', 'a'):
+        navigator.navigate(route, page)
+
+    assert wait_until(lambda: subscriber.delivered == 4)
+    assert routes == ['/', 'a', '/', 'a']
+
+    bus.close()
+
+
+@pytest.mark.parametrize(('overflow', 'expected'), [('drop_oldest', ['first', 'third']), ('drop_newest', ['first', 'second']), ('block', ['first', 'second'])])
+def test_overflow_policies(overflow: str, expected: list[str]) -> None:
+    bus = RouteEventBus()
+
+    delivered, release = _blocked_subscriber(bus, overflow)
+
+    release.set()
+
+    assert wait_until(lambda: len(delivered) == 2)
+    assert delivered == expected
+    assert bus.stats()[0]['dropped'] == 1
+    assert bus.stats()[0]['max_queue_depth'] == 1
+
+    bus.close()
+
+
+def test_invalid_mode_and_overflow_are_rejected() -> None:
+    with pytest.raises(ValueError):
+        RouteEventBus().subscribe(print, 'deferred')
+
+    with pytest.raises(ValueError):
+        RouteEventBus().subscribe(print, 'queued', overflow='drop_all')
+
+
+def test_bus_is_shared_between_navigators(page) -> None:
+    routes, bus = [], RouteEventBus()
+
+    bus.subscribe(lambda event: routes.append(event.route))
+
+    first, second = _navigator(page, bus), _navigator(page, bus)
+
+    first.navigate('a', page)
+
+    assert routes == ['/', '/', 'a']
+    assert second.route == '/'
+
+
+def test_unsubscribe() -> None:
+    calls, bus = [], RouteEventBus()
+
+    subscriber = bus.subscribe(calls.append)
+
+    bus.unsubscribe(subscriber)
+
+    bus.publish('event')
+
+    assert calls == []
+    assert bus.stats() == []
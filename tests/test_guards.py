@@ -0,0 +1,205 @@
+"""Route guards: redirects, ordering, memoized decisions and redirect loops."""
+
+from flet import Text
+
+from flet_navigator import NavigationProfiler, PublicFletNavigator, VirtualFletNavigator, guard
+
+from tests.support import wait_until
+
+
+def _recorder(name: str, visits: list) -> object:
+    def page_definition(ctx) -> None:
+        visits.append(name)
+
+        ctx.add(Text(name))
+
+    return page_definition
+
+
+def _navigator(page, virtual: bool, visits: list, *routes: str) -> object:
+    route_map = {route: _recorder(route, visits) for route in ('/',) + routes}
+
+    navigator = VirtualFletNavigator(route_map) if virtual else PublicFletNavigator(page, route_map)
+
+    navigator.process(page)
+
+    return navigator
+
+
+def test_redirect_skips_the_guarded_page(page) -> None:
+    guard('admin')(lambda ctx: 'login')
+
+    for virtual in (False, True):
+        visits = []
+
+        navigator = _navigator(page, virtual, visits, 'login', 'admin')
+
+        navigator.navigate('admin', page)
+
+        assert navigator.route == 'login'
+        assert visits == ['/', 'login']
+        assert [control.value for control in page.controls] == ['login']
+
+
+def test_false_redirects_to_the_homepage(page) -> None:
+    guard('admin')(lambda ctx: False)
+
+    navigator = _navigator(page, True, [], 'a', 'admin')
+
+    navigator.navigate('a', page)
+    navigator.navigate('admin', page)
+
+    assert navigator.route == '/'
+
+
+def test_redirect_back_to_the_origin_leaves_no_history_entry(page) -> None:
+    guard('admin')(lambda ctx: 'login')
+
+    for virtual in (False, True):
+        navigator = _navigator(page, virtual, [], 'login', 'admin')
+
+        navigator.navigate('login', page)
+        navigator.navigate('admin', page)
+
+        assert navigator.route == 'login'
+        assert list(navigator.previous_routes) == ['/']
+
+
+def test_redirect_keeps_the_route_navigated_from(page) -> None:
+    guard('admin')(lambda ctx: 'login')
+
+    for virtual in (False, True):
+        navigator = _navigator(page, virtual, [], 'a', 'login', 'admin')
+
+        navigator.navigate('a', page)
+        navigator.navigate('admin', page)
+
+        assert navigator.route == 'login'
+        assert list(navigator.previous_routes) == ['/', 'a']
+
+        navigator.navigate_back(page)
+
+        assert navigator.route == 'a'
+
+
+def test_guards_cover_the_routes_below_their_prefix(page) -> None:
+    guard('admin')(lambda ctx: 'login')
+
+    visits = []
+
+    navigator = _navigator(page, True, visits, 'login', 'admin/users', 'administration')
+
+    navigator.navigate('admin/users', page)
+
+    assert navigator.route == 'login'
+
+    navigator.navigate('administration', page)
+
+    assert visits == ['/', 'login', 'administration']
+
+
+def test_guards_run_global_first_then_outermost_first(page) -> None:
+    calls = []
+
+    guard('admin/users')(lambda ctx: calls.append('users'))
+    guard('admin')(lambda ctx: calls.append('admin'))
+    guard(lambda ctx: calls.append('global'))
+
+    navigator = _navigator(page, True, [], 'admin/users')
+
+    calls.clear()
+
+    navigator.navigate('admin/users', page)
+
+    assert calls == ['global', 'admin', 'users']
+
+
+def test_decisions_are_memoized_for_ttl(page) -> None:
+    calls = []
+
+    guard('admin', ttl=60)(lambda ctx: calls.append(ctx) and None)
+
+    navigator = _navigator(page, False, [], 'admin')
+
+    for _ in range(3):
+        navigator.navigate('admin', page)
+        navigator.navigate('/', page)
+
+    assert len(calls) == 1
+
+    navigator.invalidate_guards()
+
+    navigator.navigate('admin', page)
+
+    assert len(calls) == 2
+
+
+def test_redirect_loops_are_stopped(page, caplog) -> None:
+    guard('a')(lambda ctx: 'b')
+    guard('b')(lambda ctx: 'a')
+
+    visits = []
+
+    navigator = _navigator(page, True, visits, 'a', 'b')
+
+    navigator.navigate('a', page)
+
+    assert visits == ['/']
+    assert 'Too many guard redirects' in caplog.text
+
+
+def test_stopped_navigation_stops_batching(page) -> None:
+    guard('a')(lambda ctx: 'b')
+    guard('b')(lambda ctx: 'a')
+
+    contexts = []
+
+    navigator = VirtualFletNavigator({'/': contexts.append, 'a': lambda ctx: None, 'b': lambda ctx: None})
+
+    navigator.batch_updates = True
+
+    navigator.process(page)
+    navigator.navigate('a', page)
+
+    updates = page.updates
+
+    contexts[0].add(Text('late'))
+
+    assert page.updates == updates + 1
+
+
+def test_async_redirect_target_keeps_batching(page) -> None:
+    guard('admin')(lambda ctx: 'login')
+
+    async def login(ctx) -> None:
+        for index in range(3):
+            ctx.add(Text(str(index)))
+
+    navigator = VirtualFletNavigator({'/': lambda ctx: None, 'login': login, 'admin': lambda ctx: None})
+
+    navigator.batch_updates = True
+
+    navigator.process(page)
+
+    updates = page.updates
+
+    navigator.navigate('admin', page)
+
+    assert wait_until(lambda: len(page.controls) == 3 and not navigator._rendering)
+    assert page.updates == updates + 1
+
+
+def test_guard_phase_is_profiled(page) -> None:
+    guard('admin')(lambda ctx: None)
+
+    phases = []
+
+    navigator = _navigator(page, True, [], 'admin')
+
+    navigator.profiler = NavigationProfiler(hooks=(lambda route, phase, seconds: phases.append((route, phase)),))
+
+    navigator.navigate('admin', page)
+
+    admin_phases = [phase for route, phase in phases if route == 'admin']
+
+    assert admin_phases.index('guard') < admin_phases.index('clean') < admin_phases.index('render')
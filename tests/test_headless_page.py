@@ -0,0 +1,54 @@
+"""The headless page stand-in."""
+
+from asyncio import sleep
+
+from flet import Text
+
+from flet_navigator import HeadlessPage, PublicFletNavigator
+
+
+def test_controls_updates_and_cleans_are_counted() -> None:
+    page = HeadlessPage()
+
+    page.add(Text('a'), Text('b'))
+    page.update()
+
+    assert (len(page.controls), page.updates, page.cleans) == (2, 2, 0)
+
+    page.clean()
+
+    assert (page.controls, page.cleans) == ([], 1)
+
+
+def test_go_dispatches_the_route_change() -> None:
+    page = HeadlessPage()
+
+    events = []
+
+    page.on_route_change = events.append
+
+    page.go('feed?page=2')
+
+    assert page.route == 'feed?page=2'
+    assert events[0].route == 'feed?page=2' and events[0].page is page
+
+
+def test_run_task_runs_coroutines_in_the_background() -> None:
+    async def double(value: int) -> int:
+        await sleep(0)
+
+        return value * 2
+
+    assert HeadlessPage().run_task(double, 21).result(2) == 42
+
+
+def test_public_navigator_runs_on_a_headless_page() -> None:
+    page = HeadlessPage('/')
+
+    navigator = PublicFletNavigator(page, {'/': lambda ctx: ctx.add(Text('home')), 'feed': lambda ctx: ctx.add(Text(str(ctx.parameters)))})
+
+    navigator.process(page)
+    navigator.navigate('feed', page, parameters={'page': 2})
+
+    assert page.route == 'feed?page=2'
+    assert [control.value for control in page.controls] == ["{'page': 2}"]
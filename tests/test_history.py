@@ -0,0 +1,89 @@
+"""The bounded navigation history with its forward stack."""
+
+from flet_navigator import NavigationHistory, PublicFletNavigator, VirtualFletNavigator
+
+
+def _navigator(page, virtual: bool=False) -> object:
+    routes = {route: (lambda ctx: None) for route in ('/', 'a', 'b', 'c')}
+
+    navigator = VirtualFletNavigator(routes) if virtual else PublicFletNavigator(page, routes)
+
+    navigator.process(page)
+
+    return navigator
+
+
+def test_back_and_forward(page) -> None:
+    for virtual in (False, True):
+        navigator = _navigator(page, virtual)
+
+        navigator.navigate('a', page)
+        navigator.navigate('b', page)
+
+        assert list(navigator.previous_routes) == ['/', 'a']
+
+        navigator.navigate_back(page)
+
+        assert navigator.route == 'a'
+        assert list(navigator.previous_routes) == ['/']
+
+        navigator.navigate_forward(page)
+
+        assert navigator.route == 'b'
+        assert list(navigator.previous_routes) == ['/', 'a']
+
+
+def test_new_visit_clears_the_forward_stack(page) -> None:
+    navigator = _navigator(page, True)
+
+    navigator.navigate('a', page)
+    navigator.navigate_back(page)
+    navigator.navigate('b', page)
+    navigator.navigate_forward(page)
+
+    assert navigator.route == 'b'
+
+
+def test_history_is_per_navigator(page) -> None:
+    first, second = _navigator(page, True), _navigator(page, True)
+
+    first.navigate('a', page)
+
+    assert list(first.previous_routes) == ['/']
+    assert list(second.previous_routes) == []
+
+
+def test_history_limit_drops_the_oldest_entries(page) -> None:
+    navigator = _navigator(page)
+
+    navigator.history_limit = 2
+
+    for route in ('a', 'b', 'c', 'a'):
+        navigator.navigate(route, page)
+
+    assert list(navigator.previous_routes) == ['b', 'c']
+    assert navigator.history_limit == 2
+
+
+def test_parameters_are_restored_when_going_back(page) -> None:
+    navigator = _navigator(page)
+
+    navigator.navigate('a', page, parameters={'tab': 2})
+    navigator.navigate('b', page)
+    navigator.navigate_back(page)
+
+    assert page.route == 'a?tab=2'
+
+
+def test_list_compatibility() -> None:
+    history = NavigationHistory(max_depth=None)
+
+    history.append('a')
+    history.push('b', {'tab': 1})
+
+    assert (len(history), history[-1], list(history)) == (2, 'b', ['a', 'b'])
+    assert history.pop() == 'b'
+
+    history.clear()
+
+    assert len(history) == 0
@@ -0,0 +1,65 @@
+"""Allocation-free dispatch: slotted route contexts, dispatch entries and navigator state slots."""
+
+from flet import Text
+
+from flet_navigator import PublicFletNavigator, RouteContext, VirtualFletNavigator, _RouteTable, fn_process
+
+
+def test_route_context_has_no_instance_dict(page) -> None:
+    contexts = []
+
+    navigator = VirtualFletNavigator({'/': contexts.append})
+
+    navigator.process(page)
+
+    assert not hasattr(contexts[0], '__dict__')
+    assert contexts[0].loader_future is None
+    assert 'parameters' in RouteContext.__slots__
+
+
+def test_dispatch_entries_are_built_once() -> None:
+    def user(_) -> None:
+        pass
+
+    table = _RouteTable({'/': user, 'user/<id:int>': user})
+
+    assert table.dispatch('/') is table.dispatch('/')
+    assert table.dispatch('/') == ('/', hash('/'), user, None)
+    assert table.dispatch('user/7') == ('user/<id:int>', hash('user/<id:int>'), user, {'id': 7})
+    assert table.resolve('/') == ('/', {})
+    assert table.dispatch('missing') is None
+
+
+def test_path_parameters_reach_the_page(page) -> None:
+    parameters = []
+
+    navigator = PublicFletNavigator(page, {'/': lambda ctx: None, 'user/<id:int>': lambda ctx: parameters.append(ctx.parameters)})
+
+    navigator.process(page)
+
+    navigator.navigate('user/7', page)
+    navigator.navigate('user/8', page, parameters={'tab': 2})
+
+    assert parameters == [{'id': 7}, {'tab': 2, 'id': 8}]
+
+
+def test_session_state_lives_in_slots(page) -> None:
+    for navigator in (VirtualFletNavigator({'/': lambda ctx: ctx.add(Text('home')), 'a': lambda ctx: None}), PublicFletNavigator(page, {'/': lambda ctx: None, 'a': lambda ctx: None})):
+        navigator.process(page)
+        navigator.navigate('a', page)
+
+        assert navigator.virtual is navigator.is_virtual()
+        assert vars(navigator) == {}
+
+        navigator.keep_alive = True
+
+        assert vars(navigator) == {'keep_alive': True}
+
+
+def test_state_is_set_per_navigator(page) -> None:
+    virtual, public = VirtualFletNavigator(), PublicFletNavigator(page)
+
+    assert (virtual.page, virtual.route, virtual.route_change_callback) == (None, '/', None)
+    assert (public.page, public.route) == (page, '/')
+    assert virtual.previous_routes is not public.previous_routes
+    assert fn_process('a', virtual=True, routes={'/': lambda ctx: None, 'a': lambda ctx: None})(page)[0].route == 'a'
@@ -0,0 +1,158 @@
+"""The keep-alive page cache."""
+
+from flet import Text
+
+from flet_navigator import PublicFletNavigator, VirtualFletNavigator, fn_process
+
+
+def _navigator(page, builds: list, virtual: bool=False, **options) -> object:
+    def page_definition(name: str) -> object:
+        return lambda ctx: (builds.append(name), ctx.add(Text(name)))
+
+    routes = {route: page_definition(route) for route in ('/', 'feed', 'settings')}
+
+    navigator = VirtualFletNavigator(routes) if virtual else PublicFletNavigator(page, routes)
+
+    for option, value in {'keep_alive': True, **options}.items():
+        setattr(navigator, option, value)
+
+    navigator.process(page)
+
+    return navigator
+
+
+def test_repeat_visits_reuse_the_built_tree(page) -> None:
+    for virtual in (False, True):
+        builds = []
+
+        navigator = _navigator(page, builds, virtual)
+
+        navigator.navigate('feed', page)
+
+        tree = list(page.controls)
+
+        navigator.navigate('/', page)
+        navigator.navigate('feed', page)
+
+        assert builds.count('feed') == 1
+        assert page.controls == tree
+
+
+def test_navigate_back_reuses_the_built_tree(page) -> None:
+    builds = []
+
+    navigator = _navigator(page, builds)
+
+    navigator.navigate('feed', page)
+    navigator.navigate('settings', page)
+    navigator.navigate_back(page)
+
+    assert navigator.route == 'feed'
+    assert builds == ['/', 'feed', 'settings']
+
+
+def test_disabled_by_default(page) -> None:
+    builds = []
+
+    navigator = _navigator(page, builds, keep_alive=False)
+
+    navigator.navigate('feed', page)
+    navigator.navigate('/', page)
+    navigator.navigate('feed', page)
+
+    assert builds.count('feed') == 2
+
+
+def test_trees_are_kept_per_parameters(page) -> None:
+    builds = []
+
+    navigator = _navigator(page, builds)
+
+    navigator.navigate('feed', page, parameters={'tab': 1})
+    navigator.navigate('feed', page, parameters={'tab': 2})
+    navigator.navigate('feed', page, parameters={'tab': 1})
+
+    assert builds.count('feed') == 2
+
+
+def test_visits_with_arguments_are_rebuilt(page) -> None:
+    for virtual in (False, True):
+        builds = []
+
+        navigator = _navigator(page, builds, virtual)
+
+        navigator.navigate('feed', page)
+        navigator.navigate('/', page)
+        navigator.navigate('feed', page, 'first')
+        navigator.navigate('/', page)
+        navigator.navigate('feed', page, 'second')
+        navigator.navigate('/', page)
+        navigator.navigate('feed', page)
+
+        assert builds.count('feed') == 3
+
+
+def test_excluded_routes_are_rebuilt(page) -> None:
+    builds = []
+
+    navigator = _navigator(page, builds, keep_alive_exclude=('feed',))
+
+    navigator.navigate('feed', page)
+    navigator.navigate('/', page)
+    navigator.navigate('feed', page)
+
+    assert builds.count('feed') == 2
+
+
+def test_least_recently_used_pages_are_evicted(page) -> None:
+    builds = []
+
+    navigator = _navigator(page, builds, True, keep_alive_limit=2)
+
+    for route in ('feed', 'settings', 'feed', '/', 'settings'):
+        navigator.navigate(route, page)
+
+    # `feed` was reused, while `/` and then `settings` were evicted as the least recently used pages.
+    assert builds == ['/', 'feed', 'settings', '/', 'settings']
+
+
+def test_pages_over_the_size_budget_are_not_kept(page) -> None:
+    builds = []
+
+    navigator = _navigator(page, builds, keep_alive_max_size=1)
+
+    navigator.navigate('feed', page)
+    navigator.navigate('/', page)
+    navigator.navigate('feed', page)
+
+    assert builds.count('feed') == 2
+
+
+def test_discarded_pages_are_rebuilt(page) -> None:
+    builds = []
+
+    navigator = _navigator(page, builds)
+
+    navigator.navigate('feed', page)
+    navigator.navigate('settings', page)
+
+    navigator.discard_kept_alive('feed')
+
+    navigator.navigate('feed', page)
+    navigator.navigate('settings', page)
+
+    assert builds == ['/', 'feed', 'settings', 'feed']
+
+    navigator.discard_kept_alive()
+
+    navigator.navigate('feed', page)
+
+    assert builds.count('feed') == 3
+
+
+def test_fn_process_applies_navigator_options(page) -> None:
+    builds = []
+
+    fn_process(virtual=True, routes={'/': lambda ctx: builds.append(ctx.navigator)}, navigator_options={'keep_alive': True, 'keep_alive_limit': 3})(page)
+
+    assert builds[0].keep_alive and builds[0].keep_alive_limit == 3
@@ -0,0 +1,184 @@
+"""Persistent layouts with a content outlet."""
+
+import pytest
+
+from flet import Column, Text
+
+from flet_navigator import HeadlessPage, VirtualFletNavigator, layout
+
+
+class UpdateRecordingPage(HeadlessPage):
+    """A headless page that records which controls each update was sent for."""
+
+    def __init__(self) -> None:
+        super().__init__()
+
+        self.sent: list[tuple] = []
+
+    def update(self, *controls) -> None:
+        super().update(*controls)
+
+        self.sent.append(controls)
+
+
+def _content(name: str) -> object:
+    return lambda ctx: ctx.add(Text(name))
+
+
+def _texts(controls: list) -> list[str]:
+    return [control.value for control in controls]
+
+
+def test_layout_is_built_once_and_its_outlet_refilled(page) -> None:
+    builds = []
+
+    @layout('dashboard')
+    def shell(ctx, outlet: Column) -> None:
+        builds.append(ctx.current_route())
+
+        ctx.add(Text('shell'), outlet)
+
+    navigator = VirtualFletNavigator({'/': _content('home'), 'dashboard': _content('overview'), 'dashboard/stats': _content('stats')})
+
+    navigator.process(page)
+    navigator.navigate('dashboard', page)
+    navigator.navigate('dashboard/stats', page)
+
+    assert builds == ['dashboard']
+
+    shell_text, outlet = page.controls
+
+    assert shell_text.value == 'shell'
+    assert _texts(outlet.controls) == ['stats']
+
+
+def test_layout_is_rebuilt_after_leaving_its_prefix(page) -> None:
+    builds = []
+
+    layout('dashboard')(lambda ctx, outlet: (builds.append(ctx), ctx.add(outlet)))
+
+    navigator = VirtualFletNavigator({'/': _content('home'), 'dashboard': _content('overview')})
+
+    navigator.process(page)
+
+    for route in ('dashboard', '/', 'dashboard'):
+        navigator.navigate(route, page)
+
+    assert len(builds) == 2
+    assert _texts(page.controls[0].controls) == ['overview']
+
+
+def test_layouts_nest_by_prefix(page) -> None:
+    layout('/')(lambda ctx, outlet: ctx.add(Text('app'), outlet))
+    layout('dashboard')(lambda ctx, outlet: ctx.add(Text('dashboard'), outlet))
+
+    navigator = VirtualFletNavigator({'/': _content('home'), 'dashboard/stats': _content('stats')})
+
+    navigator.process(page)
+
+    app_text, app_outlet = page.controls
+
+    assert (app_text.value, _texts(app_outlet.controls)) == ('app', ['home'])
+
+    navigator.navigate('dashboard/stats', page)
+
+    dashboard_text, dashboard_outlet = app_outlet.controls
+
+    assert (dashboard_text.value, _texts(dashboard_outlet.controls)) == ('dashboard', ['stats'])
+
+
+def test_only_the_outlet_is_sent_while_layouts_stay_mounted() -> None:
+    page = UpdateRecordingPage()
+
+    layout('/')(lambda ctx, outlet: ctx.add(Text('app'), outlet))
+
+    navigator = VirtualFletNavigator({'/': _content('home'), 'feed': _content('feed')})
+
+    navigator.process(page)
+
+    outlet = page.controls[1]
+
+    page.sent.clear()
+
+    cleans = page.cleans
+
+    navigator.navigate('feed', page)
+
+    assert page.sent == [(outlet,)]
+    assert page.cleans == cleans
+
+
+def test_changed_page_props_send_the_whole_page() -> None:
+    def titled(ctx) -> None:
+        ctx.spec_cpage_props(title='A')
+
+        ctx.add(Text('a'))
+
+    for batch_updates in (False, True):
+        page = UpdateRecordingPage()
+
+        layout('/')(lambda ctx, outlet: ctx.add(Text('app'), outlet))
+
+        navigator = VirtualFletNavigator({'/': _content('home'), 'a': titled})
+
+        navigator.batch_updates = batch_updates
+
+        navigator.process(page)
+
+        page.sent.clear()
+
+        navigator.navigate('a', page)
+
+        assert page.title == 'A'
+        assert () in page.sent
+
+        page.sent.clear()
+
+        navigator.navigate('/', page)
+
+        assert page.title is None
+        assert page.sent == [()]
+
+
+def test_pages_cleaned_outside_the_navigator_are_rebuilt(page) -> None:
+    builds = []
+
+    layout('/')(lambda ctx, outlet: (builds.append(ctx), ctx.add(outlet)))
+
+    navigator = VirtualFletNavigator({'/': _content('home'), 'feed': _content('feed')})
+
+    navigator.process(page)
+
+    page.clean()
+
+    navigator.navigate('feed', page)
+
+    assert len(builds) == 2
+    assert _texts(page.controls[0].controls) == ['feed']
+
+
+def test_controls_added_after_the_render_update_the_outlet() -> None:
+    page, contexts = UpdateRecordingPage(), []
+
+    layout('/')(lambda ctx, outlet: ctx.add(Text('app'), outlet))
+
+    navigator = VirtualFletNavigator({'/': contexts.append})
+
+    navigator.process(page)
+
+    outlet = page.controls[1]
+
+    page.sent.clear()
+
+    contexts[0].add(Text('late'))
+
+    assert page.sent == [(outlet,)]
+    assert _texts(outlet.controls) == ['late']
+
+
+def test_async_layouts_are_rejected() -> None:
+    async def shell(ctx, outlet: Column) -> None:
+        ctx.add(outlet)
+
+    with pytest.raises(TypeError):
+        layout('/')(shell)
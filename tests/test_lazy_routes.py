@@ -0,0 +1,93 @@
+"""Lazy routes, background prefetch and import timings."""
+
+from sys import modules
+
+from uuid import uuid4
+
+import pytest
+
+from flet import Text
+
+from flet_navigator import LazyPageDefinition, VirtualFletNavigator, lazy
+
+from tests.support import wait_until
+
+
+@pytest.fixture
+def pages(tmp_path, monkeypatch) -> str:
+    """A fresh importable package with `reports` and `settings` page modules; returns its name."""
+    package = f'fn_pages_{uuid4().hex}'
+
+    (tmp_path / package).mkdir()
+
+    (tmp_path / package / '__init__.py').write_text('')
+
+    for name in ('reports', 'settings'):
+        (tmp_path / package / f'{name}.py').write_text(f'from flet import Text\n\n\ndef {name}(ctx):\n    ctx.add(Text({name!r}))\n')
+
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    yield package
+
+    for module in [module for module in modules if module.startswith(package)]:
+        del modules[module]
+
+
+def _navigator(page, pages: str, **options) -> VirtualFletNavigator:
+    navigator = VirtualFletNavigator({'/': lambda ctx: ctx.add(Text('home')), 'reports': lazy(f'{pages}/reports'), 'settings': lazy(f'{pages}.settings')})
+
+    for option, value in options.items():
+        setattr(navigator, option, value)
+
+    navigator.process(page)
+
+    return navigator
+
+
+def test_pages_are_imported_on_first_navigation(page, pages) -> None:
+    navigator = _navigator(page, pages)
+
+    assert f'{pages}.reports' not in modules
+    assert navigator.import_timings() == {}
+
+    navigator.navigate('reports', page)
+
+    assert [control.value for control in page.controls] == ['reports']
+    assert list(navigator.import_timings()) == ['reports']
+    assert not navigator.routes['settings'].loaded
+
+
+def test_pages_are_loaded_once(pages) -> None:
+    lazy_page = lazy(f'{pages}/reports')
+
+    assert isinstance(lazy_page, LazyPageDefinition)
+
+    first = lazy_page.load()
+
+    import_time = lazy_page.import_time
+
+    assert lazy_page.load() is first
+    assert lazy_page.import_time == import_time
+
+
+def test_prefetch_loads_lazy_pages_in_the_background(page, pages) -> None:
+    navigator = _navigator(page, pages)
+
+    navigator.prefetch()
+
+    assert wait_until(lambda: navigator.routes['reports'].loaded and navigator.routes['settings'].loaded)
+
+
+def test_lazy_prefetch_runs_after_the_homepage_renders(page, pages) -> None:
+    navigator = _navigator(page, pages, lazy_prefetch=('settings',))
+
+    assert wait_until(lambda: navigator.routes['settings'].loaded)
+    assert not navigator.routes['reports'].loaded
+
+
+def test_prefetch_failures_are_logged(page, pages, caplog) -> None:
+    navigator = VirtualFletNavigator({'/': lambda ctx: None, 'broken': lazy(f'{pages}/missing')})
+
+    navigator.prefetch()
+
+    assert wait_until(lambda: 'Failed to prefetch page' in caplog.text)
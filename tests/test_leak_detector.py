@@ -0,0 +1,86 @@
+"""The control-tree leak detector."""
+
+from flet import Column, Text
+
+from flet_navigator import ControlLeakDetector, VirtualFletNavigator
+
+
+def _navigator(page, retained: list, detector: ControlLeakDetector) -> VirtualFletNavigator:
+    navigator = VirtualFletNavigator({
+        '/': lambda ctx: ctx.add(Text('home')),
+        'leaky': lambda ctx: (retained.append(column := Column([Text('kept'), Text('alive')])), ctx.add(column)),
+        'clean': lambda ctx: ctx.add(Column([Text('released')]))
+    })
+
+    navigator.leak_detector = detector
+
+    navigator.process(page)
+
+    return navigator
+
+
+def test_retained_trees_are_reported(page) -> None:
+    retained, detector = [], ControlLeakDetector(after_navigations=2)
+
+    navigator = _navigator(page, retained, detector)
+
+    for route in ('leaky', '/', 'clean', '/', '/'):
+        navigator.navigate(route, page)
+
+    report = detector.report()
+
+    assert list(report) == ['leaky']
+    assert report['leaky']['live_trees'] == 1
+    assert report['leaky']['live_controls'] == 3
+    assert report['leaky']['retained_size'] > 0
+
+
+def test_recent_trees_are_not_reported(page) -> None:
+    retained, detector = [], ControlLeakDetector(after_navigations=10)
+
+    navigator = _navigator(page, retained, detector)
+
+    navigator.navigate('leaky', page)
+    navigator.navigate('/', page)
+
+    assert detector.report() == {}
+
+
+def test_prune_and_reset(page) -> None:
+    retained, detector = [], ControlLeakDetector(after_navigations=1)
+
+    navigator = _navigator(page, retained, detector)
+
+    for route in ('leaky', 'clean', '/'):
+        navigator.navigate(route, page)
+
+    detector.report()
+
+    detector.prune()
+
+    assert [tree[1] for tree in detector._trees] == ['leaky', '/']
+
+    detector.reset()
+
+    assert (detector.navigations, detector.report()) == (0, {})
+
+
+def test_max_tracked_bounds_the_tracking(page) -> None:
+    retained, detector = [], ControlLeakDetector(after_navigations=0, max_tracked=2)
+
+    navigator = _navigator(page, retained, detector)
+
+    for _ in range(3):
+        navigator.navigate('leaky', page)
+
+    assert detector.navigations == 4
+    assert len(retained) == 3
+    assert detector.report()['leaky']['live_trees'] == 2
+
+
+def test_nothing_is_tracked_without_a_detector(page) -> None:
+    navigator = VirtualFletNavigator({'/': lambda ctx: ctx.add(Text('home'))})
+
+    navigator.process(page)
+
+    assert navigator.leak_detector is None
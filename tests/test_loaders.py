@@ -0,0 +1,194 @@
+"""Route data loaders: early start, caching, stale-while-revalidate and invalidation."""
+
+from threading import current_thread, enumerate as threads
+
+from flet import Text
+
+from flet_navigator import VirtualFletNavigator, loader
+
+from tests.support import wait_until
+
+
+def _navigator(page, **options) -> VirtualFletNavigator:
+    navigator = VirtualFletNavigator({
+        '/': lambda ctx: ctx.add(Text('home')),
+        'user/<id:int>': lambda ctx: ctx.add(Text(str(ctx.data(2))))
+    })
+
+    for option, value in options.items():
+        setattr(navigator, option, value)
+
+    navigator.process(page)
+
+    return navigator
+
+
+def _shown(page) -> str:
+    return page.controls[0].value
+
+
+def test_loader_result_reaches_the_page(page) -> None:
+    threads = []
+
+    @loader('user/<id:int>')
+    def load_user(parameters) -> int:
+        threads.append(current_thread().name)
+
+        return parameters['id'] * 2
+
+    navigator = _navigator(page)
+
+    navigator.navigate('user/21', page)
+
+    assert _shown(page) == '42'
+    assert threads[0].startswith('FN-loader')
+
+
+def test_route_without_loader_has_no_data(page) -> None:
+    navigator = VirtualFletNavigator({'/': lambda ctx: ctx.add(Text(repr(ctx.data())))})
+
+    navigator.process(page)
+
+    assert _shown(page) == 'None'
+
+
+def test_results_are_reused_within_ttl(page) -> None:
+    calls = []
+
+    @loader('user/<id:int>', ttl=60)
+    def load_user(parameters) -> int:
+        calls.append(parameters['id'])
+
+        return len(calls)
+
+    navigator = _navigator(page)
+
+    navigator.navigate('user/1', page)
+    navigator.navigate('/', page)
+    navigator.navigate('user/1', page)
+
+    assert _shown(page) == '1'
+
+    navigator.navigate('user/2', page)
+
+    assert _shown(page) == '2'
+    assert calls == [1, 2]
+
+
+def test_stale_result_is_served_while_revalidating(page) -> None:
+    calls = []
+
+    @loader('user/<id:int>', stale_while_revalidate=60)
+    def load_user(_) -> int:
+        calls.append(None)
+
+        return len(calls)
+
+    navigator = _navigator(page)
+
+    navigator.navigate('user/1', page)
+    navigator.navigate('/', page)
+    navigator.navigate('user/1', page)
+
+    assert _shown(page) == '1'
+    assert wait_until(lambda: len(calls) == 2)
+    assert wait_until(lambda: not navigator._loader_cache[('user/<id:int>', (('id', 1),))][2])
+
+    navigator.navigate('/', page)
+    navigator.navigate('user/1', page)
+
+    assert _shown(page) == '2'
+
+
+def test_failed_loads_are_not_cached(page, caplog) -> None:
+    calls = []
+
+    @loader('user/<id:int>', ttl=60)
+    def load_user(_) -> int:
+        calls.append(None)
+
+        if len(calls) == 1:
+            raise RuntimeError('backend down')
+
+        return len(calls)
+
+    navigator = VirtualFletNavigator({'/': lambda ctx: None, 'user/<id:int>': lambda ctx: ctx.add(Text(str(ctx.loader_future.exception(2))))})
+
+    navigator.process(page)
+
+    navigator.navigate('user/1', page)
+
+    assert _shown(page) == 'backend down'
+    assert wait_until(lambda: 'Data loader of route "user/<id:int>" failed: backend down' in caplog.text)
+
+    navigator.navigate('/', page)
+    navigator.navigate('user/1', page)
+
+    assert len(calls) == 2
+
+
+def test_invalidate_route_data(page) -> None:
+    calls = []
+
+    @loader('user/<id:int>', ttl=60)
+    def load_user(_) -> int:
+        calls.append(None)
+
+        return len(calls)
+
+    navigator = _navigator(page)
+
+    navigator.navigate('user/1', page)
+    navigator.navigate('/', page)
+
+    navigator.invalidate_route_data('user/<id:int>')
+
+    navigator.navigate('user/1', page)
+
+    assert _shown(page) == '2'
+
+
+def test_loader_cache_limit(page) -> None:
+    calls = []
+
+    @loader('user/<id:int>', ttl=60)
+    def load_user(parameters) -> int:
+        calls.append(parameters['id'])
+
+        return parameters['id']
+
+    navigator = _navigator(page, loader_cache_limit=1)
+
+    for user in (1, 2, 1):
+        navigator.navigate(f'user/{user}', page)
+
+    assert calls == [1, 2, 1]
+
+
+def test_async_loader_with_async_page(page) -> None:
+    @loader('user/<id:int>')
+    async def load_user(parameters) -> str:
+        return f'user {parameters["id"]}'
+
+    async def user_page(ctx) -> None:
+        ctx.add(Text(await ctx.data_async()))
+
+    navigator = VirtualFletNavigator({'/': lambda ctx: None, 'user/<id:int>': user_page})
+
+    navigator.process(page)
+
+    navigator.navigate('user/7', page)
+
+    assert wait_until(lambda: page.controls and _shown(page) == 'user 7')
+
+
+def test_navigators_share_one_loader_pool(page) -> None:
+    @loader('user/<id:int>')
+    def load_user(parameters) -> int:
+        return parameters['id']
+
+    for user in range(20):
+        _navigator(page).navigate(f'user/{user}', page)
+
+    assert _shown(page) == '19'
+    assert 0 < len([thread for thread in threads() if thread.name.startswith('FN-loader')]) <= VirtualFletNavigator.loader_workers
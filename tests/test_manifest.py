@@ -0,0 +1,133 @@
+"""Route manifests: scanning a pages package without importing it and registering its routes lazily."""
+
+from json import loads
+
+from subprocess import run
+
+from sys import executable, modules
+
+from uuid import uuid4
+
+import pytest
+
+import flet_navigator
+
+from flet_navigator import LazyPageDefinition, fn_process, load_route_manifest, route, scan_routes, write_route_manifest
+
+
+_PAGE_MODULES = {
+    'home': 'from flet import Text\n\nfrom flet_navigator import route\n\n\n@route(\'/\')\ndef home(ctx):\n    ctx.add(Text(\'home\'))\n',
+    'reports': 'from flet import Text\n\nfrom flet_navigator import route\n\n\n@route\ndef reports(ctx):\n    ctx.spec_cpage_props(title=\'Reports\')\n\n    ctx.add(Text(\'reports\'))\n',
+    'settings': 'from flet import Text\n\nimport flet_navigator\n\n\n@flet_navigator.route(\'settings\')\ndef settings_page(ctx):\n    ctx.spec_cpage_props(title=str(ctx))\n\n    ctx.add(Text(\'settings\'))\n\n\ndef helper():\n    pass\n'
+}
+
+
+@pytest.fixture
+def pages(tmp_path, monkeypatch) -> str:
+    """A fresh importable pages package; returns its name."""
+    package = f'fn_pages_{uuid4().hex}'
+
+    (tmp_path / package).mkdir()
+
+    (tmp_path / package / '__init__.py').write_text('')
+
+    for name, source in _PAGE_MODULES.items():
+        (tmp_path / package / f'{name}.py').write_text(source)
+
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    yield package
+
+    for module in [module for module in modules if module.startswith(package)]:
+        del modules[module]
+
+
+def test_scan_finds_routes_without_importing(tmp_path, pages) -> None:
+    routes = scan_routes(str(tmp_path / pages), str(tmp_path))
+
+    assert routes == [
+        {'route': '/', 'module': f'{pages}.home', 'name': 'home'},
+        {'route': 'reports', 'module': f'{pages}.reports', 'name': 'reports', 'props': {'title': 'Reports'}},
+        {'route': 'settings', 'module': f'{pages}.settings', 'name': 'settings_page'}
+    ]
+
+    assert not [module for module in modules if module.startswith(pages)]
+
+
+def test_manifest_round_trip(tmp_path, pages) -> None:
+    manifest = tmp_path / 'routes.json'
+
+    assert write_route_manifest(str(tmp_path / pages), str(manifest), str(tmp_path)) == 3
+    assert len(loads(manifest.read_text())['routes']) == 3
+
+    routes, props = load_route_manifest(str(manifest))
+
+    assert list(routes) == ['/', 'reports', 'settings']
+    assert all(isinstance(page_definition, LazyPageDefinition) for page_definition in routes.values())
+    assert props == {hash('reports'): {'title': 'Reports'}}
+
+
+def test_fn_process_registers_manifest_routes_lazily(tmp_path, page, pages) -> None:
+    manifest = tmp_path / 'routes.json'
+
+    write_route_manifest(str(tmp_path / pages), str(manifest), str(tmp_path))
+
+    fn_process(virtual=True, manifest=str(manifest))(page)
+
+    assert [control.value for control in page.controls] == ['home']
+    assert f'{pages}.home' in modules
+    assert f'{pages}.reports' not in modules
+
+
+def test_manifest_props_are_seeded(tmp_path, page, pages) -> None:
+    manifest = tmp_path / 'routes.json'
+
+    write_route_manifest(str(tmp_path / pages), str(manifest), str(tmp_path))
+
+    navigator = fn_process(virtual=True, manifest=str(manifest))(page)[0]
+
+    assert navigator.props_map[hash('reports')] == {'title': 'Reports'}
+
+
+def test_command_line_writes_manifest(tmp_path, pages) -> None:
+    output = tmp_path / 'out.json'
+
+    result = run([executable, '-m', 'flet_navigator', 'manifest', str(tmp_path / pages), '-o', str(output), '--root', str(tmp_path)], capture_output=True, text=True)
+
+    assert result.returncode == 0
+    assert 'Wrote 3 routes' in result.stdout
+    assert [entry['route'] for entry in loads(output.read_text())['routes']] == ['/', 'reports', 'settings']
+
+
+def test_loading_a_manifest_page_keeps_the_shared_registry(tmp_path, page, pages) -> None:
+    manifest = tmp_path / 'routes.json'
+
+    write_route_manifest(str(tmp_path / pages), str(manifest), str(tmp_path))
+
+    session = fn_process(virtual=True, manifest=str(manifest))
+
+    first = session(page)[0]
+
+    version = flet_navigator._pre_def_routes_version
+
+    first.navigate('reports', page)
+
+    assert f'{pages}.reports' in modules
+    assert flet_navigator._pre_def_routes_version == version
+    assert session(page)[0].routes is first.routes
+
+
+def test_non_literal_route_names_are_logged(tmp_path, pages, caplog) -> None:
+    (tmp_path / pages / 'dynamic.py').write_text('from flet_navigator import route\n\n\nNAME = \'dynamic\'\n\n\n@route(NAME)\ndef dynamic(ctx):\n    pass\n')
+
+    routes = scan_routes(str(tmp_path / pages), str(tmp_path))
+
+    assert 'dynamic' not in [entry['name'] for entry in routes]
+    assert f'The route name of page definition "{pages}.dynamic.dynamic" is not a string literal' in caplog.text
+
+
+def test_route_decorator_returns_the_page_definition() -> None:
+    def page_definition(_) -> None:
+        pass
+
+    assert route('decorated')(page_definition) is page_definition
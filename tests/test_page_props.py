@@ -0,0 +1,80 @@
+"""The incrementally maintained page-property index."""
+
+from flet import Text
+
+from flet_navigator import HeadlessPage, VirtualFletNavigator
+
+
+class RecordingPage(HeadlessPage):
+    """A page that records every page-level property write."""
+
+    def __init__(self) -> None:
+        super().__init__()
+
+        self.writes: list[tuple[str, object]] = []
+
+    def __setattr__(self, name: str, value: object) -> None:
+        if name in ('title', 'bgcolor'):
+            self.writes.append((name, value))
+
+        super().__setattr__(name, value)
+
+
+def _titled(title: str, **props) -> object:
+    return lambda ctx: (ctx.spec_cpage_props(title=title, **props), ctx.add(Text(title)))
+
+
+def test_index_follows_the_properties_map() -> None:
+    navigator = VirtualFletNavigator({'/': lambda ctx: None})
+
+    props_map = navigator.props_map
+
+    props_map[1] = {'title': 'A', 'bgcolor': 'red'}
+    props_map[2] = {'title': 'B'}
+
+    assert dict(props_map.known_props) == {'title': 2, 'bgcolor': 1}
+
+    props_map[1] = {'title': 'A'}
+
+    assert dict(props_map.known_props) == {'title': 2}
+
+    props_map.pop(2)
+
+    del props_map[1]
+
+    assert not props_map.known_props
+
+
+def test_properties_are_applied_and_reset_between_routes() -> None:
+    page = RecordingPage()
+
+    navigator = VirtualFletNavigator({'/': lambda ctx: None, 'a': _titled('A', bgcolor='red'), 'b': _titled('B')})
+
+    navigator.process(page)
+    navigator.navigate('a', page)
+    navigator.navigate('b', page)
+    navigator.navigate('a', page)
+
+    assert (page.title, page.bgcolor) == ('A', 'red')
+
+    navigator.navigate('/', page)
+
+    assert (page.title, page.bgcolor) == (None, None)
+
+
+def test_only_changed_properties_are_written() -> None:
+    page = RecordingPage()
+
+    navigator = VirtualFletNavigator({'/': lambda ctx: None, 'a': _titled('Same', bgcolor='red'), 'b': _titled('Same', bgcolor='blue')})
+
+    navigator.process(page)
+    navigator.navigate('a', page)
+    navigator.navigate('b', page)
+
+    page.writes.clear()
+
+    navigator.navigate('a', page)
+
+    # The title is the same object on both routes, so only the background color is written (by the navigator).
+    assert [write for write in page.writes if write[0] == 'title'] == []
+    assert ('bgcolor', 'red') in page.writes
@@ -0,0 +1,123 @@
+"""Idle prerendering of likely next routes."""
+
+from flet import Text
+
+from flet_navigator import AbstractFletNavigator, PublicFletNavigator
+
+from tests.support import wait_until
+
+
+def _warmed_up(page, builds: list, **options) -> PublicFletNavigator:
+    """A navigator that learned the `/` -> `feed` transition and prerendered `feed`."""
+    navigator = PublicFletNavigator(page, {'/': lambda ctx: ctx.add(Text('home')), 'feed': lambda ctx: (builds.append(ctx), ctx.add(Text('feed')))})
+
+    navigator.prerender = 1
+
+    for option, value in options.items():
+        setattr(navigator, option, value)
+
+    navigator.process(page)
+    navigator.navigate('feed', page)
+    navigator.navigate('/', page)
+
+    return navigator
+
+
+def test_prerendered_tree_is_used_on_the_next_visit(page) -> None:
+    builds = []
+
+    navigator = _warmed_up(page, builds)
+
+    assert wait_until(lambda: navigator.prerender_stats()['prerendered'] == ['feed'])
+
+    assert len(builds) == 2
+
+    navigator.navigate('feed', page)
+
+    assert len(builds) == 2
+    assert [control.value for control in page.controls] == ['feed']
+
+    stats = navigator.prerender_stats()
+
+    assert (stats['hits'], stats['prerendered']) == (1, [])
+
+
+def test_visits_with_parameters_or_arguments_are_rendered(page) -> None:
+    builds = []
+
+    navigator = _warmed_up(page, builds)
+
+    assert wait_until(lambda: navigator.prerender_stats()['prerendered'] == ['feed'])
+
+    navigator.navigate('feed', page, parameters={'tab': 2})
+
+    assert len(builds) == 3
+    assert builds[-1].parameters == {'tab': 2}
+    assert navigator.prerender_stats()['hits'] == 0
+
+
+def test_pages_over_the_size_budget_are_not_kept(page) -> None:
+    builds = []
+
+    navigator = _warmed_up(page, builds, prerender_max_size=1)
+
+    # The idle task still builds the page, but drops the tree.
+    assert wait_until(lambda: len(builds) == 2)
+
+    assert navigator.prerender_stats()['prerendered'] == []
+    assert navigator.prerender_stats()['size'] == 0
+
+
+def test_prerendering_is_disabled_by_default(page) -> None:
+    builds = []
+
+    navigator = _warmed_up(page, builds, prerender=0)
+
+    navigator.navigate('feed', page)
+
+    assert len(builds) == 2
+
+
+def test_prerendered_context_goes_live(page) -> None:
+    builds = []
+
+    navigator = _warmed_up(page, builds)
+
+    assert wait_until(lambda: navigator.prerender_stats()['prerendered'] == ['feed'])
+
+    navigator.navigate('feed', page)
+
+    prerendered = builds[-1]
+
+    assert prerendered.page is page
+
+    prerendered.add(Text('late'))
+
+    prerendered.spec_cpage_props(title='Feed')
+
+    assert [control.value for control in page.controls] == ['feed', 'late']
+    assert page.title == 'Feed'
+
+
+def test_prerendering_doesnt_touch_the_live_page(page) -> None:
+    def feed(ctx) -> None:
+        ctx.page.title = 'offscreen'
+
+        ctx.page.update()
+
+        ctx.navigate('/')
+
+        ctx.add(Text('feed'))
+
+    navigator = PublicFletNavigator(page, {'/': lambda ctx: None, 'feed': feed})
+
+    navigator.prerender = 1
+
+    navigator.process(page)
+
+    page.title, updates = 'live', page.updates
+
+    AbstractFletNavigator.prerender_route(navigator, page, 'feed')
+
+    assert navigator.prerender_stats()['prerendered'] == ['feed']
+    assert (page.title, page.updates, navigator.route) == ('live', updates, '/')
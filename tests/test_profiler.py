@@ -0,0 +1,61 @@
+"""Phase-level navigation profiling."""
+
+from json import loads
+
+from flet import Text
+
+from flet_navigator import ROUTE_404, NavigationProfiler, NavigationStats, PublicFletNavigator
+
+
+def test_every_phase_is_timed_per_route_pattern(page) -> None:
+    phases = []
+
+    profiler = NavigationProfiler(hooks=(lambda route, phase, seconds: phases.append((route, phase)),))
+
+    navigator = PublicFletNavigator(page, {'/': lambda ctx: None, 'user/<id:int>': lambda ctx: ctx.add(Text('user'))}, lambda ctx: None)
+
+    navigator.profiler = profiler
+
+    navigator.process(page)
+
+    phases.clear()
+
+    navigator.navigate('user/7', page)
+
+    assert [phase for route, phase in phases if route == 'user/<id:int>'] == ['parse', 'clean', 'props', 'render', 'update', 'callback']
+
+    navigator.navigate('missing', page)
+
+    assert (ROUTE_404, 'render') in phases
+
+    stats = profiler.stats.as_dict()
+
+    assert stats['user/<id:int>']['render']['count'] == 1
+
+
+def test_navigators_without_a_profiler_record_nothing(page) -> None:
+    navigator = PublicFletNavigator(page, {'/': lambda ctx: None, 'a': lambda ctx: None})
+
+    navigator.process(page)
+    navigator.navigate('a', page)
+
+    assert navigator.profiler is None
+
+
+def test_stats_percentiles_and_export() -> None:
+    stats = NavigationStats(max_samples=100)
+
+    for milliseconds in range(1, 201):
+        stats.record('feed', 'render', milliseconds / 1000)
+
+    summary = stats.as_dict()['feed']['render']
+
+    # Only the most recent 100 samples (101..200 ms) are kept.
+    assert summary['count'] == 100
+    assert round(summary['p50_ms']) == 150 and round(summary['p95_ms']) == 195 and round(summary['p99_ms']) == 199
+
+    assert loads(stats.to_jsonl()) == {'route': 'feed', 'phase': 'render', **summary}
+
+    stats.reset()
+
+    assert stats.as_dict() == {}
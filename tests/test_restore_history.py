@@ -0,0 +1,87 @@
+"""Restoring a deep-link history in a single render."""
+
+from flet import Text
+
+from flet_navigator import PublicFletNavigator, VirtualFletNavigator, guard
+
+
+def _navigator(page, virtual: bool, visits: list) -> object:
+    route_map = {route: (lambda name: lambda ctx: (visits.append((name, dict(ctx.parameters))), ctx.add(Text(name))))(route) for route in ('/', 'a', 'b', 'c', 'login')}
+
+    navigator = VirtualFletNavigator(route_map) if virtual else PublicFletNavigator(page, route_map)
+
+    navigator.process(page)
+
+    visits.clear()
+
+    return navigator
+
+
+def test_only_the_last_route_is_rendered(page) -> None:
+    for virtual in (False, True):
+        visits = []
+
+        navigator = _navigator(page, virtual, visits)
+
+        navigator.restore_history(['a', 'b', 'c'], page)
+
+        assert visits == [('c', {})]
+        assert navigator.route == 'c'
+        assert list(navigator.previous_routes) == ['/', 'a', 'b']
+
+
+def test_back_restores_entries_with_their_parameters(page) -> None:
+    visits = []
+
+    navigator = _navigator(page, False, visits)
+
+    navigator.restore_history([('a', {'tab': 2}), 'b?q=x', 'c'], page)
+
+    navigator.navigate_back(page)
+
+    assert navigator.route == 'b'
+    assert visits[-1] == ('b', {'q': 'x'})
+
+    navigator.navigate_back(page)
+
+    assert page.route == 'a?tab=2'
+
+    navigator.navigate_forward(page)
+
+    assert navigator.route == 'b'
+
+
+def test_invalid_entries_are_skipped(page, caplog) -> None:
+    visits = []
+
+    navigator = _navigator(page, True, visits)
+
+    navigator.restore_history(['a', 'missing', 'b?q=x'], page)
+
+    assert visits == [('b', {})]
+    assert list(navigator.previous_routes) == ['/', 'a']
+    assert 'Route "missing" does not exist' in caplog.text
+    assert 'does not support URL parameters' in caplog.text
+
+
+def test_nothing_changes_without_valid_entries(page) -> None:
+    visits = []
+
+    navigator = _navigator(page, True, visits)
+
+    navigator.restore_history(['missing'], page)
+
+    assert (visits, navigator.route, list(navigator.previous_routes)) == ([], '/', [])
+
+
+def test_the_final_route_still_runs_its_guards(page) -> None:
+    guard('c')(lambda ctx: 'login')
+
+    visits = []
+
+    navigator = _navigator(page, True, visits)
+
+    navigator.restore_history(['a', 'c'], page)
+
+    assert navigator.route == 'login'
+    assert [visit[0] for visit in visits] == ['login']
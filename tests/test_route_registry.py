@@ -0,0 +1,111 @@
+"""The shared, copy-on-write route registry."""
+
+from threading import Thread
+
+import pytest
+
+import flet_navigator
+
+from flet_navigator import PublicFletNavigator, RouteRegistry, VirtualFletNavigator, route
+
+
+def _blank(ctx) -> None: ...
+
+
+def test_sessions_built_from_the_same_routes_share_one_registry(page) -> None:
+    routes = {'/': _blank, 'a': _blank, 'user/<id:int>': _blank}
+
+    first, second = VirtualFletNavigator(routes), PublicFletNavigator(page, routes)
+
+    assert isinstance(first.routes, RouteRegistry)
+    assert first.routes is second.routes
+    assert first.props_map is not second.props_map
+
+
+def test_the_callers_routes_are_not_modified() -> None:
+    route('decorated')(_blank)
+
+    routes = {'/': _blank, 'in valid': _blank}
+
+    navigator = VirtualFletNavigator(routes)
+
+    assert routes == {'/': _blank, 'in valid': _blank}
+    assert set(navigator.routes) == {'/', 'decorated'}
+
+
+def test_registry_is_read_only() -> None:
+    navigator = VirtualFletNavigator({'/': _blank})
+
+    with pytest.raises(TypeError):
+        navigator.routes['a'] = _blank
+
+
+def test_add_routes_is_copy_on_write(page) -> None:
+    routes = {'/': _blank, 'a': _blank}
+
+    first, second = VirtualFletNavigator(routes), VirtualFletNavigator(routes)
+
+    shared = first.routes
+
+    first.add_routes({'b': _blank})
+
+    assert 'b' in first.routes and 'b' not in second.routes
+    assert second.routes is shared
+
+    first.navigate('b', page)
+
+    assert first.route == 'b'
+
+
+def test_new_route_registrations_give_a_new_registry() -> None:
+    routes = {'/': _blank}
+
+    before = VirtualFletNavigator(routes).routes
+
+    route('late')(_blank)
+
+    after = VirtualFletNavigator(routes).routes
+
+    assert after is not before
+    assert 'late' in after and 'late' not in before
+
+
+def test_routes_changed_in_place_give_a_new_registry() -> None:
+    routes = {'/': _blank, 'a': _blank}
+
+    before = VirtualFletNavigator(routes).routes
+
+    routes['b'] = routes.pop('a')
+
+    assert set(VirtualFletNavigator(routes).routes) == {'/', 'b'}
+    assert set(before) == {'/', 'a'}
+
+
+def test_every_registration_bumps_the_version_once() -> None:
+    version = flet_navigator._pre_def_routes_version
+
+    route(_blank)
+    route('named')(_blank)
+
+    assert flet_navigator._pre_def_routes_version == version + 2
+
+
+def test_sessions_built_concurrently() -> None:
+    failures = []
+
+    def build_sessions(thread: int) -> None:
+        try:
+            for session in range(50):
+                assert 'x' in VirtualFletNavigator({'/': _blank, 'x': _blank, f'r{thread}_{session % 40}': _blank}).routes
+        except Exception as build_exc:
+            failures.append(build_exc)
+
+    threads = [Thread(target=build_sessions, args=(thread,)) for thread in range(8)]
+
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    assert failures == []
@@ -0,0 +1,78 @@
+"""The compiled route table and typed path parameters."""
+
+from flet import Text
+
+from flet_navigator import ROUTE_404, PublicFletNavigator, VirtualFletNavigator, path_converter
+
+
+def _blank(ctx) -> None: ...
+
+
+def test_typed_parameters_are_converted_and_passed_to_the_page(page) -> None:
+    seen = []
+
+    routes = {'/': _blank, 'user/<id:int>': lambda ctx: seen.append(ctx.parameters), 'price/<amount:float>/<currency>': lambda ctx: seen.append(ctx.parameters)}
+
+    navigator = PublicFletNavigator(page, routes)
+
+    navigator.process(page)
+
+    navigator.navigate('user/42', page, parameters={'tab': 'posts'})
+    navigator.navigate('price/9.5/EUR', page)
+
+    assert seen == [{'tab': 'posts', 'id': 42}, {'amount': 9.5, 'currency': 'EUR'}]
+
+
+def test_virtual_navigator_resolves_path_parameters(page) -> None:
+    seen = []
+
+    navigator = VirtualFletNavigator({'/': _blank, 'user/<id:int>': lambda ctx: seen.append(ctx.parameters)})
+
+    navigator.process(page)
+
+    navigator.navigate('user/7', page)
+
+    assert seen == [{'id': 7}]
+
+
+def test_resolve_route() -> None:
+    navigator = VirtualFletNavigator({'/': _blank, 'settings/profile': _blank, 'user/me': _blank, 'user/<id:int>': _blank, 'user/<name>': _blank})
+
+    assert navigator.resolve_route('settings/profile') == ('settings/profile', {})
+    assert navigator.resolve_route('user/me') == ('user/me', {})
+    assert navigator.resolve_route('user/12') == ('user/<id:int>', {'id': 12})
+    assert navigator.resolve_route('user/ann') == ('user/<name>', {'name': 'ann'})
+    assert navigator.resolve_route('user/12/posts') is None
+    assert navigator.resolve_route('missing') is None
+
+
+def test_segments_that_dont_convert_fall_through_to_404(page) -> None:
+    rendered = []
+
+    navigator = VirtualFletNavigator({'/': _blank, 'user/<id:int>': _blank, ROUTE_404: lambda ctx: (rendered.append(ctx), ctx.add(Text('404')))})
+
+    navigator.process(page)
+
+    navigator.navigate('user/abc', page)
+
+    assert len(rendered) == 1
+
+
+def test_invalid_routes_are_dropped() -> None:
+    navigator = VirtualFletNavigator({'/': _blank, 'valid/<id:int>': _blank, 'in valid': _blank, 'user/<id:unknown>': _blank})
+
+    assert set(navigator.routes) == {'/', 'valid/<id:int>'}
+
+
+def test_custom_path_converters() -> None:
+    @path_converter('upper')
+    def upper(segment: str) -> str:
+        if not segment.isalpha():
+            raise ValueError(segment)
+
+        return segment.upper()
+
+    navigator = VirtualFletNavigator({'/': _blank, 'code/<value:upper>': _blank})
+
+    assert navigator.resolve_route('code/abc') == ('code/<value:upper>', {'value': 'ABC'})
+    assert navigator.resolve_route('code/123') is None
@@ -0,0 +1,98 @@
+"""Memoized global templates."""
+
+from flet import Text
+
+from flet_navigator import VirtualFletNavigator, global_template, invalidate_template, template, template_cache_stats
+
+
+def _render_twice(page, arguments: object=1, between: object=None) -> list:
+    rendered = []
+
+    navigator = VirtualFletNavigator({'/': lambda ctx: rendered.append(template('card', ctx, arguments)), 'other': lambda ctx: None})
+
+    navigator.process(page)
+    navigator.navigate('other', page)
+
+    if between:
+        between()
+
+    navigator.navigate('/', page)
+
+    return rendered
+
+
+def _register(memoize: bool=True, **options) -> list:
+    calls = []
+
+    global_template('card', memoize=memoize, **options)(lambda ctx, arguments: calls.append(arguments) or Text(str(arguments)))
+
+    return calls
+
+
+def test_subtree_is_reused_across_navigations(page) -> None:
+    calls = _register()
+
+    first, second = _render_twice(page)
+
+    assert first is second
+    assert calls == [1]
+    assert template_cache_stats('card') == {'hits': 1, 'misses': 1}
+
+
+def test_templates_are_not_memoized_by_default(page) -> None:
+    calls = _register(memoize=False)
+
+    first, second = _render_twice(page)
+
+    assert first is not second
+    assert calls == [1, 1]
+
+
+def test_memo_is_per_session(page) -> None:
+    _register()
+
+    assert _render_twice(page)[0] is not _render_twice(page)[0]
+
+
+def test_invalidate_template_drops_memoized_renders(page) -> None:
+    calls = _register()
+
+    first, second = _render_twice(page, between=lambda: invalidate_template('card'))
+
+    assert first is not second
+    assert calls == [1, 1]
+
+
+def test_unhashable_arguments_are_never_cached(page) -> None:
+    calls = _register()
+
+    _render_twice(page, arguments=[1])
+
+    assert calls == [[1], [1]]
+
+
+def test_memo_limit_evicts_least_recently_used_renders(page) -> None:
+    _register(memo_limit=1)
+
+    orders, rendered = [(1, 2), (2, 1)], []
+
+    navigator = VirtualFletNavigator({'/': lambda ctx: rendered.append({arguments: template('card', ctx, arguments) for arguments in orders.pop(0)})})
+
+    navigator.process(page)
+    navigator.process(page)
+
+    # Only the render for `2` was kept, the one for `1` was evicted.
+    assert rendered[1][2] is rendered[0][2]
+    assert rendered[1][1] is not rendered[0][1]
+
+
+def test_repeated_calls_in_one_render_get_separate_subtrees(page) -> None:
+    _register()
+
+    navigator = VirtualFletNavigator({'/': lambda ctx: ctx.add(template('card', ctx, 1), template('card', ctx, 1))})
+
+    navigator.process(page)
+
+    first, second = page.controls
+
+    assert first is not second
@@ -0,0 +1,68 @@
+"""The single-pass URL parameter parser and its cache."""
+
+from flet_navigator import PublicFletNavigator, _fn_parse_route
+
+
+def test_values_are_typed() -> None:
+    assert _fn_parse_route('/feed?page=2&ratio=0.5&flag=True&missing=None&name=a+b') == (
+        'feed', (('page', 2), ('ratio', 0.5), ('flag', True), ('missing', None), ('name', 'a b'))
+    )
+
+
+def test_encoded_values_are_decoded() -> None:
+    assert _fn_parse_route('search?query=a%20b%2Fc') == ('search', (('query', 'a b/c'),))
+
+
+def test_fragment_is_ignored() -> None:
+    assert _fn_parse_route('feed?page=2#top') == ('feed', (('page', 2),))
+
+    assert _fn_parse_route('feed#top') == ('feed', ())
+
+
+def test_first_value_of_a_repeated_key_wins() -> None:
+    assert _fn_parse_route('feed?page=1&page=2') == ('feed', (('page', 1),))
+
+
+def test_invalid_pairs_drop_all_parameters() -> None:
+    assert _fn_parse_route('feed?page') == ('feed', ())
+
+    assert _fn_parse_route('feed?page=1&&tab=2') == ('feed', ())
+
+
+def test_query_without_a_route_has_no_parameters() -> None:
+    assert _fn_parse_route('?page=2') == ('', ())
+
+
+def test_base_route_is_returned_as_is() -> None:
+    assert _fn_parse_route('my%20page?name=a%20b') == ('my%20page', (('name', 'a b'),))
+
+    assert _fn_parse_route('my+page') == ('my+page', ())
+
+
+def test_invalid_keys_are_skipped() -> None:
+    assert _fn_parse_route('feed?page1=1&tab=2') == ('feed', (('tab', 2),))
+
+
+def test_results_are_memoized() -> None:
+    _fn_parse_route.cache_clear()
+
+    _fn_parse_route('feed?page=3')
+    _fn_parse_route('feed?page=3')
+
+    assert _fn_parse_route.cache_info().hits == 1
+
+
+def test_route_changes_are_parsed_for_the_page(page) -> None:
+    seen = []
+
+    navigator = PublicFletNavigator(page, {'/': lambda ctx: None, 'feed': lambda ctx: seen.append((ctx.current_route(), ctx.parameters))})
+
+    navigator.process(page)
+
+    page.go('/feed?page=2&tab=new')
+    page.go('/feed?page=2&tab=new')
+
+    assert seen == [('feed', {'page': 2, 'tab': 'new'})] * 2
+
+    # Every route change gets its own parameters, even when the parse is memoized.
+    assert seen[0][1] is not seen[1][1]